@@ -0,0 +1,82 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+from logger.action_timings import percentile
+
+
+class BenchmarkCase:
+    """One timed operation; ``setup`` brings the browser to the starting state and is not timed"""
+
+    def __init__(self, name: str, run: Callable[[], Any], setup: Optional[Callable[[], Any]] = None, group: str = 'micro') -> None:
+        self.name: str = name
+        self.run: Callable[[], Any] = run
+        self.setup: Optional[Callable[[], Any]] = setup
+        self.group: str = group
+
+
+class BenchmarkRunner:
+    """Runs benchmark cases with warmup rounds and reports mean/stddev/percentiles in seconds"""
+
+    def __init__(self, warmup: int = 2, repeat: int = 10) -> None:
+        self.warmup: int = warmup
+        self.repeat: int = repeat
+
+    def run_case(self, case: BenchmarkCase) -> Dict[str, Any]:
+        durations: List[float] = []
+
+        for iteration in range(self.warmup + self.repeat):
+            if case.setup:
+                case.setup()
+
+            start: float = time.perf_counter()
+            case.run()
+            duration: float = time.perf_counter() - start
+
+            if iteration >= self.warmup:
+                durations.append(duration)
+
+        ordered: List[float] = sorted(durations)
+
+        return {
+            'name': case.name,
+            'group': case.group,
+            'repeat': len(ordered),
+            'mean': statistics.fmean(ordered),
+            'stddev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            'min': ordered[0],
+            'p50': statistics.median(ordered),
+            'p95': percentile(ordered, 95),
+            'max': ordered[-1],
+        }
+
+    def run(self, cases: List[BenchmarkCase], on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+
+        for case in cases:
+            result: Dict[str, Any] = self.run_case(case)
+            results.append(result)
+
+            if on_result:
+                on_result(result)
+
+        return results
+
+
+def save_results(path: Path, results: List[Dict[str, Any]], metadata: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({'metadata': {**metadata, **_environment()}, 'results': results}, indent=2), encoding='utf-8')
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit: str = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        commit = 'unknown'
+
+    return {'commit': commit, 'python': platform.python_version(), 'platform': platform.platform(), 'timestamp': time.time()}
@@ -0,0 +1,36 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Any
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    return {result['name']: result for result in json.loads(path.read_text(encoding='utf-8'))['results']}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Compare two page-object benchmark result files side by side")
+    arg_parser.add_argument('baseline', type=Path)
+    arg_parser.add_argument('candidate', type=Path)
+    arg_parser.add_argument('--stat', default='p50', choices=['mean', 'p50', 'p95', 'max'])
+    args = arg_parser.parse_args()
+
+    baseline: Dict[str, Dict[str, Any]] = load_results(args.baseline)
+    candidate: Dict[str, Dict[str, Any]] = load_results(args.candidate)
+
+    print(f"{'benchmark':<28}{'baseline':>12}{'candidate':>12}{'change':>10}")
+
+    for name in list(baseline) + [name for name in candidate if name not in baseline]:
+        before = baseline.get(name, {}).get(args.stat)
+        after = candidate.get(name, {}).get(args.stat)
+
+        if before is None or after is None:
+            print(f"{name:<28}{'-' if before is None else f'{before * 1000:.1f}ms':>12}{'-' if after is None else f'{after * 1000:.1f}ms':>12}{'':>10}")
+            continue
+
+        change: float = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<28}{before * 1000:>10.1f}ms{after * 1000:>10.1f}ms{change:>+9.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,409 @@
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Iterator
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks.benchmark_runner import save_results
+from logger.action_timings import percentile
+from logger.logger import CustomLogger
+from pages.element_wait import WaitMode
+from pages.inventory.inventory_page import SortOption
+from pages.login.login_page import LoginPage
+from pages.main_page.main_page import MainPage
+from utils.driver.driver_factory import DriverFactory
+from utils.driver.launch_profiles import LAUNCH_PROFILES
+from utils.local_app.local_app_server import LocalAppServer
+
+
+USERNAME, PASSWORD = 'standard_user', 'secret_sauce'
+SCENARIOS = ['checkout', 'browse', 'abandon_cart']
+DEFAULT_MIX = 'checkout=3,browse=1,abandon_cart=1'
+
+
+def parse_mix(mix: str, scenarios: List[str]) -> Dict[str, int]:
+    """Parse a ``name=weight,...`` scenario mix into positive integer weights"""
+    weights: Dict[str, int] = {}
+
+    for entry in mix.split(','):
+        name, _, weight = entry.partition('=')
+        name, weight = name.strip(), weight.strip() or '1'
+
+        if name not in scenarios:
+            raise ValueError(f"Unsupported scenario: {name}, available scenarios are {', '.join(scenarios)}")
+
+        if not weight.isdigit() or int(weight) < 1:
+            raise ValueError(f"Invalid weight of the scenario {name}: {weight}, should be a positive integer")
+
+        weights[name] = int(weight)
+
+    return weights
+
+
+class ShopperStats:
+    """Step latencies, step errors and scenario outcomes of one virtual shopper, merged when the run ends"""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.scenarios: Dict[str, List[int]] = {}
+        self.orders: int = 0
+        self.last_errors: List[str] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time one scenario step, a failed step counts as an error and ends the iteration"""
+        start: float = time.perf_counter()
+
+        try:
+            yield
+
+        except Exception as e:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            self.last_errors = (self.last_errors + [f"{name}: {str(e).splitlines()[0] if str(e) else type(e).__name__}"])[-5:]
+
+            raise
+
+        self.latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+    def scenario_done(self, name: str, failed: bool) -> None:
+        runs, failures = self.scenarios.get(name, [0, 0])
+        self.scenarios[name] = [runs + 1, failures + int(failed)]
+
+    def merge(self, other: 'ShopperStats') -> None:
+        for name, latencies in other.latencies.items():
+            self.latencies.setdefault(name, []).extend(latencies)
+
+        for name, errors in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + errors
+
+        for name, (runs, failures) in other.scenarios.items():
+            self.scenarios[name] = [self.scenarios.get(name, [0, 0])[0] + runs, self.scenarios.get(name, [0, 0])[1] + failures]
+
+        self.orders += other.orders
+        self.last_errors = (self.last_errors + other.last_errors)[-10:]
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        steps: List[Dict[str, Any]] = []
+
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            ordered: List[float] = sorted(self.latencies.get(name, []))
+            errors: int = self.errors.get(name, 0)
+            attempts: int = len(ordered) + errors
+
+            steps.append({
+                'name': name,
+                'count': len(ordered),
+                'errors': errors,
+                'error_rate': errors / attempts if attempts else 0.0,
+                'mean': sum(ordered) / len(ordered) if ordered else None,
+                'p50': percentile(ordered, 50) if ordered else None,
+                'p95': percentile(ordered, 95) if ordered else None,
+                'p99': percentile(ordered, 99) if ordered else None,
+                'max': ordered[-1] if ordered else None,
+            })
+
+        return {
+            'elapsed': elapsed,
+            'orders': self.orders,
+            'orders_per_minute': self.orders / elapsed * 60 if elapsed else 0.0,
+            'scenarios': {
+                name: {'runs': runs, 'failures': failures, 'error_rate': failures / runs if runs else 0.0}
+                for name, (runs, failures) in sorted(self.scenarios.items())
+            },
+            'steps': steps,
+            'last_errors': self.last_errors,
+        }
+
+
+class VirtualShopper:
+    """One browser session walking weighted random shopping scenarios with the page objects.
+
+    Every iteration starts from a cleared app state, a failed step ends the iteration and the shopper
+    moves on to the next one, so a flaky page counts as an error instead of stopping the load.
+    """
+
+    def __init__(self, index: int, driver: WebDriver, base_url: str, timeout: int, wait_mode: WaitMode, cart_count: int, weights: Dict[str, int], seed: int) -> None:
+        self.index: int = index
+        self.driver: WebDriver = driver
+        self.cart_count: int = cart_count
+        self.weights: Dict[str, int] = weights
+        self.random: random.Random = random.Random(seed + index)
+        self.stats: ShopperStats = ShopperStats()
+
+        self.logger: CustomLogger = CustomLogger(name=f'Shopper-{index}')
+        self.login_page: LoginPage = LoginPage(driver=driver, logger=self.logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.main_page: MainPage = MainPage(driver=driver, logger=self.logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+
+    def scenarios(self) -> Dict[str, Callable[[], None]]:
+        return {
+            'checkout': self._checkout,
+            'browse': self._browse,
+            'abandon_cart': self._abandon_cart,
+        }
+
+    def run(self, deadline: Optional[float], iterations: Optional[int], start_delay: float) -> ShopperStats:
+        time.sleep(start_delay)
+
+        scenarios: Dict[str, Callable[[], None]] = self.scenarios()
+        names: List[str] = list(self.weights)
+        completed: int = 0
+
+        while (iterations is None or completed < iterations) and (deadline is None or time.monotonic() < deadline):
+            name: str = self.random.choices(names, weights=[self.weights[name] for name in names])[0]
+
+            try:
+                with self.stats.step('reset'):
+                    self.main_page.clear_app_state()
+
+                scenarios[name]()
+                self.stats.scenario_done(name=name, failed=False)
+
+            except Exception:
+                self.stats.scenario_done(name=name, failed=True)
+
+            completed += 1
+
+        return self.stats
+
+    def _login_with_form(self) -> None:
+        with self.stats.step('login'):
+            self.login_page.login(username=USERNAME, password=PASSWORD)
+            assert self.main_page.is_user_logged_in(), "Form login failed"
+
+    def _login_fast(self) -> None:
+        with self.stats.step('login_fast'):
+            self.login_page.login_fast(username=USERNAME)
+            assert self.main_page.is_user_logged_in(), "Fast login failed"
+
+    def _add_products_to_cart(self) -> None:
+        with self.stats.step('add_to_cart'):
+            products = self.main_page.inventory_page.get_all_products()
+
+            for product in self.random.sample(products, k=min(self.cart_count, len(products))):
+                product.add_product_to_cart()
+
+        with self.stats.step('open_cart'):
+            self.main_page.click_cart_button()
+            assert self.main_page.cart_page.get_all_cart_items(), "The cart is empty after adding products"
+
+    def _checkout(self) -> None:
+        self._login_with_form()
+        self._add_products_to_cart()
+
+        with self.stats.step('checkout_information'):
+            self.main_page.cart_page.click_checkout_button()
+            self.main_page.checkout_information_page.make_checkout(first_name='Nour', last_name='Ali', postal_code='K1A')
+            assert self.main_page.checkout_overview_page.is_checkout_information_page_opened(), "Checkout information was not submitted"
+
+        with self.stats.step('finish_order'):
+            self.main_page.checkout_overview_page.click_finish_button()
+            assert self.main_page.checkout_complete_page.is_the_checkout_completed(), "Checkout was not completed"
+
+        self.stats.orders += 1
+
+    def _browse(self) -> None:
+        self._login_fast()
+
+        with self.stats.step('sort_catalog'):
+            self.main_page.inventory_page.choice_product_selector_option(sort_option=self.random.choice(list(SortOption)))
+            assert self.main_page.inventory_page.get_all_products(), "The catalog is empty"
+
+    def _abandon_cart(self) -> None:
+        self._login_fast()
+        self._add_products_to_cart()
+
+        with self.stats.step('remove_from_cart'):
+            for cart_item in self.main_page.cart_page.get_all_cart_items():
+                cart_item.remove_product_from_cart()
+
+
+class LoadGenerator:
+    """Runs N virtual shoppers in parallel threads, each with its own browser, for a duration or an iteration count.
+
+    The browsers are launched before the clock starts, so the launch cost is not part of the measured
+    throughput, and shoppers start ``ramp_up`` seconds apart in total so they do not move in lock step.
+    """
+
+    def __init__(self, create_driver: Callable[[], WebDriver], shoppers: int, duration: Optional[float], iterations: Optional[int], ramp_up: float = 0) -> None:
+        if shoppers < 1:
+            raise ValueError(f"Invalid shoppers count: {shoppers}, should be greater than 0")
+
+        if duration is None and iterations is None:
+            raise ValueError("Either a duration or an iterations count is required")
+
+        self.create_driver: Callable[[], WebDriver] = create_driver
+        self.shoppers: int = shoppers
+        self.duration: Optional[float] = duration
+        self.iterations: Optional[int] = iterations
+        self.ramp_up: float = ramp_up
+
+    def run(self, make_shopper: Callable[[int, WebDriver], VirtualShopper]) -> Dict[str, Any]:
+        drivers: List[WebDriver] = []
+
+        try:
+            launch_error: Optional[Exception] = None
+
+            with ThreadPoolExecutor(max_workers=self.shoppers, thread_name_prefix='shopper-launch') as executor:
+                for future in [executor.submit(self.create_driver) for _ in range(self.shoppers)]:
+                    try:
+                        drivers.append(future.result())
+
+                    except Exception as e:
+                        # Keep collecting, the browsers that did start are quit below
+                        launch_error = launch_error or e
+
+            if launch_error:
+                raise RuntimeError(f"Failed to start {self.shoppers - len(drivers)} of {self.shoppers} shopper browsers") from launch_error
+
+            shoppers: List[VirtualShopper] = [make_shopper(index, driver) for index, driver in enumerate(drivers)]
+            results: List[Optional[ShopperStats]] = [None] * len(shoppers)
+
+            start: float = time.monotonic()
+            deadline: Optional[float] = start + self.duration if self.duration is not None else None
+
+            def run_shopper(index: int) -> None:
+                results[index] = shoppers[index].run(deadline=deadline, iterations=self.iterations, start_delay=self.ramp_up * index / self.shoppers)
+
+            threads: List[threading.Thread] = [threading.Thread(target=run_shopper, args=(index,), name=f'shopper-{index}') for index in range(len(shoppers))]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            elapsed: float = time.monotonic() - start
+
+        finally:
+            with ThreadPoolExecutor(max_workers=self.shoppers, thread_name_prefix='shopper-quit') as executor:
+                executor.map(self._quit_quietly, drivers)
+
+        total: ShopperStats = ShopperStats()
+
+        for stats in results:
+            if stats is not None:
+                total.merge(stats)
+
+        return {**total.summary(elapsed=elapsed), 'shoppers': self.shoppers}
+
+    @staticmethod
+    def _quit_quietly(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+
+        except Exception:
+            pass
+
+
+def to_benchmark_results(report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One named result per step (``load/<step>``), the format benchmarks.compare diffs between two runs"""
+    return [
+        {**{key: value for key, value in step.items() if key != 'name'}, 'name': f"load/{step['name']}", 'group': 'load', 'repeat': step['count']}
+        for step in report['steps']
+    ]
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['shoppers']} shoppers, {report['elapsed']:.1f}s, {report['orders']} orders, {report['orders_per_minute']:.1f} orders/minute")
+    print(f"{'scenario':<24}{'runs':>8}{'failures':>10}{'error rate':>12}")
+
+    for name, scenario in report['scenarios'].items():
+        print(f"{name:<24}{scenario['runs']:>8}{scenario['failures']:>10}{scenario['error_rate']:>11.1%}")
+
+    print(f"{'step':<24}{'count':>8}{'errors':>8}{'error rate':>12}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+
+    for step in report['steps']:
+        latencies: str = ''.join('-'.rjust(10) if step[key] is None else f"{step[key] * 1000:>8.0f}ms" for key in ('p50', 'p95', 'p99', 'max'))
+        print(f"{step['name']:<24}{step['count']:>8}{step['errors']:>8}{step['error_rate']:>11.1%}{latencies}")
+
+    for error in report['last_errors']:
+        print(f"  last error - {error}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Drive N virtual shoppers through the SauceDemo stand-in app with the page objects")
+    arg_parser.add_argument('--shoppers', type=int, default=4, help="Concurrent browser sessions")
+    arg_parser.add_argument('--duration', type=float, default=None, help="Run for this many seconds")
+    arg_parser.add_argument('--iterations', type=int, default=None, help="Scenarios per shopper, when no duration is given")
+    arg_parser.add_argument('--mix', default=DEFAULT_MIX, help=f"Weighted scenario mix out of {', '.join(SCENARIOS)}, default {DEFAULT_MIX}")
+    arg_parser.add_argument('--ramp-up', type=float, default=0, help="Seconds over which the shoppers start")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--base-url', default='local', help="Application under load, local starts the bundled stand-in app")
+    arg_parser.add_argument('--browser', default='chrome', choices=['chrome', 'edge', 'firefox'])
+    arg_parser.add_argument('--headless', action='store_true')
+    arg_parser.add_argument('--driver-path', default=None)
+    arg_parser.add_argument('--browser-profile', default='lean', choices=list(LAUNCH_PROFILES))
+    arg_parser.add_argument('--timeout', type=int, default=10)
+    arg_parser.add_argument('--wait-mode', default='observer', choices=[mode.value for mode in WaitMode])
+    arg_parser.add_argument('--cart-count', type=int, default=3)
+    arg_parser.add_argument('--output', type=Path, default=Path('reports/load/results.json'))
+    args = arg_parser.parse_args()
+
+    weights: Dict[str, int] = parse_mix(mix=args.mix, scenarios=SCENARIOS)
+    iterations: Optional[int] = args.iterations if args.duration is None else None
+
+    if args.duration is None and iterations is None:
+        iterations = 5
+
+    factory = DriverFactory(
+        browser_name=args.browser,
+        headless=args.headless,
+        driver_path=args.driver_path,
+        profile=LAUNCH_PROFILES[args.browser_profile]
+    )
+    generator = LoadGenerator(create_driver=factory.create, shoppers=args.shoppers, duration=args.duration, iterations=iterations, ramp_up=args.ramp_up)
+
+    server: Optional[LocalAppServer] = LocalAppServer().start() if args.base_url == 'local' else None
+
+    try:
+        if server:
+            base_url: str = server.url
+
+        else:
+            # urljoin drops the last path segment of a base URL without the trailing slash
+            base_url = args.base_url if args.base_url.endswith('/') else f'{args.base_url}/'
+
+        report: Dict[str, Any] = generator.run(make_shopper=lambda index, driver: VirtualShopper(
+            index=index,
+            driver=driver,
+            base_url=base_url,
+            timeout=args.timeout,
+            wait_mode=WaitMode(args.wait_mode),
+            cart_count=args.cart_count,
+            weights=weights,
+            seed=args.seed
+        ))
+
+    finally:
+        if server:
+            server.stop()
+
+    print_report(report)
+
+    save_results(path=args.output, results=to_benchmark_results(report), metadata={
+        'shoppers': report['shoppers'],
+        'elapsed': report['elapsed'],
+        'orders': report['orders'],
+        'orders_per_minute': report['orders_per_minute'],
+        'scenarios': report['scenarios'],
+        'last_errors': report['last_errors'],
+        'browser': args.browser,
+        'headless': args.headless,
+        'browser_profile': args.browser_profile,
+        'wait_mode': args.wait_mode,
+        'mix': weights,
+        'duration': args.duration,
+        'iterations': iterations,
+        'base_url': args.base_url,
+    })
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import argparse
+import logging
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks.benchmark_runner import BenchmarkCase, BenchmarkRunner, save_results
+from logger.logger import CustomLogger
+from pages.element_wait import WaitMode
+from pages.login.login_page import LoginPage
+from pages.main_page.main_page import MainPage
+from utils.driver.driver_factory import DriverFactory
+from utils.driver.launch_profiles import LAUNCH_PROFILES
+from utils.local_app.local_app_server import LocalAppServer
+
+
+USERNAME, PASSWORD = 'standard_user', 'secret_sauce'
+CART_PRODUCT_IDS = '[4,0,1]'
+
+
+class PageObjectBenchmarks:
+    """Page-object operations and full flows timed against the local SauceDemo stand-in app"""
+
+    def __init__(self, driver: WebDriver, base_url: str, logger: CustomLogger, timeout: int, wait_mode: WaitMode, cart_count: int) -> None:
+        self.driver: WebDriver = driver
+        self.base_url: str = base_url
+        self.logger: CustomLogger = logger
+        self.cart_count: int = cart_count
+
+        self.login_page: LoginPage = LoginPage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.main_page: MainPage = MainPage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+
+    def cases(self) -> List[BenchmarkCase]:
+        return [
+            BenchmarkCase(name='logger_debug_x1000', run=self._log_debug_lines),
+            BenchmarkCase(name='login_form', setup=self._open_login_page, run=self._login_with_form),
+            BenchmarkCase(name='login_fast', setup=self._clear_session, run=self._login_fast),
+            BenchmarkCase(name='catalog_scrape', setup=self._open_inventory, run=self.main_page.inventory_page.get_all_products),
+            BenchmarkCase(name=f'add_{self.cart_count}_to_cart', setup=self._open_inventory, run=self._add_products_to_cart),
+            BenchmarkCase(name='cart_scrape', setup=lambda: self._open_with_cart('cart.html'), run=self.main_page.cart_page.get_all_cart_items),
+            BenchmarkCase(name='checkout_form_fill', setup=lambda: self._open_with_cart('checkout-step-one.html'), run=self._fill_checkout_form),
+            BenchmarkCase(name='summary_price_reads', setup=lambda: self._open_with_cart('checkout-step-two.html'), run=self._read_summary_prices),
+            BenchmarkCase(name='flow_full_checkout', setup=self._clear_session, run=self._full_checkout_flow, group='macro'),
+        ]
+
+    def _log_debug_lines(self) -> None:
+        for index in range(1000):
+            self.logger.debug(msg=f"Benchmark debug line {index}")
+
+    def _clear_session(self) -> None:
+        self.driver.get(self.base_url)
+        self.driver.delete_all_cookies()
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    def _open_login_page(self) -> None:
+        self._clear_session()
+        self.login_page.load()
+
+    def _open_inventory(self) -> None:
+        self._clear_session()
+        self.login_page.login_fast(username=USERNAME)
+
+    def _open_with_cart(self, path: str) -> None:
+        self._open_inventory()
+        self.driver.execute_script("window.localStorage.setItem('cart-contents', arguments[0]);", CART_PRODUCT_IDS)
+        self.driver.get(self.login_page.url_for(path))
+
+    def _login_with_form(self) -> None:
+        self.login_page.login(username=USERNAME, password=PASSWORD)
+        assert self.main_page.is_user_logged_in(), "Form login failed"
+
+    def _login_fast(self) -> None:
+        self.login_page.login_fast(username=USERNAME)
+        assert self.main_page.is_user_logged_in(), "Fast login failed"
+
+    def _add_products_to_cart(self) -> None:
+        for product in self.main_page.inventory_page.get_all_products()[:self.cart_count]:
+            product.add_product_to_cart()
+
+    def _fill_checkout_form(self) -> None:
+        self.main_page.checkout_information_page.make_checkout(first_name='Nour', last_name='Ali', postal_code='K1A')
+        assert self.main_page.checkout_overview_page.is_checkout_information_page_opened(), "Checkout information was not submitted"
+
+    def _read_summary_prices(self) -> None:
+        self.main_page.checkout_overview_page.get_subtotal_price()
+        self.main_page.checkout_overview_page.get_tax_amount()
+        self.main_page.checkout_overview_page.get_total_price_with_tax()
+
+    def _full_checkout_flow(self) -> None:
+        self._login_fast()
+        self._add_products_to_cart()
+        self.main_page.click_cart_button()
+        self.main_page.cart_page.click_checkout_button()
+        self._fill_checkout_form()
+        self.main_page.checkout_overview_page.click_finish_button()
+        assert self.main_page.checkout_complete_page.is_the_checkout_completed(), "Checkout was not completed"
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Benchmark the page objects against the local SauceDemo stand-in app")
+    arg_parser.add_argument('--browser', default='chrome', choices=['chrome', 'edge', 'firefox'])
+    arg_parser.add_argument('--headless', action='store_true')
+    arg_parser.add_argument('--driver-path', default=None)
+    arg_parser.add_argument('--browser-profile', default='default', choices=list(LAUNCH_PROFILES))
+    arg_parser.add_argument('--timeout', type=int, default=10)
+    arg_parser.add_argument('--wait-mode', default='observer', choices=[mode.value for mode in WaitMode])
+    arg_parser.add_argument('--warmup', type=int, default=2)
+    arg_parser.add_argument('--repeat', type=int, default=10)
+    arg_parser.add_argument('--cart-count', type=int, default=3)
+    arg_parser.add_argument('--filter', default=None, help="Run only the cases whose name contains this text")
+    arg_parser.add_argument('--with-logs', action='store_true', help="Attach the CustomLogger handlers, so the logging cost is included")
+    arg_parser.add_argument('--output', type=Path, default=Path('reports/benchmarks/results.json'))
+    args = arg_parser.parse_args()
+
+    logger = CustomLogger(name='Benchmarks')
+
+    if args.with_logs:
+        logger.setup_handlers(report_path=tempfile.mkdtemp(prefix='benchmark-logs-'), level=logging.ERROR)
+
+    driver: WebDriver = DriverFactory(
+        browser_name=args.browser,
+        headless=args.headless,
+        driver_path=args.driver_path,
+        profile=LAUNCH_PROFILES[args.browser_profile]
+    ).create()
+
+    try:
+        with LocalAppServer() as server:
+            benchmarks = PageObjectBenchmarks(
+                driver=driver,
+                base_url=server.url,
+                logger=logger,
+                timeout=args.timeout,
+                wait_mode=WaitMode(args.wait_mode),
+                cart_count=args.cart_count
+            )
+            cases: List[BenchmarkCase] = [case for case in benchmarks.cases() if not args.filter or args.filter in case.name]
+
+            print(f"{'benchmark':<28}{'mean':>10}{'stddev':>10}{'p50':>10}{'p95':>10}{'max':>10}")
+
+            def print_result(result: Dict[str, Any]) -> None:
+                print(f"{result['name']:<28}" + ''.join(f"{result[key] * 1000:>8.1f}ms" for key in ('mean', 'stddev', 'p50', 'p95', 'max')))
+
+            results: List[Dict[str, Any]] = BenchmarkRunner(warmup=args.warmup, repeat=args.repeat).run(cases=cases, on_result=print_result)
+
+    finally:
+        driver.quit()
+
+    save_results(path=args.output, results=results, metadata={
+        'browser': args.browser,
+        'headless': args.headless,
+        'browser_profile': args.browser_profile,
+        'wait_mode': args.wait_mode,
+        'with_logs': args.with_logs,
+        'warmup': args.warmup,
+    })
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,60 +1,296 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from webdriver_manager.firefox import GeckoDriverManager as FirefoxDriverManager
+
+from logger.logger import CustomLogger
+from pages.login.login_page import LoginPage
+from pages.login.storage_state import StorageState, StorageStateCache
+from pages.main_page.main_page import MainPage
+from utils.artifacts.failure_artifacts import FailureArtifactWriter
+from utils.driver.driver_factory import DriverFactory, SUPPORTED_BROWSERS
+from utils.driver.driver_pool import DriverPools, HostSlots
+from utils.driver.driver_resolver import DriverResolver
+from utils.driver.launch_profiles import LAUNCH_PROFILES, get_launch_profile
+from utils.local_app.local_app_server import LocalAppServer
+from utils.datasets.dataset_parametrize import DatasetIndex
+from utils.scheduling.duration_scheduler import DurationRecorder, DurationScheduler, DurationStore, parse_shard
+from utils.scheduling.impact_analysis import ChangeSet, DependencyMap, DependencyRecorder, ImpactSelector, ImportGraph
 
 
 def pytest_addoption(parser):
-    parser.addoption("--browser", action="store", default="chrome", help="Browser driver type, valid values: chrome(default), edge, firefox")
+    parser.addoption("--browser", action="store", default="chrome", help="Browser driver type, valid values: chrome(default), edge, firefox, or a comma separated matrix such as chrome,firefox,edge")
     parser.addoption("--timeout", action="store", default="10", help="Waiting driver timeout in seconds, default 10 seconds")
     parser.addoption("--console-log-level", action="store", default="info", help="Console log level, valid values: debug, info, warning, error")
     parser.addoption("--headless", action="store_true", default=False, help="Run tests in headless mode (no browser window), default False")
+    parser.addoption("--browser-profile", action="store", default="default", help=f"Browser launch profile, valid values: {', '.join(LAUNCH_PROFILES)}. default (maximized, full page loads), lean (eager page loads, blocked images/fonts/analytics, fixed window size)")
+    parser.addoption("--wait-mode", action="store", default="observer", help="Element wait engine, valid values: observer(default, MutationObserver async script), poll (one script per poll), webdriver (classic expected conditions)")
+    parser.addoption("--log-queue", action="store_true", default=False, help="Write the custom logs from a background thread in batches instead of on the test thread, default False")
+    parser.addoption("--max-browsers", action="store", default=str(os.cpu_count() or 1), help="Maximum number of browsers running at the same time on this host (shared by all xdist workers), default number of CPUs")
+    parser.addoption("--driver-path", action="store", default=None, help="Path of the browser driver binary, skips driver resolution entirely")
+    parser.addoption("--base-url", action="store", default="https://www.saucedemo.com/", help="Base URL of the application under test, 'local' starts the bundled SauceDemo stand-in app on a free port")
+    parser.addoption("--prewarm-browsers", action="store", default="1", help="Browser sessions per browser type of the selected tests launched in the background once the collection finished (on the first lease of the type for xdist matrix workers), handed to the first tests, 0 disables, default 1")
+    parser.addoption("--driver-offline", action="store_true", default=False, help="Use the cached driver manifest only and never probe the browser version or the network, default False")
+    parser.addoption("--artifacts-max-mb", action="store", default="200", help="Disk budget in MB of the failure artifacts (screenshot, page source, console) of a run, 0 disables the capture, default 200")
+    parser.addoption("--shard", action="store", default=None, help="Run only the shard i/n of the tests (such as 2/3), split into shards of roughly equal recorded duration")
+    parser.addoption("--affected-since", action="store", default=None, help="Run only the tests affected by the changes since this git ref (working tree included), selected from the dependency map")
+    parser.addoption("--record-dependencies", action="store_true", default=False, help="Record the functions every test executes into the dependency map (always on with --affected-since), default False")
+    parser.addoption("--dependency-map", action="store", default=".test-dependencies.json", help="File of the per-test dependency map used by --affected-since, default .test-dependencies.json")
+    parser.addoption("--dataset-sample", action="store", default="0", help="Run a reproducible random sample of this many rows of every dataset-driven test, default 0 (all rows)")
+    parser.addoption("--durations-file", action="store", default=".test-durations.json", help="File of the per-test durations recorded across runs for the longest-first ordering and the sharding, default .test-durations.json")
 
 
 @pytest.fixture(scope="session")
-def browser(request):
-    browser_name = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
+def base_url(request):
+    base_url: str = request.config.getoption("--base-url")
+
+    if base_url != "local":
+        yield base_url if base_url.endswith("/") else f"{base_url}/"
+        return
+
+    with LocalAppServer() as server:
+        yield server.url
+
+
+def get_browser_names(config) -> List[str]:
+    """Parse the --browser option, a single browser or a comma separated browser matrix"""
+    browser_option: str = config.getoption("--browser")
+    browser_names: List[str] = [name.strip().lower() for name in browser_option.split(",") if name.strip()]
+
+    if not browser_names:
+        raise ValueError(f"Invalid browser option: {browser_option}, available browsers are {', '.join(SUPPORTED_BROWSERS)}")
+
+    for browser_name in browser_names:
+        if browser_name not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser_name}, available browsers are {', '.join(SUPPORTED_BROWSERS)}")
+
+    if len(set(browser_names)) != len(browser_names):
+        raise ValueError(f"Duplicate browser in the browser matrix: {browser_option}")
+
+    if len(browser_names) > 1 and config.getoption("--driver-path"):
+        raise ValueError("--driver-path points to a single driver binary and cannot be used with a browser matrix")
+
+    return browser_names
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "xdist_group(name): run the tests of a group on the same pytest-xdist worker")
+    config.addinivalue_line("markers", "dataset(path, argname, converters, start, stop, sample, seed, id_column): one test per row of a JSONL/CSV dataset")
+
+    dataset_sample: str = config.getoption("--dataset-sample")
+
+    if not dataset_sample.isdigit():
+        raise ValueError(f"Invalid dataset sample format: {dataset_sample}, should be integer")
+
+    config.dataset_index = DatasetIndex(root_dir=config.rootpath, cache=getattr(config, "cache", None))
+
+    max_artifacts_mb: str = config.getoption("--artifacts-max-mb")
+
+    if not max_artifacts_mb.isdigit():
+        raise ValueError(f"Invalid artifacts max MB format: {max_artifacts_mb}, should be integer")
+
+    config.failure_artifacts = FailureArtifactWriter(max_total_bytes=int(max_artifacts_mb) * 1024 * 1024) if int(max_artifacts_mb) else None
+
+    config.driver_pools = None
+    prewarm_browsers: str = config.getoption("--prewarm-browsers")
+
+    if not prewarm_browsers.isdigit():
+        raise ValueError(f"Invalid prewarm browsers format: {prewarm_browsers}, should be integer")
+
+    config.duration_store = DurationStore(path=Path(config.getoption("--durations-file")))
+
+    # Under xdist the worker reports are replayed on the controller, which keeps the only copy of the durations
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(store=config.duration_store), "duration-recorder")
 
-    if browser_name == "chrome":
-        options = ChromeOptions()
+    config.dependency_map = DependencyMap(path=Path(config.getoption("--dependency-map")))
 
-        if headless:
-            options.add_argument("--headless")
+    # Every worker profiles its own tests, only the controller merges the results into the map
+    if config.getoption("--record-dependencies") or config.getoption("--affected-since"):
+        dependency_map = None if hasattr(config, "workerinput") else config.dependency_map
+        config.pluginmanager.register(DependencyRecorder(root_dir=config.rootpath, dependency_map=dependency_map), "dependency-recorder")
 
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
 
-    elif browser_name == "edge":
-        options = EdgeOptions()
+def pytest_generate_tests(metafunc):
+    for marker in metafunc.definition.iter_markers("dataset"):
+        metafunc.config.dataset_index.parametrize(metafunc=metafunc, marker=marker, sample_override=int(metafunc.config.getoption("--dataset-sample")))
 
-        if headless:
-            options.add_argument("--headless")
+    browser_names: List[str] = get_browser_names(metafunc.config)
 
-        driver = webdriver.Edge(service=EdgeService(EdgeChromiumDriverManager().install()), options=options)
+    # A matrix run parametrizes every browser test once per browser, shadowing the browser_name fixture.
+    # The group marker is attached here, xdist reads it in its own collection hook before the conftest one
+    if len(browser_names) > 1 and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "browser_name",
+            [pytest.param(name, marks=pytest.mark.xdist_group(name=name)) for name in browser_names],
+            ids=browser_names,
+            scope="session"
+        )
 
-    elif browser_name == "firefox":
-        options = FirefoxOptions()
 
-        if headless:
-            options.add_argument("--headless")
+def pytest_unconfigure(config):
+    if getattr(config, "failure_artifacts", None):
+        config.failure_artifacts.close()
 
-        driver = webdriver.Firefox(service=FirefoxService(FirefoxDriverManager().install()), options=options)
+    if getattr(config, "driver_pools", None):
+        config.driver_pools.close()
+
+
+def pytest_collection_modifyitems(config, items):
+    affected_since: str = config.getoption("--affected-since")
+
+    if affected_since:
+        change_set = ChangeSet.since(
+            git_ref=affected_since,
+            root_dir=config.rootpath,
+            ignored_names=(config.dependency_map.path.name, config.duration_store.path.name)
+        )
+        selector = ImpactSelector(change_set=change_set, dependency_map=config.dependency_map, import_graph=ImportGraph(root_dir=config.rootpath))
+        affected = [item for item in items if selector.is_affected(item.nodeid)]
+        affected_ids = {item.nodeid for item in affected}
+
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in affected_ids])
+        items[:] = affected
+
+    scheduler = DurationScheduler(store=config.duration_store)
+    shard: str = config.getoption("--shard")
+
+    if shard:
+        index, count = parse_shard(shard)
+        selected = scheduler.shard(items, index=index, count=count)
+        selected_ids = {item.nodeid for item in selected}
+
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected_ids])
+        items[:] = selected
+
+    else:
+        items[:] = scheduler.order(items)
+
+    if len(get_browser_names(config)) == 1:
+        return
+
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        browser_name = callspec.params.get("browser_name") if callspec else None
+
+        if browser_name:
+            # Reported back to the controller for the per-browser summary
+            item.user_properties.append(("browser", browser_name))
+
+
+def pytest_collection_finish(session):
+    config = session.config
+    prewarm_browsers: int = int(config.getoption("--prewarm-browsers"))
+
+    # The xdist controller runs no test, its workers pre-warm their own browsers
+    is_xdist_controller: bool = getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+
+    if not prewarm_browsers or not session.items or config.option.collectonly or is_xdist_controller:
+        return
+
+    default_browser: str = get_browser_names(config)[0]
+    browser_names: List[str] = sorted({
+        item.callspec.params.get("browser_name", default_browser) if hasattr(item, "callspec") else default_browser
+        for item in session.items
+        if "browser" in getattr(item, "fixturenames", ())
+    })
+
+    if not browser_names:
+        return
+
+    config.driver_pools = create_driver_pools(config)
+
+    if hasattr(config, "workerinput") and len(browser_names) > 1:
+        # The controller hands the browser groups out later, a worker only launches the browsers it gets
+        config.driver_pools.prewarm_on_first_lease(prewarm_browsers)
 
     else:
-        raise ValueError(f"Unsupported browser: {browser_name}, available browsers are chrome, edge, and firefox")
+        config.driver_pools.prewarm(prewarm_browsers, browser_names=browser_names)
 
-    driver.maximize_window()
+
+@pytest.fixture(scope="session")
+def browser_name(request) -> str:
+    return get_browser_names(request.config)[0]
+
+
+def create_driver_pools(config) -> DriverPools:
+    max_browsers: str = config.getoption("--max-browsers")
+
+    if not max_browsers.isdigit():
+        raise ValueError(f"Invalid max browsers format: {max_browsers}, should be integer")
+
+    resolver = DriverResolver(offline=config.getoption("--driver-offline"))
+    profile = get_launch_profile(config.getoption("--browser-profile"))
+    factories: Dict[str, DriverFactory] = {
+        name: DriverFactory(
+            browser_name=name,
+            headless=config.getoption("--headless"),
+            resolver=resolver,
+            driver_path=config.getoption("--driver-path"),
+            profile=profile
+        )
+        for name in get_browser_names(config)
+    }
+
+    return DriverPools(factories=factories, host_slots=HostSlots(max_slots=int(max_browsers)))
+
+
+@pytest.fixture(scope="session")
+def driver_pools(request):
+    # Usually created and pre-warmed once the collection finished
+    if request.config.driver_pools is None:
+        request.config.driver_pools = create_driver_pools(request.config)
+
+    return request.config.driver_pools
+
+
+@pytest.fixture
+def browser(driver_pools, browser_name):
+    driver_pool = driver_pools.get(browser_name)
+    driver = driver_pool.lease()
 
     yield driver
 
-    driver.quit()
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def storage_state_cache(base_url, tmp_path_factory) -> StorageStateCache:
+    username: str = "standard_user"
+
+    # Under xdist every worker has its own basetemp, their common parent is unique for the run
+    shared_dir: Path = tmp_path_factory.getbasetemp()
+
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        shared_dir = shared_dir.parent
+
+    return StorageStateCache(path=shared_dir / f"storage-state-{username}-{hashlib.sha1(base_url.encode()).hexdigest()[:10]}.json")
+
+
+@pytest.fixture
+def storage_state(storage_state_cache, browser, base_url) -> StorageState:
+    """Log in through the real form once, with the requesting test's own browser, and share the session state with every test and xdist worker"""
+    state: Optional[StorageState] = storage_state_cache.get()
+
+    if state is not None:
+        return state
+
+    username, password = "standard_user", "secret_sauce"
+    logger = CustomLogger(name="StorageState")
+    login_page = LoginPage(driver=browser, logger=logger, base_url=base_url)
+    login_page.load()
+    login_page.login(username=username, password=password)
+
+    if not MainPage(driver=browser, logger=logger, base_url=base_url).is_user_logged_in():
+        raise RuntimeError(f"Failed to log in as {username} to capture the session storage state")
+
+    state = login_page.capture_storage_state()
+    storage_state_cache.put(state)
+
+    return state
 
 
 def pytest_runtest_logstart(nodeid, location):
@@ -73,3 +309,71 @@ def pytest_runtest_makereport(item, call):
 
     # Store all phases (setup/call/teardown)
     setattr(item, f"rep_{rep.when}", rep)
+
+    if rep.failed and rep.when in ("setup", "call"):
+        capture_failure_artifacts(item=item, when=rep.when)
+
+
+def capture_failure_artifacts(item, when: str) -> None:
+    """Fetch the browser state of a failed test, the writer thread encodes, writes and links it in the test log"""
+    writer = item.config.failure_artifacts
+    driver = getattr(item, "funcargs", {}).get("browser")
+    logger = getattr(item.instance, "logger", None)
+
+    if writer is None or driver is None or logger is None or logger.report_dir is None:
+        return
+
+    def on_written(capture, links) -> None:
+        logger.log_failure_artifacts(test=capture.nodeid, when=capture.when, url=capture.url, links=links, errors=capture.errors)
+
+    if not writer.capture(driver=driver, nodeid=item.nodeid, when=when, output_dir=logger.report_dir / "artifacts", on_written=on_written):
+        logger.warning(msg="Failure artifacts skipped, too many failures are waiting to be written")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Merge the results of a browser matrix run into one pass/fail and timing summary per browser"""
+    if hasattr(config, "workerinput") or len(get_browser_names(config)) == 1:
+        return
+
+    summary: Dict[str, Dict] = {}
+
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            browser_name = dict(getattr(report, "user_properties", [])).get("browser")
+
+            if browser_name is None or not hasattr(report, "when"):
+                continue
+
+            browser_summary = summary.setdefault(browser_name, {"passed": 0, "failed": 0, "skipped": 0, "errors": 0, "duration": 0.0, "start": None, "stop": None})
+            browser_summary["duration"] += report.duration
+
+            if getattr(report, "start", None) is not None:
+                browser_summary["start"] = min(filter(None, [browser_summary["start"], report.start]))
+                browser_summary["stop"] = max(filter(None, [browser_summary["stop"], report.stop]))
+
+            if report.when == "call":
+                browser_summary[report.outcome] += 1
+
+            elif report.failed:
+                browser_summary["errors"] += 1
+
+            elif report.skipped:
+                browser_summary["skipped"] += 1
+
+    if not summary:
+        return
+
+    terminalreporter.write_sep("=", "browser matrix summary")
+
+    for browser_name, browser_summary in sorted(summary.items()):
+        browser_summary["wall_time"] = (browser_summary["stop"] - browser_summary["start"]) if browser_summary["start"] else 0.0
+        terminalreporter.write_line(
+            f"{browser_name:<10} passed: {browser_summary['passed']:<5} failed: {browser_summary['failed']:<5} skipped: {browser_summary['skipped']:<5} errors: {browser_summary['errors']:<5}"
+            f" test time: {browser_summary['duration']:.2f}s wall time: {browser_summary['wall_time']:.2f}s",
+            red=browser_summary["failed"] + browser_summary["errors"] > 0,
+            green=browser_summary["failed"] + browser_summary["errors"] == 0
+        )
+
+    summary_path: Path = Path("reports") / "browser-matrix.json"
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
@@ -0,0 +1,108 @@
+import contextvars
+import functools
+import json
+import math
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+
+def percentile(ordered: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    rank: int = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+
+    return ordered[rank]
+
+
+class ActionTimings:
+    """Wall time samples of page-object actions, keyed by action type and locator"""
+
+    def __init__(self) -> None:
+        self.samples: Dict[Tuple[str, str], List[float]] = {}
+
+    def record(self, action: str, locator: str, duration: float) -> None:
+        self.samples.setdefault((action, locator), []).append(duration)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per action and locator statistics, sorted by total time (the biggest offenders first)"""
+        rows: List[Dict[str, Any]] = []
+
+        for (action, locator), durations in self.samples.items():
+            ordered: List[float] = sorted(durations)
+
+            rows.append({
+                'action': action,
+                'locator': locator,
+                'count': len(ordered),
+                'total': sum(ordered),
+                'p50': percentile(ordered, 50),
+                'p95': percentile(ordered, 95),
+                'max': ordered[-1],
+            })
+
+        return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+    def format_top_offenders(self, limit: int = 10) -> str:
+        rows: List[Dict[str, Any]] = self.summary()[:limit]
+        lines: List[str] = [
+            f"{' ACTION TIMINGS (top ' + str(len(rows)) + ' by total time) ':=^100}",
+            f"{'action':<28}{'locator':<40}{'count':>6}{'total':>8}{'p50':>6}{'p95':>6}{'max':>6}",
+        ]
+
+        for row in rows:
+            lines.append(
+                f"{row['action'][:27]:<28}{row['locator'][:39]:<40}{row['count']:>6}"
+                f"{row['total']:>8.2f}{row['p50']:>6.2f}{row['p95']:>6.2f}{row['max']:>6.2f}"
+            )
+
+        return '\n'.join(lines)
+
+    def save(self, path: Path, test_class: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'test_class': test_class, 'unit': 'seconds', 'actions': self.summary()}, indent=2), encoding='utf-8')
+
+
+# Set while a timed action runs, so the actions it calls (clear_and_set_text -> clear, set_text) are not counted twice
+_inside_timed_action: contextvars.ContextVar[bool] = contextvars.ContextVar('inside_timed_action', default=False)
+
+
+def timed_action(action: Optional[str] = None, locator: Optional[Callable[..., str]] = None) -> Callable:
+    """Record the wall time of a page-object method in its logger's ActionTimings.
+
+    The locator is taken from the ``locator`` argument when the method has one, otherwise
+    the owner class name is used (list parsing and product actions). A ``locator`` callable
+    labels the call from the method arguments instead, evaluated before the method runs.
+    Only the outermost timed action of a call chain is recorded.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        action_name: str = action or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if _inside_timed_action.get():
+                return method(self, *args, **kwargs)
+
+            if locator is not None:
+                label: str = locator(self, *args, **kwargs)
+
+            else:
+                locator_argument = kwargs.get('locator', args[0] if args and isinstance(args[0], tuple) else None)
+                label = str(locator_argument[1]) if locator_argument else type(self).__name__
+
+            token = _inside_timed_action.set(True)
+            start: float = time.perf_counter()
+
+            try:
+                return method(self, *args, **kwargs)
+
+            finally:
+                _inside_timed_action.reset(token)
+                timings: Optional[ActionTimings] = getattr(self.logger, 'action_timings', None)
+
+                if timings is not None:
+                    timings.record(action=action_name, locator=label, duration=time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
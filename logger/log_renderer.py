@@ -0,0 +1,109 @@
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+from logger.logger import CustomFormatter
+
+
+class LogRenderer:
+    """Renders the structured ``log.jsonl`` stream of CustomLogger to the colored HTML log on demand"""
+
+    def __init__(self, log_path: Path) -> None:
+        self.log_path: Path = log_path
+        self.index_path: Path = log_path.with_suffix('.index.json')
+
+        self._formatter: CustomFormatter = CustomFormatter(
+            '%(asctime)s - %(levelname)s - %(page)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        self._formatter.set_html_mode(enabled=True)
+
+    def render(self, test: Optional[str] = None, level: int = logging.DEBUG) -> str:
+        entries: Iterator[Dict[str, Any]] = self._read_test(test) if test else self._read_all()
+
+        return '\n'.join(self._format_entry(entry) for entry in entries if logging.getLevelName(entry['level']) >= level)
+
+    def list_tests(self) -> List[str]:
+        return list(self._read_index())
+
+    def _read_all(self) -> Iterator[Dict[str, Any]]:
+        with self.log_path.open('r', encoding='utf-8') as log_file:
+            for line in log_file:
+                yield json.loads(line)
+
+    def _read_test(self, test: str) -> Iterator[Dict[str, Any]]:
+        spans: List[List[int]] = self._read_index().get(test)
+
+        if spans is None:
+            raise KeyError(f"The test {test} is not in the log index {self.index_path}")
+
+        # Seek straight to the test's byte ranges instead of scanning the whole run
+        with self.log_path.open('rb') as log_file:
+            for start, end in spans:
+                log_file.seek(start)
+
+                for line in log_file.read(end - start).splitlines():
+                    yield json.loads(line)
+
+    def _read_index(self) -> Dict[str, List[List[int]]]:
+        return json.loads(self.index_path.read_text(encoding='utf-8'))
+
+    def _format_entry(self, entry: Dict[str, Any]) -> str:
+        record: logging.LogRecord = logging.makeLogRecord({
+            'created': entry['ts'],
+            'levelname': entry['level'],
+            'levelno': logging.getLevelName(entry['level']),
+            'msg': entry['msg'],
+            'color': entry['color'],
+            'page': entry['page'],
+            'simple': entry.get('simple', False),
+            'links': entry.get('links'),
+        })
+
+        return self._formatter.format(record)
+
+
+def render_report_dir(report_dir: Path) -> None:
+    """Render the classic debug.html and info.html files of a report directory"""
+    renderer = LogRenderer(log_path=report_dir / 'log.jsonl')
+
+    (report_dir / 'debug.html').write_text(renderer.render(level=logging.DEBUG), encoding='utf-8')
+    (report_dir / 'info.html').write_text(renderer.render(level=logging.INFO), encoding='utf-8')
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Render the structured CustomLogger logs to colored HTML")
+    arg_parser.add_argument('report_dirs', nargs='+', type=Path, help="Report directories containing log.jsonl, searched recursively")
+    arg_parser.add_argument('--test', default=None, help="Render only the test with this nodeid")
+    arg_parser.add_argument('--level', default='debug', choices=['debug', 'info', 'warning', 'error'], help="Minimum level to render, default debug")
+    arg_parser.add_argument('--output', type=Path, default=None, help="Output file of a single test rendering, default stdout")
+    args = arg_parser.parse_args()
+
+    log_paths: List[Path] = [log_path for report_dir in args.report_dirs for log_path in sorted(report_dir.rglob('log.jsonl'))]
+
+    if args.test is None:
+        for log_path in log_paths:
+            render_report_dir(log_path.parent)
+
+        return
+
+    for log_path in log_paths:
+        renderer = LogRenderer(log_path=log_path)
+
+        if args.test in renderer.list_tests():
+            html = renderer.render(test=args.test, level=logging.getLevelName(args.level.upper()))
+
+            if args.output:
+                args.output.write_text(html, encoding='utf-8')
+            else:
+                print(html)
+
+            return
+
+    raise SystemExit(f"The test {args.test} was not found in {', '.join(str(path) for path in log_paths)}")
+
+
+if __name__ == '__main__':
+    main()
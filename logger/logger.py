@@ -1,9 +1,15 @@
-import inspect
+import atexit
+import json
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import html
 
+from logger.action_timings import ActionTimings
+
 
 class CustomFormatter(logging.Formatter):
     """Handles both ANSI console colors and HTML formatting"""
@@ -47,7 +53,7 @@ class CustomFormatter(logging.Formatter):
         color = getattr(record, 'color', record.levelname)
 
         if self._html_mode:
-            return self._format_html(message, color)
+            return self._format_html(message, color, links=getattr(record, 'links', None))
 
         elif self._ansi_mode:
             return self._format_ansi(message, color)
@@ -60,12 +66,15 @@ class CustomFormatter(logging.Formatter):
 
         return f"{ansi_color}{message}{self.ANSI_COLORS['RESET']}"
 
-    def _format_html(self, message: str, color: str) -> str:
+    def _format_html(self, message: str, color: str, links: Optional[Dict[str, str]] = None) -> str:
         """Special HTML formatting that preserves console-style centering"""
 
         style = self.HTML_COLORS.get(color, '')
         escaped = html.escape(message)
 
+        if links:
+            escaped += ' ' + ' '.join(f'<a href="{html.escape(href)}">{html.escape(name)}</a>' for name, href in links.items())
+
         return f'<div style="font-family: monospace; white-space: pre;{style}">{escaped}</div>'
 
     def set_html_mode(self, enabled: bool):
@@ -73,6 +82,153 @@ class CustomFormatter(logging.Formatter):
         self._ansi_mode = not enabled
 
 
+class JsonLinesHandler(logging.FileHandler):
+    """Writes one compact JSON line per record and keeps a byte-offset index of every test's lines.
+
+    The index (``<log>.index.json``) maps a test nodeid to the byte ranges of its lines, so
+    ``logger.log_renderer`` can render a single test with a few seeks instead of scanning the run.
+    """
+
+    def __init__(self, filename: Path, flush_each_record: bool = True) -> None:
+        super().__init__(filename=filename, mode='w', encoding='utf-8')
+
+        self.index_path: Path = Path(filename).with_suffix('.index.json')
+        self.flush_each_record: bool = flush_each_record
+
+        self._offset: int = 0
+        self._index: Dict[str, List[List[int]]] = {}
+        self._current_span: Optional[Tuple[str, List[int]]] = None
+
+    def _open(self):
+        # No newline translation, the byte offsets must match the file content on every platform
+        return open(self.baseFilename, self.mode, encoding=self.encoding, newline='\n')
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            line: str = self.format(record) + '\n'  # ASCII only, so one character is one byte
+            self.stream.write(line)
+
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._index_line(test=getattr(record, 'test', None), length=len(line))
+
+        if self.flush_each_record:
+            self.flush()
+
+    def format(self, record: logging.LogRecord) -> str:
+        message: str = record.getMessage()
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+
+        entry: Dict[str, Any] = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'color': getattr(record, 'color', record.levelname),
+            'test': getattr(record, 'test', None),
+            'page': getattr(record, 'page', record.name),
+            'msg': message,
+        }
+
+        if getattr(record, 'simple', False):
+            entry['simple'] = True
+
+        if getattr(record, 'links', None):
+            entry['links'] = record.links
+
+        return json.dumps(entry, separators=(',', ':'))
+
+    def write_index(self) -> None:
+        self.index_path.write_text(json.dumps(self._index), encoding='utf-8')
+
+    def close(self) -> None:
+        self.write_index()
+        super().close()
+
+    def _index_line(self, test: Optional[str], length: int) -> None:
+        start: int = self._offset
+        self._offset += length
+
+        if test is None:
+            self._current_span = None
+            return
+
+        if self._current_span and self._current_span[0] == test:
+            self._current_span[1][1] = self._offset
+            return
+
+        span: List[int] = [start, self._offset]
+        self._index.setdefault(test, []).append(span)
+        self._current_span = (test, span)
+
+
+class QueuedLogListener:
+    """Background thread that formats and writes queued records in batches.
+
+    The test thread only pays for putting the record in the queue; formatting and the disk writes
+    happen here, and the handlers are flushed once per batch instead of once per record.
+    """
+
+    _STOP = object()
+
+    def __init__(self, handlers: List[logging.Handler], batch_size: int = 256) -> None:
+        self.queue: queue.Queue = queue.Queue()
+        self.handlers: List[logging.Handler] = handlers
+        self.batch_size: int = batch_size
+
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='log-queue-listener', daemon=True)
+        self._thread.start()
+
+        # Drain whatever is still queued when the interpreter exits, so no lines are lost
+        atexit.register(self.stop)
+
+    def flush(self) -> None:
+        """Block until every queued record is written"""
+        if self._thread.is_alive():
+            self.queue.join()
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self.queue.put(self._STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        stopped: bool = False
+
+        while not stopped:
+            batch: List[Any] = [self.queue.get()]
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is self._STOP:
+                    stopped = True
+                    continue
+
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+            for handler in self.handlers:
+                handler.flush()
+
+            for _ in batch:
+                self.queue.task_done()
+
+
 class CustomLogger(logging.Logger):
     """Logger with custom output capabilities"""
 
@@ -82,11 +238,19 @@ class CustomLogger(logging.Logger):
         self.setLevel(logging.DEBUG)  # set the root logger level
 
         self.test_results: Dict[str, int] = {'passed': 0, 'failed': 0}
+        self.queue_listener: Optional[QueuedLogListener] = None
+        self.structured_handler: Optional[JsonLinesHandler] = None
+        self.action_timings: ActionTimings = ActionTimings()
+        self.report_dir: Optional[Path] = None
 
-    def setup_handlers(self, report_path: str, level: int):
+        # nodeid of the running test, attached to every record for the per-test log index
+        self.current_test: Optional[str] = None
+
+    def setup_handlers(self, report_path: str, level: int, queued: bool = False):
         if  not self.handlers:
             log_dir = Path(report_path)
             log_dir.mkdir(parents=True, exist_ok=True)
+            self.report_dir = log_dir
 
             # Clear existing log files
             for log_file in [log_dir / "info.log", log_dir / "debug.log"]:
@@ -94,34 +258,48 @@ class CustomLogger(logging.Logger):
                     log_file.unlink()
 
             console_formatter = CustomFormatter(
-                '%(asctime)s - %(levelname)s - %(message)s',
+                '%(asctime)s - %(levelname)s - %(page)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             console_formatter.set_html_mode(enabled=False)
 
-            html_formatter = CustomFormatter(
-                '%(asctime)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            html_formatter.set_html_mode(enabled=True)
-
             # 1. Terminal Handler (colored)
             console_handler = logging.StreamHandler()
             console_handler.setLevel(level)
             console_handler.setFormatter(console_formatter)
-            self.addHandler(console_handler)
 
-            # 2. Info File Handler (colored)
-            info_handler = logging.FileHandler(filename=log_dir / "info.html", encoding='utf-8', mode='w')
-            info_handler.setLevel(logging.INFO)
-            info_handler.setFormatter(html_formatter)
-            self.addHandler(info_handler)
+            # 2. Structured File Handler, the colored HTML is rendered from it by logger.log_renderer
+            self.structured_handler = JsonLinesHandler(filename=log_dir / "log.jsonl", flush_each_record=not queued)
+            self.structured_handler.setLevel(logging.DEBUG)
+
+            handlers: List[logging.Handler] = [console_handler, self.structured_handler]
+
+            if queued:
+                # The test thread only enqueues, the listener thread formats and writes
+                self.queue_listener = QueuedLogListener(handlers=handlers)
+
+                queue_handler = QueueHandler(self.queue_listener.queue)
+                queue_handler.setLevel(min(handler.level for handler in handlers))
+                self.addHandler(queue_handler)
+
+            else:
+                for handler in handlers:
+                    self.addHandler(handler)
+
+    def flush(self) -> None:
+        """Wait until every queued record is written and save the per-test log index"""
+        if self.queue_listener:
+            self.queue_listener.flush()
+
+        if self.structured_handler:
+            self.structured_handler.write_index()
+
+    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None, sinfo=None) -> logging.LogRecord:
+        record: logging.LogRecord = super().makeRecord(name, level, fn, lno, msg, args, exc_info, func=func, extra=extra, sinfo=sinfo)
+        record.__dict__.setdefault('page', self.name)
+        record.test = self.current_test
 
-            # 3. Debug File Handler (colored)
-            debug_handler = logging.FileHandler(filename=log_dir / "debug.html", encoding='utf-8', mode='w')
-            debug_handler.setLevel(logging.DEBUG)
-            debug_handler.setFormatter(html_formatter)
-            self.addHandler(debug_handler)
+        return record
 
     def print_class_header(self, class_name: str) -> None:
         header = self._format_header_footer(f"{class_name}.py")
@@ -169,21 +347,58 @@ class CustomLogger(logging.Logger):
         color = 'FAIL' if self.test_results['failed'] > 0 else 'PASS'
         self._print_colored(message=summary, color=color, simple=True)
 
+        if self.action_timings.samples:
+            self._print_colored(message=f"\n{self.action_timings.format_top_offenders()}\n{'':=^100}", color='WARNING', simple=True)
+
+            if self.report_dir:
+                self.action_timings.save(path=self.report_dir / "timings.json", test_class=self.name)
+
+        self.flush()
+
+    def log_failure_artifacts(self, test: str, when: str, url: Optional[str], links: Dict[str, str], errors: List[str]) -> None:
+        """Log the artifact files of a failure under its test, called from the artifact writer thread"""
+        message: str = f"Failure artifacts ({when}) - url: {url}, files: {', '.join(links.values()) or 'none'}"
+
+        if errors:
+            message += f", not captured: {'; '.join(errors)}"
+
+        record = self.makeRecord(self.name, logging.ERROR, __file__, 0, message, None, None, None, {'links': links})
+        # The writer thread runs after the test moved on, file the record under the failed test
+        record.test = test
+        self.handle(record)
+
     def _format_header_footer(self, text: str, width: int = 100, border_char: str = '=') -> str:
         border = border_char * width
         return f"\n{border}\n{text.center(width)}\n{border}\n"
 
-    def info(self, msg, *args, exc_info = None, stack_info = False, stacklevel = 1, extra = None) -> None:
-        super().info(msg=f'{self._get_current_class_name()} - {msg}', *args, exc_info=exc_info, stacklevel=stacklevel, extra=extra)
+    def for_page(self, page: str) -> 'PageLogger':
+        return PageLogger(logger=self, page=page)
+
+    def info(self, msg, *args, exc_info = None, stack_info = False, stacklevel = 1, extra = None, page: Optional[str] = None) -> None:
+        if self._is_level_accepted(logging.INFO):
+            super().info(msg, *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra={**(extra or {}), 'page': page or self.name})
+
+    def debug(self, msg, *args, exc_info = None, stacklevel = 1, page: Optional[str] = None) -> None:
+        if self._is_level_accepted(logging.DEBUG):
+            super().debug(msg, *args, exc_info=exc_info, stacklevel=stacklevel, extra={'page': page or self.name})
 
-    def debug(self, msg, *args, exc_info = None, stacklevel = 1) -> None:
-        super().debug(msg=f'{self._get_current_class_name()} - {msg}', *args, exc_info=exc_info, stacklevel=stacklevel)
+    def warning(self, msg, *args, exc_info = None, stacklevel = 1, page: Optional[str] = None) -> None:
+        if self._is_level_accepted(logging.WARNING):
+            super().warning(msg, *args, exc_info=exc_info, stacklevel=stacklevel, extra={'page': page or self.name})
 
-    def warning(self, msg, *args, exc_info = None, stacklevel = 1) -> None:
-        super().warning(msg=f'{self._get_current_class_name()} - {msg}', *args, exc_info=exc_info, stacklevel=stacklevel)
+    def error(self, msg, *args, exc_info = None, stacklevel = 1, page: Optional[str] = None) -> None:
+        if self._is_level_accepted(logging.ERROR):
+            super().error(msg, *args, exc_info=exc_info, stacklevel=stacklevel, extra={'page': page or self.name})
 
-    def error(self, msg, *args, exc_info = None, stacklevel = 1) -> None:
-        super().error(msg=f'{self._get_current_class_name()} - {msg}', *args, exc_info=exc_info, stacklevel=stacklevel)
+    def _is_level_accepted(self, level: int) -> bool:
+        """Check if any handler will emit the level, so dropped records are never created"""
+        if not self.isEnabledFor(level):
+            return False
+
+        if not self.handlers:
+            return logging.lastResort is not None and level >= logging.lastResort.level
+
+        return any(level >= handler.level for handler in self.handlers)
 
     def _print_colored(self, message: str, color: str, level: int = logging.INFO, simple: bool = False):
         """Helper method for colored messages"""
@@ -193,16 +408,31 @@ class CustomLogger(logging.Logger):
         )
         self.handle(record)
 
-    def _get_current_class_name(self) -> str:
-        frame = inspect.currentframe()
-        outer_frames = inspect.getouterframes(frame)
-        class_name = self.name
-        # Find the frame that called the logger
-        for frame_info in outer_frames:
-            self_obj = frame_info.frame.f_locals.get('self')
 
-            if self_obj and not isinstance(self_obj, CustomLogger):
-                class_name = type(self_obj).__name__
-                break
+class PageLogger:
+    """A CustomLogger bound to a page object, so its records carry the page name without a caller lookup.
+
+    Everything but the logging methods (timings, report dir, flush, ...) is the shared CustomLogger.
+    """
+
+    def __init__(self, logger: CustomLogger, page: str) -> None:
+        self.logger: CustomLogger = logger
+        self.page: str = page
+
+    def for_page(self, page: str) -> 'PageLogger':
+        return PageLogger(logger=self.logger, page=page)
+
+    def info(self, msg, *args, **kwargs) -> None:
+        self.logger.info(msg, *args, page=self.page, **kwargs)
+
+    def debug(self, msg, *args, **kwargs) -> None:
+        self.logger.debug(msg, *args, page=self.page, **kwargs)
+
+    def warning(self, msg, *args, **kwargs) -> None:
+        self.logger.warning(msg, *args, page=self.page, **kwargs)
+
+    def error(self, msg, *args, **kwargs) -> None:
+        self.logger.error(msg, *args, page=self.page, **kwargs)
 
-        return class_name
\ No newline at end of file
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.logger, name)
@@ -1,25 +1,273 @@
-from typing import Tuple
+import time
+from contextlib import contextmanager
+from typing import Tuple, Optional, Dict, Callable, TypeVar, Sequence, List, Any, Iterator
+from urllib.parse import urljoin, urlsplit
 
 from selenium import webdriver
-from selenium.common import TimeoutException
+from selenium.common import TimeoutException, StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-from logger.logger import CustomLogger
+from logger.logger import CustomLogger, PageLogger
+from logger.action_timings import timed_action
+from pages.element_wait import ElementWait, WaitMode, css_selector_for, is_document_unloaded
+
+
+DEFAULT_BASE_URL = 'https://www.saucedemo.com/'
+
+T = TypeVar('T')
+
+# Clear the web storage of the current document and report its origin, storage access throws on about:blank and data: pages
+_CLEAR_STORAGE_SCRIPT = """
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {
+        return null;
+    }
+
+    return window.location.origin;
+"""
+
+# Failure message of every batch step, the same the single-step methods log and assert
+_BATCH_STEP_FAILURES: Dict[str, str] = {
+    'click': "Failed to click the element with locator: {locator}",
+    'type': "Failed to send the text to the element with locator: {locator}",
+    'clear': "Failed to clear the text to the element with locator: {locator}",
+}
+
+
+class BatchStep:
+    def __init__(self, action: str, locator: Tuple[str, str], text: str = '') -> None:
+        self.action: str = action
+        self.locator: Tuple[str, str] = locator
+        self.text: str = text
+
+
+def _batch_label(batch: 'ActionBatch') -> str:
+    """Timing label of a batch, its page and first locator, so every form gets its own row"""
+    page_name: str = type(batch.page).__name__
+
+    return f'{page_name}:{batch.steps[0].locator[1]}' if batch.steps else page_name
+
+
+class ActionBatch:
+    """Fill, clear and click steps queued by ``BasePage.batch()`` and run when the block exits.
+
+    The steps run in one in-browser script per click (a click may navigate, so it ends a script),
+    so a login or checkout form costs one WebDriver command instead of a wait and an action per step.
+    Fields are set with input/change events, clicks in the middle of a batch are DOM clicks on visible,
+    enabled elements. The last click of a batch is a WebDriver click on the element the script located,
+    so the driver waits for the page load it starts like ``BasePage.click`` does.
+    Locators without a CSS equivalent and the ``webdriver`` wait mode run the steps one by one instead.
+    """
+
+    def __init__(self, page: 'BasePage') -> None:
+        self.page: BasePage = page
+        self.logger: PageLogger = page.logger
+        self.steps: List[BatchStep] = []
+
+    def click(self, locator: Tuple[str, str]) -> None:
+        self.logger.debug("Click the element with locator: %s", locator)
+        self.steps.append(BatchStep(action='click', locator=locator))
+
+    def set_text(self, locator: Tuple[str, str], text: str) -> None:
+        self.logger.debug("Enter text %s to the element locator: %s", text, locator)
+        self.steps.append(BatchStep(action='type', locator=locator, text=text))
+
+    def clear(self, locator: Tuple[str, str]) -> None:
+        self.logger.debug("Clear the content of the element with locator: %s", locator)
+        self.steps.append(BatchStep(action='clear', locator=locator))
+
+    def clear_and_set_text(self, locator: Tuple[str, str], text: str) -> None:
+        self.clear(locator=locator)
+        self.set_text(locator=locator, text=text)
+
+    @timed_action(action='batch', locator=_batch_label)
+    def run(self) -> None:
+        steps, self.steps = self.steps, []
+
+        if not steps:
+            return
+
+        if self.page.wait_mode == WaitMode.WEBDRIVER or any(css_selector_for(step.locator) is None for step in steps):
+            self._run_one_by_one(steps)
+            return
+
+        segments: List[List[BatchStep]] = [[]]
+
+        for step in steps:
+            segments[-1].append(step)
+
+            if step.action == 'click':
+                segments.append([])
+
+        segments = [segment for segment in segments if segment]
+
+        # One script per segment, plus the WebDriver click that ends the batch
+        self.logger.debug("Run a batch of %s steps in %s browser commands", len(steps), len(segments) + (steps[-1].action == 'click'))
+
+        for index, segment in enumerate(segments):
+            last_click: bool = index == len(segments) - 1 and segment[-1].action == 'click'
+            result: Dict[str, Any] = self._perform(segment=segment, last_click=last_click, after_click=index > 0)
+
+            if result['failed'] is not None:
+                self._fail(step=segment[result['failed']], error=result['error'])
+
+            if last_click:
+                try:
+                    result['element'].click()
+
+                except Exception as e:
+                    self._fail(step=segment[-1], error=str(e))
+
+    def _perform(self, segment: List[BatchStep], last_click: bool, after_click: bool) -> Dict[str, Any]:
+        """Run one segment script, an unloaded document is the navigation of a click and not a failed step"""
+        steps: List[List[Any]] = [[step.action, css_selector_for(step.locator), step.text] for step in segment]
+
+        if last_click:
+            steps[-1][0] = 'locate'
+
+        # The document the script started in can still be unloading after the DOM click of the previous segment
+        attempts: int = 2 if after_click else 1
+
+        for attempt in range(1, attempts + 1):
+            try:
+                return self.page.element_wait.perform(steps=steps)
+
+            except Exception as e:
+                if is_document_unloaded(e) and segment[-1].action == 'click' and not last_click:
+                    # The segment's DOM click navigated before the script could report back
+                    return {'failed': None, 'error': None}
+
+                if is_document_unloaded(e) and attempt < attempts:
+                    time.sleep(self.page.element_wait.poll_frequency)
+                    continue
+
+                locators: List[Tuple[str, str]] = [step.locator for step in segment]
+
+                self.logger.error(msg=f"Failed to run the batch steps with locators: {locators} due to error:\n{e}")
+
+                assert False, f"Failed to run the batch steps with locators: {locators}"
+
+    def _run_one_by_one(self, steps: List[BatchStep]) -> None:
+        for step in steps:
+            if step.action == 'click':
+                self.page.click(locator=step.locator)
+
+            elif step.action == 'type':
+                self.page.set_text(locator=step.locator, text=step.text)
+
+            else:
+                self.page.clear(locator=step.locator)
+
+    def _fail(self, step: BatchStep, error: str) -> None:
+        message: str = _BATCH_STEP_FAILURES[step.action].format(locator=step.locator)
+
+        self.logger.error(msg=f"{message} due to error:\n{error}")
+
+        assert False, message
 
 
 class BasePage:
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10):
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER):
         self.driver: webdriver = driver
-        self.logger: CustomLogger = logger
+        # Bound to the page class, the records carry the page name without a caller lookup
+        self.logger: PageLogger = logger.for_page(type(self).__name__)
         self.timeout: int = timeout
+        self.base_url: str = base_url
+        self.wait_mode: WaitMode = wait_mode
         self.wait: WebDriverWait = WebDriverWait(self.driver, timeout)
+        self.element_wait: ElementWait = ElementWait(driver=self.driver, timeout=timeout, mode=wait_mode)
 
-    def click(self, locator: Tuple[str, str]) -> None:
-        self.logger.debug(msg=f"Click the element with locator: {locator}")
+        # Elements resolved by this page, reused by the next interaction with the same locator
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+
+    def url_for(self, path: str = '') -> str:
+        return urljoin(self.base_url, path)
+
+    def navigate(self, url: str) -> None:
+        """Load a URL, the cached elements belong to the old document"""
+        self._element_cache.clear()
+        self.driver.get(url)
+
+    def _with_element(self, locator: Tuple[str, str], action: Callable[[WebElement], T], enabled: bool = False, cached: bool = True) -> T:
+        """Run the action on the cached element of the locator, or on a freshly waited one.
+
+        A cached element is used only while it is still displayed (and enabled when ``enabled`` is set),
+        the same conditions the wait checks. One that went stale (navigation, re-render), got hidden or
+        disabled, or is not interactable anymore is dropped and the action runs on a freshly waited element.
+        """
+        element: Optional[WebElement] = self._element_cache.get(locator) if cached else None
+
+        if element is not None:
+            try:
+                if element.is_displayed() and (not enabled or element.is_enabled()):
+                    return action(element)
+
+            except (StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException):
+                pass
+
+            self.logger.debug("Drop the cached element with locator: %s", locator)
+            self._element_cache.pop(locator, None)
+
+        element = self.element_wait.until(locator=locator, enabled=enabled)
+
+        if cached:
+            self._element_cache[locator] = element
+
+        return action(element)
+
+    @contextmanager
+    def batch(self) -> Iterator[ActionBatch]:
+        """Queue fill/clear/click steps in a with-block and run them in as few browser commands as possible on exit"""
+        actions: ActionBatch = ActionBatch(page=self)
+
+        yield actions
+
+        actions.run()
+
+    @timed_action()
+    def clear_app_state(self, path: str = '') -> None:
+        """Reset the app to a logged-out, empty-cart state with storage scripts instead of the side menu.
+
+        Clears localStorage, sessionStorage and the cookies of the app origin, then loads ``path`` so no
+        in-memory app state survives. Three WebDriver commands when the browser is already on the app.
+        """
+        self.logger.debug("Clear the app state and load the page: %s", self.url_for(path))
+
+        try:
+            base_origin: str = '{0.scheme}://{0.netloc}'.format(urlsplit(self.base_url))
+
+            if self.driver.execute_script(_CLEAR_STORAGE_SCRIPT) != base_origin:
+                # Storage and cookies can only be cleared from a document of the app origin
+                self.navigate(self.url_for())
+                self.driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+
+            self.driver.delete_all_cookies()
+            self.navigate(self.url_for(path))
+
+        except Exception as e:
+            self.logger.error(msg=f"Failed to clear the app state due to error:\n{e}")
+
+            assert False, "Failed to clear the app state"
+
+    @staticmethod
+    def to_css_selector(locator: Tuple[str, str]) -> str:
+        """Translate a locator to a CSS selector for in-browser scripts (document.querySelector)"""
+        selector: Optional[str] = css_selector_for(locator)
+
+        if selector is None:
+            raise ValueError(f"Unsupported locator strategy for CSS translation: {locator[0]}")
+
+        return selector
+
+    @timed_action()
+    def click(self, locator: Tuple[str, str], cached: bool = True) -> None:
+        self.logger.debug("Click the element with locator: %s", locator)
 
         try:
-            self.wait.until(EC.element_to_be_clickable(locator)).click()
+            self._with_element(locator=locator, action=lambda element: element.click(), enabled=True, cached=cached)
 
         except Exception as e:
             self.logger.error(msg=f"Failed to click the element with locator: {locator} due to error:\n{e}")
@@ -28,49 +276,98 @@ class BasePage:
 
 
 
-    def set_text(self, locator: Tuple[str, str], text: str) -> None:
-        self.logger.debug(msg=f"Enter text {text} to the element locator: {locator}")
+    @timed_action()
+    def set_text(self, locator: Tuple[str, str], text: str, cached: bool = True) -> None:
+        self.logger.debug("Enter text %s to the element locator: %s", text, locator)
 
         try:
-            self.wait.until(EC.visibility_of_element_located(locator)).send_keys(text)
+            self._with_element(locator=locator, action=lambda element: element.send_keys(text), cached=cached)
 
         except Exception as e:
             self.logger.error(msg=f"Failed to send the text to the element with locator: {locator} due to error:\n{e}")
 
             assert False, f"Failed to send the text to the element with locator: {locator}"
 
-    def clear(self, locator: Tuple[str, str]) -> None:
-        self.logger.debug(f"Clear the content of the element with locator: {locator}")
+    @timed_action()
+    def clear(self, locator: Tuple[str, str], cached: bool = True) -> None:
+        self.logger.debug("Clear the content of the element with locator: %s", locator)
 
         try:
-            self.wait.until(EC.visibility_of_element_located(locator)).clear()
+            self._with_element(locator=locator, action=lambda element: element.clear(), cached=cached)
 
         except Exception as e:
             self.logger.error(msg=f"Failed to clear the text to the element with locator: {locator} due to error:\n{e}")
 
             assert False, f"Failed to clear the text to the element with locator: {locator}"
 
-    def clear_and_set_text(self, locator: Tuple[str, str], text: str) -> None:
-       self.clear(locator=locator)
-       self.set_text(locator=locator, text=text)
+    @timed_action()
+    def clear_and_set_text(self, locator: Tuple[str, str], text: str, cached: bool = True) -> None:
+       self.clear(locator=locator, cached=cached)
+       self.set_text(locator=locator, text=text, cached=cached)
 
+    @timed_action()
     def get_text(self, locator: Tuple[str, str]) -> str:
-        self.logger.debug(msg=f"Get the text of the element with locator: {locator}")
+        self.logger.debug("Get the text of the element with locator: %s", locator)
 
         try:
-             return self.wait.until(EC.visibility_of_element_located(locator)).text
+             return self.element_wait.until_text(locator=locator)
 
         except Exception as e:
             self.logger.error(msg=f"Failed to get the text of the element with locator: {locator} due to error:\n{e}")
 
             assert False, f"Failed to get the text of the element with locator: {locator}"
 
-    def is_element_visible(self, locator: Tuple[str, str]) -> bool:
-        self.logger.debug(msg=f"check the visibility of the element with locator: {locator}")
+    @timed_action()
+    def is_element_visible(self, locator: Tuple[str, str], cached: bool = True) -> bool:
+        self.logger.debug("check the visibility of the element with locator: %s", locator)
 
         try:
-           self.wait.until(EC.visibility_of_element_located(locator))
+           # Always checked in the browser, the element found is cached for the interaction that usually follows
+           element: WebElement = self.element_wait.until(locator=locator)
+
+           if cached:
+               self._element_cache[locator] = element
+
            return True
 
         except TimeoutException :
             return False
+
+    @timed_action()
+    def wait_for_first(self, locators: Sequence[Tuple[str, str]], cached: bool = True) -> Optional[Tuple[str, str]]:
+        """Wait for several possible outcomes at once and return the locator of the first visible one.
+
+        A branching flow (logged in or error banner) resolves as soon as either outcome shows up instead
+        of waiting out the timeout of the outcome that never comes. None when no outcome shows up in time.
+        """
+        self.logger.debug("Wait for the first visible element of the locators: %s", list(locators))
+
+        try:
+            index, element = self.element_wait.until_first(locators=locators)
+
+        except TimeoutException:
+            return None
+
+        if cached:
+            self._element_cache[locators[index]] = element
+
+        return locators[index]
+
+    @timed_action()
+    def get_element_count(self, locator: Tuple[str, str], visible: bool = True, settle: bool = True) -> int:
+        """Count the matching elements in the current DOM without waiting for one to appear"""
+        self.logger.debug("Count the elements with locator: %s", locator)
+
+        try:
+            count, _ = self.element_wait.count(locator=locator, visible=visible, settle_ms=50 if settle else 0)
+
+            return count
+
+        except Exception as e:
+            self.logger.error(msg=f"Failed to count the elements with locator: {locator} due to error:\n{e}")
+
+            assert False, f"Failed to count the elements with locator: {locator}"
+
+    def is_element_absent(self, locator: Tuple[str, str], visible: bool = True, settle: bool = True) -> bool:
+        """Check that no element matches, immediately instead of waiting out the timeout for an element that never comes"""
+        return self.get_element_count(locator=locator, visible=visible, settle=settle) == 0
@@ -7,8 +7,10 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from logger.logger import CustomLogger
+from logger.action_timings import timed_action
 
 
 class CartItem:
@@ -29,8 +31,9 @@ class CartItem:
         self.item_price: float = item_price
         self.remove_button: WebElement = remove_button
 
+    @timed_action()
     def remove_product_from_cart(self) -> None:
-        self.logger.debug(msg=f"Remove the product with name {self.item_name} from the cart")
+        self.logger.debug("Remove the product with name %s from the cart", self.item_name)
 
         try:
             WebDriverWait(self.driver, self.timeout).until(EC.element_to_be_clickable(self.remove_button)).click()
@@ -42,8 +45,8 @@ class CartItem:
 
 
 class CartPage(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._cart_item_locator: Tuple[str, str] = (By.CLASS_NAME, 'cart_item')
         self._item_name_locator: Tuple[str, str] = (By.CLASS_NAME, 'inventory_item_name')
@@ -54,8 +57,9 @@ class CartPage(BasePage):
         self._continue_shopping_button_locator: Tuple[str, str] = (By.ID, 'continue-shopping')
         self._checkout_button_locator: Tuple[str, str] = (By.ID, 'checkout')
 
+    @timed_action()
     def get_all_cart_items(self) -> List[CartItem]:
-        self.logger.debug(msg=f"Get all cart items containers with locator: {self._cart_item_locator}")
+        self.logger.debug("Get all cart items containers with locator: %s", self._cart_item_locator)
 
         cart_items_list: List[CartItem] = []
 
@@ -80,15 +84,22 @@ class CartPage(BasePage):
 
         return cart_items_list
 
-    def _parse_item(self, item: WebElement) -> Optional[CartItem]:
-        self.logger.debug(msg=f"Parse the cart item object from the item element with name= {item.find_element(*self._item_name_locator).text}")
+    def is_cart_empty(self) -> bool:
+        self.logger.debug("Check if the cart list is empty")
+
+        return self.is_element_absent(locator=self._cart_item_locator, visible=False)
 
+    def _parse_item(self, item: WebElement) -> Optional[CartItem]:
         try:
+            item_name: str = item.find_element(*self._item_name_locator).text
+
+            self.logger.debug("Parse the cart item object from the item element with name= %s", item_name)
+
             return CartItem(
                 logger=self.logger,
                 driver=self.driver,
                 timeout=self.timeout,
-                item_name=item.find_element(*self._item_name_locator).text,
+                item_name=item_name,
                 item_description=item.find_element(*self._item_description_locator).text,
                 item_price=float(item.find_element(*self._item_price_locator).text.strip("$")),
                 remove_button=item.find_element(*self._remove_button_locator)
@@ -110,10 +121,10 @@ class CartPage(BasePage):
         return names_list
 
     def click_continue_shopping_button(self) -> None:
-        self.logger.debug(msg=f"Click continue shopping button")
+        self.logger.debug("Click continue shopping button")
         self.click(locator=self._continue_shopping_button_locator)
 
     def click_checkout_button(self) -> None:
-        self.logger.debug(msg=f"Click checkout button")
+        self.logger.debug("Click checkout button")
         self.click(locator=self._checkout_button_locator)
 
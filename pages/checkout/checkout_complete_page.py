@@ -3,26 +3,27 @@ from typing import Tuple
 from selenium.webdriver.chrome import webdriver
 from selenium.webdriver.common.by import By
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from logger.logger import CustomLogger
 
 
 class CheckoutCompletePage(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._home_button_locator: Tuple[str, str] = (By.ID, 'back-to-products')
         self._completion_message_locator: Tuple[str, str] = (By.CLASS_NAME, 'complete-header')
 
 
     def click_home_button(self) -> None:
-        self.logger.debug(msg=f"Click home button and return back to the inventory page")
+        self.logger.debug("Click home button and return back to the inventory page")
 
         self.click(self._home_button_locator)
 
 
     def is_the_checkout_completed(self) -> bool:
-        self.logger.debug(msg=f"Verify if the thankful message is displayed")
+        self.logger.debug("Verify if the thankful message is displayed")
 
         return 'Thank you for your order!' in self.get_text(locator=self._completion_message_locator)
 
@@ -7,8 +7,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from logger.logger import CustomLogger
+from logger.action_timings import timed_action
 
 
 class CheckoutItem:
@@ -19,8 +21,8 @@ class CheckoutItem:
 
 
 class CheckoutOverviewPage(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._cart_item_locator: Tuple[str, str] = (By.CLASS_NAME, 'cart_item')
         self._item_name_locator: Tuple[str, str] = (By.CLASS_NAME, 'inventory_item_name')
@@ -35,8 +37,9 @@ class CheckoutOverviewPage(BasePage):
         self._tax_price_locator: Tuple[str, str] = (By.CLASS_NAME, 'summary_tax_label')
         self._items_total_price_locator: Tuple[str, str] = (By.CLASS_NAME, 'summary_total_label')
 
+    @timed_action()
     def get_all_checkout_items(self) -> List[CheckoutItem]:
-        self.logger.debug(msg=f"Get all checkout items containers with locator: {self._cart_item_locator}")
+        self.logger.debug("Get all checkout items containers with locator: %s", self._cart_item_locator)
 
         checkout_items_list: List[CheckoutItem] = []
 
@@ -62,11 +65,13 @@ class CheckoutOverviewPage(BasePage):
         return checkout_items_list
 
     def _parse_item(self, item: WebElement) -> Optional[CheckoutItem]:
-        self.logger.debug(msg=f"Parse the checkout item object from the item element with name= {item.find_element(*self._item_name_locator).text}")
-
         try:
+            item_name: str = item.find_element(*self._item_name_locator).text
+
+            self.logger.debug("Parse the checkout item object from the item element with name= %s", item_name)
+
             return CheckoutItem(
-                item_name=item.find_element(*self._item_name_locator).text,
+                item_name=item_name,
                 item_description=item.find_element(*self._item_description_locator).text,
                 item_price=float(item.find_element(*self._item_price_locator).text.strip("$"))
             )
@@ -90,26 +95,26 @@ class CheckoutOverviewPage(BasePage):
         return 'Checkout: Overview' in self.get_text(locator=self._checkout_title_locator).strip()
 
     def click_finish_button(self) -> None:
-        self.logger.debug(msg=f"Click finish button to confirm the checkout")
+        self.logger.debug("Click finish button to confirm the checkout")
 
         self.click(locator=self._finish_button_locator)
 
     def click_cancel_button(self) -> None:
-        self.logger.debug(msg=f"Click cancel button to cancel the checkout")
+        self.logger.debug("Click cancel button to cancel the checkout")
 
         self.click(locator=self._cancel_button_locator)
 
     def get_subtotal_price(self) -> float:
-        self.logger.debug(msg=f"Get the subtotal price of the items without tax")
+        self.logger.debug("Get the subtotal price of the items without tax")
 
         return float(re.search(pattern=r'\d+(\.\d+)?', string= self.get_text(locator=self._items_subtotal_price_locator)).group())
 
     def get_tax_amount(self) -> float:
-        self.logger.debug(msg=f"Get the tax amount of the checkout items")
+        self.logger.debug("Get the tax amount of the checkout items")
 
         return float(re.search(pattern=r'\d+(\.\d+)?', string=self.get_text(locator=self._tax_price_locator)).group())
 
     def get_total_price_with_tax(self) -> float:
-        self.logger.debug(msg=f"Get the total price of the items with tax amount")
+        self.logger.debug("Get the total price of the items with tax amount")
 
         return float(re.search(pattern=r'\d+(\.\d+)?', string=self.get_text(locator=self._items_total_price_locator)).group())
\ No newline at end of file
@@ -0,0 +1,430 @@
+import time
+from enum import Enum
+from typing import Tuple, Optional, Dict, Any, List, Sequence
+
+from selenium import webdriver
+from selenium.common import TimeoutException, JavascriptException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+def css_selector_for(locator: Tuple[str, str]) -> Optional[str]:
+    """Translate a locator to a CSS selector for in-browser scripts, None if the strategy has no CSS equivalent"""
+    by, value = locator
+
+    if by in (By.CSS_SELECTOR, By.TAG_NAME):
+        return value
+
+    if by in (By.ID, By.NAME):
+        # Attribute values are quoted, escape the quotes and backslashes they contain
+        value = value.replace('\\', '\\\\').replace('"', '\\"')
+
+    if by == By.ID:
+        return f'[id="{value}"]'
+
+    if by == By.CLASS_NAME:
+        return f'.{value}'
+
+    if by == By.NAME:
+        return f'[name="{value}"]'
+
+    return None
+
+
+# Script errors of a document that went away mid-script (navigation, reload), not of the script itself
+_UNLOADED_DOCUMENT_ERRORS: Tuple[str, ...] = (
+    'document unloaded',
+    'document was unloaded',
+    'execution context was destroyed',
+    'cannot find context with specified id',
+    'inspected target navigated or closed',
+)
+
+
+def is_document_unloaded(error: Exception) -> bool:
+    """Whether a script error comes from a navigation that unloaded the document the script ran in"""
+    message: str = str(error).lower()
+
+    return any(unloaded in message for unloaded in _UNLOADED_DOCUMENT_ERRORS)
+
+
+class WaitMode(Enum):
+    OBSERVER = 'observer'
+    POLL = 'poll'
+    WEBDRIVER = 'webdriver'
+
+
+# Existence, visibility, enablement and text checked in one pass, shared by the poll and observer scripts
+_VISIBLE_FUNCTION = """
+    const isVisible = (element) => {
+        const style = window.getComputedStyle(element);
+        const hasBox = element.offsetWidth || element.offsetHeight || element.getClientRects().length;
+
+        return Boolean(hasBox) && style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+    };
+"""
+
+_CHECK_FUNCTION = _VISIBLE_FUNCTION + """
+    const check = (selector, visible, enabled, text) => {
+        const element = document.querySelector(selector);
+
+        if (!element) {
+            return null;
+        }
+
+        if (visible && !isVisible(element)) {
+            return null;
+        }
+
+        if (enabled && element.disabled) {
+            return null;
+        }
+
+        const innerText = element.innerText || element.value || '';
+
+        if (text !== null && !innerText.includes(text)) {
+            return null;
+        }
+
+        return {element: element, text: innerText};
+    };
+
+    // The first satisfied condition of a list, with its index for multi-outcome waits
+    const checkAny = (conditions) => {
+        for (let index = 0; index < conditions.length; index++) {
+            const [selector, visible, enabled, text] = conditions[index];
+            const result = check(selector, visible, enabled, text);
+
+            if (result) {
+                result.index = index;
+                return result;
+            }
+        }
+
+        return null;
+    };
+"""
+
+_POLL_SCRIPT = _CHECK_FUNCTION + """
+    return checkAny(arguments[0]);
+"""
+
+# Resolve as soon as a DOM mutation satisfies the condition, the interval catches style changes without mutations
+_OBSERVER_SCRIPT = _CHECK_FUNCTION + """
+    const [conditions, timeoutMs, done] = arguments;
+    const first = checkAny(conditions);
+
+    if (first) {
+        done(first);
+        return;
+    }
+
+    let finished = false;
+    const finish = (result) => {
+        if (finished) {
+            return;
+        }
+
+        finished = true;
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        done(result);
+    };
+    const recheck = () => {
+        const result = checkAny(conditions);
+
+        if (result) {
+            finish(result);
+        }
+    };
+
+    const observer = new MutationObserver(recheck);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+
+    const interval = setInterval(recheck, 100);
+    const timer = setTimeout(() => finish(null), timeoutMs);
+"""
+
+# Count the matches once the DOM has been quiet for settleMs (or after maxSettleMs), nothing to wait for when it is already quiet
+_COUNT_SCRIPT = _VISIBLE_FUNCTION + """
+    const [selector, visible, settleMs, maxSettleMs, done] = arguments;
+    const snapshot = () => {
+        const elements = Array.from(document.querySelectorAll(selector)).filter((element) => !visible || isVisible(element));
+
+        return {count: elements.length, text: elements.length ? (elements[0].innerText || elements[0].textContent || '') : null};
+    };
+
+    if (settleMs <= 0) {
+        done(snapshot());
+        return;
+    }
+
+    let finished = false;
+    const finish = () => {
+        if (finished) {
+            return;
+        }
+
+        finished = true;
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(maxTimer);
+        done(snapshot());
+    };
+
+    let quietTimer = setTimeout(finish, settleMs);
+    const maxTimer = setTimeout(finish, maxSettleMs);
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, settleMs);
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Run queued clear/type/click steps in order, each on an element that passed the visibility (and for clicks the
+# enablement) check. Values go through the prototype setter and fire input/change, so React-controlled fields update.
+# A final locate step resolves with the clickable element instead of clicking it
+_STEPS_SCRIPT = _CHECK_FUNCTION + """
+    const [steps, timeoutMs, done] = arguments;
+    const deadline = Date.now() + timeoutMs;
+
+    const setValue = (element, value) => {
+        // React tracks the instance value, the prototype setter changes the field without updating its tracker
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+
+    const waitFor = (selector, enabled, callback) => {
+        const first = check(selector, true, enabled, null);
+
+        if (first) {
+            callback(first.element);
+            return;
+        }
+
+        let finished = false;
+        const finish = (element) => {
+            if (finished) {
+                return;
+            }
+
+            finished = true;
+            observer.disconnect();
+            clearInterval(interval);
+            clearTimeout(timer);
+            callback(element);
+        };
+        const recheck = () => {
+            const result = check(selector, true, enabled, null);
+
+            if (result) {
+                finish(result.element);
+            }
+        };
+
+        const observer = new MutationObserver(recheck);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+
+        const interval = setInterval(recheck, 100);
+        const timer = setTimeout(() => finish(null), Math.max(deadline - Date.now(), 0));
+    };
+
+    const run = (index) => {
+        if (index >= steps.length) {
+            done({failed: null, error: null});
+            return;
+        }
+
+        const [action, selector, text] = steps[index];
+
+        waitFor(selector, action === 'click' || action === 'locate', (element) => {
+            if (!element) {
+                done({failed: index, error: `Timed out waiting for ${selector}`});
+                return;
+            }
+
+            if (action === 'locate') {
+                // The last click of a batch, returned for a WebDriver click that waits for the navigation it starts
+                done({failed: null, error: null, element: element});
+                return;
+            }
+
+            try {
+                if (action === 'click') {
+                    element.click();
+                } else {
+                    element.focus();
+                    setValue(element, action === 'clear' ? '' : element.value + text);
+                }
+            } catch (e) {
+                done({failed: index, error: String(e)});
+                return;
+            }
+
+            run(index + 1);
+        });
+    };
+
+    run(0);
+"""
+
+
+class ElementWait:
+    """Waits for an element condition with one in-browser script instead of several WebDriver commands per poll.
+
+    ``OBSERVER`` runs one async script that returns as soon as a DOM mutation satisfies the condition,
+    ``POLL`` runs one sync script per poll at a short interval, and ``WEBDRIVER`` keeps the classic
+    expected conditions for locators that cannot be expressed as a CSS selector.
+    """
+
+    _DEFAULT_SCRIPT_TIMEOUT: float = 30
+
+    def __init__(self, driver: webdriver, timeout: int, mode: WaitMode = WaitMode.OBSERVER, poll_frequency: float = 0.05) -> None:
+        self.driver: webdriver = driver
+        self.timeout: int = timeout
+        self.mode: WaitMode = mode
+        self.poll_frequency: float = poll_frequency
+
+        self._script_timeout_ready: bool = timeout < self._DEFAULT_SCRIPT_TIMEOUT
+
+    def until(self, locator: Tuple[str, str], visible: bool = True, enabled: bool = False, text: Optional[str] = None) -> WebElement:
+        selector: Optional[str] = css_selector_for(locator)
+
+        if selector is None or self.mode == WaitMode.WEBDRIVER:
+            return self._until_expected_condition(locator=locator, visible=visible, enabled=enabled, text=text)
+
+        return self._until_script(conditions=[[selector, visible, enabled, text]])['element']
+
+    def until_text(self, locator: Tuple[str, str]) -> str:
+        selector: Optional[str] = css_selector_for(locator)
+
+        if selector is None or self.mode == WaitMode.WEBDRIVER:
+            return self._until_expected_condition(locator=locator, visible=True, enabled=False, text=None).text
+
+        # The check script already read the text, no extra WebDriver command
+        return self._until_script(conditions=[[selector, True, False, None]])['text']
+
+    def count(self, locator: Tuple[str, str], visible: bool = True, settle_ms: int = 50, max_settle_ms: int = 500) -> Tuple[int, Optional[str]]:
+        """Count the matching elements right away instead of waiting for one to appear.
+
+        With ``settle_ms`` the count is taken once the DOM had no mutation for that long (at most
+        ``max_settle_ms``), so a render in flight is not missed. Returns the count and the text of the first match.
+        """
+        selector: Optional[str] = css_selector_for(locator)
+
+        if selector is None or self.mode == WaitMode.WEBDRIVER:
+            time.sleep(settle_ms / 1000)
+            elements: List[WebElement] = [element for element in self.driver.find_elements(*locator) if not visible or element.is_displayed()]
+
+            return len(elements), elements[0].text if elements else None
+
+        result: Dict[str, Any] = self.driver.execute_async_script(_COUNT_SCRIPT, selector, visible, settle_ms, max_settle_ms)
+
+        return result['count'], result['text']
+
+    def until_first(self, locators: Sequence[Tuple[str, str]], visible: bool = True) -> Tuple[int, WebElement]:
+        """Wait for several outcomes at once and return the index and element of the first one that shows up"""
+        selectors: List[Optional[str]] = [css_selector_for(locator) for locator in locators]
+
+        if None in selectors or self.mode == WaitMode.WEBDRIVER:
+            return WebDriverWait(self.driver, self.timeout).until(
+                lambda driver: self._first_found(driver=driver, locators=locators, visible=visible),
+                message=f"Timed out waiting for any of {list(locators)}"
+            )
+
+        result: Dict[str, Any] = self._until_script(conditions=[[selector, visible, False, None] for selector in selectors])
+
+        return result['index'], result['element']
+
+    @staticmethod
+    def _first_found(driver: webdriver, locators: Sequence[Tuple[str, str]], visible: bool):
+        for index, locator in enumerate(locators):
+            for element in driver.find_elements(*locator):
+                try:
+                    if not visible or element.is_displayed():
+                        return index, element
+
+                except StaleElementReferenceException:
+                    continue
+
+        return False
+
+    def perform(self, steps: List[List[Any]]) -> Dict[str, Any]:
+        """Run ``[action, selector, text]`` steps (clear, type, click) in one async script.
+
+        Every step waits in the browser for its element, all steps share one timeout. Returns the index
+        and error of the failed step, ``failed`` is None when all steps ran. A last ``locate`` step waits
+        for a clickable element and returns it as ``element`` instead of clicking it.
+        """
+        self._prepare_script_timeout()
+
+        return self.driver.execute_async_script(_STEPS_SCRIPT, steps, self.timeout * 1000)
+
+    def _prepare_script_timeout(self) -> None:
+        if not self._script_timeout_ready:
+            self.driver.set_script_timeout(self.timeout + 5)
+            self._script_timeout_ready = True
+
+    def _until_script(self, conditions: List[List[Any]]) -> Dict[str, Any]:
+        description: str = ' or '.join(condition[0] for condition in conditions)
+
+        if self.mode == WaitMode.POLL:
+            return WebDriverWait(self.driver, self.timeout, poll_frequency=self.poll_frequency).until(
+                lambda driver: driver.execute_script(_POLL_SCRIPT, conditions) or False,
+                message=f"Timed out waiting for {description}"
+            )
+
+        self._prepare_script_timeout()
+
+        deadline: float = time.monotonic() + self.timeout
+
+        while True:
+            remaining_ms: int = max(int((deadline - time.monotonic()) * 1000), 0)
+
+            try:
+                result: Optional[Dict[str, Any]] = self.driver.execute_async_script(_OBSERVER_SCRIPT, conditions, remaining_ms)
+
+            except StaleElementReferenceException:
+                result = None
+
+            except JavascriptException as e:
+                # A navigation unloaded the document while waiting, observe the new document. Any other script
+                # error (an invalid selector) fails the same way on every retry, so it is raised as it is
+                if not is_document_unloaded(e):
+                    raise
+
+                result = None
+
+            if result:
+                return result
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timed out waiting for {description}")
+
+            # Let the next document start loading before observing it
+            time.sleep(self.poll_frequency)
+
+    def _until_expected_condition(self, locator: Tuple[str, str], visible: bool, enabled: bool, text: Optional[str]) -> WebElement:
+        wait: WebDriverWait = WebDriverWait(self.driver, self.timeout)
+
+        if text is not None:
+            wait.until(EC.text_to_be_present_in_element(locator, text))
+
+        if enabled:
+            return wait.until(EC.element_to_be_clickable(locator))
+
+        if visible:
+            return wait.until(EC.visibility_of_element_located(locator))
+
+        return wait.until(EC.presence_of_element_located(locator))
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Tuple, List, Optional
+from typing import Tuple, List, Optional, Dict, Any
 
 from selenium.webdriver.chrome import webdriver
 from selenium.webdriver.common.by import By
@@ -8,11 +8,30 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from logger.logger import CustomLogger
+from logger.action_timings import timed_action
 
 
 class Product:
+    """Lightweight product record, the cart button handles are resolved only when a button is clicked"""
+
+    # Find the cart button of the inventory item with the given product name
+    _FIND_CART_BUTTON_SCRIPT = """
+        const [itemSelector, nameSelector, buttonSelector, productName] = arguments;
+
+        for (const item of document.querySelectorAll(itemSelector)) {
+            const name = item.querySelector(nameSelector);
+
+            if (name && name.innerText.trim() === productName) {
+                return item.querySelector(buttonSelector);
+            }
+        }
+
+        return null;
+    """
+
     def __init__(self,
                  logger: CustomLogger,
                  driver: webdriver,
@@ -21,8 +40,9 @@ class Product:
                  product_name: str,
                  product_description: str,
                  product_price: float,
-                 add_to_cart_button: WebElement = None,
-                 remove_from_cart_button: WebElement = None
+                 has_add_to_cart_button: bool = False,
+                 has_remove_from_cart_button: bool = False,
+                 selectors: Optional[Dict[str, str]] = None
                  ) -> None:
         self.logger: CustomLogger = logger
         self.driver: webdriver = driver
@@ -31,11 +51,30 @@ class Product:
         self.product_name: str = product_name
         self.product_description: str = product_description
         self.product_price: float = product_price
-        self.add_to_cart_button: Optional[WebElement] = add_to_cart_button
-        self.remove_from_cart_button: Optional[WebElement] = remove_from_cart_button
-
+        self.has_add_to_cart_button: bool = has_add_to_cart_button
+        self.has_remove_from_cart_button: bool = has_remove_from_cart_button
+        self.selectors: Dict[str, str] = selectors or {}
+
+    @property
+    def add_to_cart_button(self) -> Optional[WebElement]:
+        return self._find_cart_button(self.selectors['add_button']) if self.has_add_to_cart_button else None
+
+    @property
+    def remove_from_cart_button(self) -> Optional[WebElement]:
+        return self._find_cart_button(self.selectors['remove_button']) if self.has_remove_from_cart_button else None
+
+    def _find_cart_button(self, button_selector: str) -> Optional[WebElement]:
+        return self.driver.execute_script(
+            self._FIND_CART_BUTTON_SCRIPT,
+            self.selectors['item'],
+            self.selectors['name'],
+            button_selector,
+            self.product_name
+        )
+
+    @timed_action()
     def add_product_to_cart(self) -> None:
-        self.logger.debug(msg=f"Add the product with name {self.product_name} to the cart")
+        self.logger.debug("Add the product with name %s to the cart", self.product_name)
 
         try:
             add_to_cart_button: WebElement = WebDriverWait(self.driver, self.timeout).until(EC.element_to_be_clickable(self.add_to_cart_button))
@@ -46,8 +85,9 @@ class Product:
 
             assert False, f'Failed to add the product with name {self.product_name} to the cart'
 
+    @timed_action()
     def remove_product_from_cart(self) -> None:
-        self.logger.debug(msg=f"Remove the product with name {self.product_name} from the cart")
+        self.logger.debug("Remove the product with name %s from the cart", self.product_name)
 
         try:
             remove_from_cart_button: WebElement = WebDriverWait(self.driver, 20).until(EC.element_to_be_clickable(self.remove_from_cart_button))
@@ -64,8 +104,30 @@ class SortOption(Enum):
     PRICE_HIGH_LOW = 'hilo'
 
 class InventoryPages(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    # Collect every product's fields and cart button state in a single WebDriver command
+    _SNAPSHOT_SCRIPT = """
+        const selectors = arguments[0];
+        const text = (item, selector) => {
+            const element = item.querySelector(selector);
+            return element ? element.innerText.trim() : '';
+        };
+
+        return Array.from(document.querySelectorAll(selectors.item), item => {
+            const image = item.querySelector(selectors.image);
+
+            return {
+                name: text(item, selectors.name),
+                description: text(item, selectors.description),
+                price: text(item, selectors.price),
+                image: image ? image.src : '',
+                has_add_button: item.querySelector(selectors.add_button) !== null,
+                has_remove_button: item.querySelector(selectors.remove_button) !== null
+            };
+        });
+    """
+
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._inventory_item_locator: Tuple[str, str] = (By.CLASS_NAME, 'inventory_item')
         self._product_name_locator: Tuple[str, str] = (By.CLASS_NAME, 'inventory_item_name')
@@ -77,69 +139,60 @@ class InventoryPages(BasePage):
 
         self._product_sort_selector: Tuple[str, str] = (By.CLASS_NAME, 'product_sort_container')
 
+    @timed_action()
     def get_all_products(self) -> List[Product]:
-        self.logger.debug(msg=f"Get all products containers from inventory section with locator: {self._inventory_item_locator}")
-
-        products_list: List[Product] = []
+        self.logger.debug("Get all products snapshot from inventory section with locator: %s", self._inventory_item_locator)
+
+        selectors: Dict[str, str] = {
+            'item': self.to_css_selector(self._inventory_item_locator),
+            'name': self.to_css_selector(self._product_name_locator),
+            'description': self.to_css_selector(self._product_description_locator),
+            'price': self.to_css_selector(self._product_price_locator),
+            'image': self.to_css_selector(self._product_image_locator),
+            'add_button': self.to_css_selector(self._add_to_cart_button_locator),
+            'remove_button': self.to_css_selector(self._remove_from_cart_button_locator),
+        }
 
         try:
-            items: List[WebElement] = self.wait.until(method= EC.presence_of_all_elements_located(self._inventory_item_locator))
-
-            for item in items:
-                product: Product = self._parse_product(item)
+            # One script per poll returns the whole inventory, the first poll normally succeeds
+            snapshot: List[Dict[str, Any]] = self.wait.until(
+                method=lambda driver: driver.execute_script(self._SNAPSHOT_SCRIPT, selectors) or False
+            )
 
-                if product:
-                    products_list.append(product)
+            products_list: List[Product] = [self._parse_product(record=record, selectors=selectors) for record in snapshot]
 
         except Exception as e:
             self.logger.error(msg=f'Failed to load the products list due to Exception: \n{e}')
 
             assert False, f"Failed to load the products list"
 
-        return products_list
+        self.logger.debug("Parsed %s products from the inventory snapshot", len(products_list))
 
-    def _parse_product(self, item: WebElement) -> Optional[Product]:
-        self.logger.debug(msg=f"Parse the product object from the product element with name= {item.find_element(*self._product_name_locator).text}")
+        return products_list
 
+    def _parse_product(self, record: Dict[str, Any], selectors: Dict[str, str]) -> Product:
         try:
             return Product(
                 logger=self.logger,
                 driver=self.driver,
                 timeout=self.timeout,
-                product_image=self._get_product_image_url(item=item),
-                product_name=item.find_element(*self._product_name_locator).text,
-                product_description=item.find_element(*self._product_description_locator).text,
-                product_price=float(item.find_element(*self._product_price_locator).text.strip("$")),
-                add_to_cart_button= self._get_cart_button(item=item, locator=self._add_to_cart_button_locator),
-                remove_from_cart_button=self._get_cart_button(item=item, locator=self._remove_from_cart_button_locator),
+                product_image=record['image'] or "",
+                product_name=record['name'],
+                product_description=record['description'],
+                product_price=float(record['price'].strip("$")),
+                has_add_to_cart_button=record['has_add_button'],
+                has_remove_from_cart_button=record['has_remove_button'],
+                selectors=selectors
             )
 
         except Exception as e:
-            self.logger.error(msg=f"Failed to parse the product item due to the error: \n{e}")
+            self.logger.error(msg=f"Failed to parse the product item {record} due to the error: \n{e}")
 
             assert False, f"Failed to parse the product item"
 
+    @timed_action()
     def choice_product_selector_option(self, sort_option: SortOption) -> None:
-        self.logger.debug(msg=f"Choice the option {sort_option} from dropdown with locator: {self._product_sort_selector}")
+        self.logger.debug("Choice the option %s from dropdown with locator: %s", sort_option, self._product_sort_selector)
 
         sort_dropdown: Select = Select(self.wait.until(EC.visibility_of_element_located(self._product_sort_selector)))
         sort_dropdown.select_by_value(value=sort_option.value)
-
-    def _get_product_image_url(self, item: WebElement) -> str:
-        try:
-            WebDriverWait(self.driver, self.timeout).until(EC.visibility_of(item))
-
-            return item.find_element(*self._product_image_locator).get_attribute('src') or ""
-
-        except Exception as e:
-            self.logger.error(msg=f"Failed to get the image url for the item-id= {item.id} due to the error: \n{e}")
-
-            assert False, f"Failed to get the product image"
-
-
-    def _get_cart_button(self, item, locator) -> Optional[WebElement]:
-        try:
-            return item.find_element(*locator)
-
-        except Exception:
-            return None
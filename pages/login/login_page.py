@@ -1,34 +1,75 @@
-from typing import Tuple
+from typing import Tuple, Optional, Dict
 
 from selenium.webdriver.chrome import webdriver
 from selenium.webdriver.common.by import By
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
+from pages.login.storage_state import StorageState
 from logger.logger import CustomLogger
 
 
 class LoginPage(BasePage):
-    def __init__(self, driver: webdriver,logger:CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver,logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver,logger:CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver,logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._username_edittext: Tuple[str:str] = (By.ID, 'user-name')
         self._password_edittext: Tuple[str:str] = (By.ID, 'password')
         self._login_button: Tuple[str:str] = (By.ID, 'login-button')
         self._error_message_textfield: Tuple[str:str] = (By.CSS_SELECTOR, '#login_button_container > div > form > div.error-message-container.error > h3')
+        self._logged_in_cart_button: Tuple[str:str] = (By.CLASS_NAME, 'shopping_cart_link')
 
     def load(self) -> None:
-        self.logger.debug(msg=f"Load the login page")
+        self.logger.debug("Load the login page")
 
-        self.driver.get('https://www.saucedemo.com/')
+        self.navigate(self.url_for())
 
     def login(self, username: str,password: str) -> None:
-        self.logger.debug(msg=f"Login with username: {username}")
+        self.logger.debug("Login with username: %s", username)
 
-        self.clear_and_set_text(locator=self._username_edittext, text=username)
-        self.clear_and_set_text(locator=self._password_edittext, text=password)
-        self.click(locator=self._login_button)
+        with self.batch() as actions:
+            actions.clear_and_set_text(locator=self._username_edittext, text=username)
+            actions.clear_and_set_text(locator=self._password_edittext, text=password)
+            actions.click(locator=self._login_button)
+
+    def login_fast(self, username: str, storage_state: Optional[StorageState] = None) -> None:
+        """Authenticate without the login form by injecting the session state, then land on the inventory page"""
+        self.logger.debug("Fast login with username: %s", username)
+
+        # Cookies and localStorage can only be set while the browser is on the app origin
+        self.navigate(self.url_for())
+
+        if storage_state is None:
+            storage_state = StorageState(cookies=[{'name': 'session-username', 'value': username, 'path': '/'}], local_storage={})
+
+        for cookie in storage_state.cookies:
+            # Drop the expiry, the shared state may outlive the short session cookie the app sets
+            self.driver.add_cookie({key: value for key, value in cookie.items() if key != 'expiry'})
+
+        self.driver.execute_script(
+            "window.localStorage.clear();"
+            "for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }",
+            storage_state.local_storage
+        )
+
+        self.navigate(self.url_for('inventory.html'))
+
+    def capture_storage_state(self) -> StorageState:
+        self.logger.debug("Capture the session storage state")
+
+        local_storage: Dict[str, str] = self.driver.execute_script(
+            "return Object.fromEntries(Object.entries(window.localStorage));"
+        )
+
+        return StorageState(cookies=self.driver.get_cookies(), local_storage=local_storage)
+
+    def is_login_succeeded(self) -> bool:
+        """Wait for the inventory cart button or the login error, whichever shows up first"""
+        self.logger.debug("Wait for the login outcome")
+
+        return self.wait_for_first(locators=[self._logged_in_cart_button, self._error_message_textfield]) == self._logged_in_cart_button
 
     def get_error_message(self) -> str:
-        self.logger.debug(msg=f"Get the login error message")
+        self.logger.debug("Get the login error message")
 
         return self.get_text(locator=self._error_message_textfield)
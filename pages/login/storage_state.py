@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.files.atomic_write import atomic_write_text
+
+
+class StorageState:
+    """Snapshot of the app session: the browser cookies and the localStorage of the app origin"""
+
+    def __init__(self, cookies: List[Dict[str, Any]], local_storage: Dict[str, str]) -> None:
+        self.cookies: List[Dict[str, Any]] = cookies
+        self.local_storage: Dict[str, str] = local_storage
+
+    def save(self, path: Path) -> None:
+        atomic_write_text(path, json.dumps({'cookies': self.cookies, 'local_storage': self.local_storage}, indent=2))
+
+    @classmethod
+    def load(cls, path: Path) -> 'StorageState':
+        data: Dict[str, Any] = json.loads(path.read_text(encoding='utf-8'))
+
+        return cls(cookies=data['cookies'], local_storage=data['local_storage'])
+
+
+class StorageStateCache:
+    """The shared session state of a user, kept in memory and in a file every xdist worker of the run reads"""
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._state: Optional[StorageState] = None
+
+    def get(self) -> Optional[StorageState]:
+        if self._state is None and self.path.exists():
+            self._state = StorageState.load(self.path)
+
+        return self._state
+
+    def put(self, state: StorageState) -> None:
+        state.save(self.path)
+        self._state = state
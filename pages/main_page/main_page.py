@@ -1,12 +1,10 @@
 from typing import Tuple
 
-from selenium.common import TimeoutException
 from selenium.webdriver.chrome import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from pages.cart.cart_page import CartPage
 from pages.checkout.checkout_complete_page import CheckoutCompletePage
 from pages.checkout.checkout_information_page import CheckoutInformationPage
@@ -14,18 +12,19 @@ from pages.checkout.checkout_overview_page import CheckoutOverviewPage
 from pages.inventory.inventory_page import InventoryPages
 from pages.main_page.side_menu import SideMenu
 from logger.logger import CustomLogger
+from logger.action_timings import timed_action
 
 
 class MainPage(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
-        self.side_menu: SideMenu = SideMenu(driver=driver, logger=logger, timeout=timeout)
-        self.inventory_page: InventoryPages = InventoryPages(driver=driver, logger=logger, timeout=timeout)
-        self.cart_page: CartPage = CartPage(driver=driver, logger=logger, timeout=timeout)
-        self.checkout_information_page: CheckoutInformationPage = CheckoutInformationPage(driver=driver, logger=logger, timeout=timeout)
-        self.checkout_overview_page: CheckoutOverviewPage = CheckoutOverviewPage(driver=driver, logger=logger, timeout=timeout)
-        self.checkout_complete_page: CheckoutCompletePage = CheckoutCompletePage(driver=driver, logger=logger, timeout=timeout)
+        self.side_menu: SideMenu = SideMenu(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.inventory_page: InventoryPages = InventoryPages(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.cart_page: CartPage = CartPage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.checkout_information_page: CheckoutInformationPage = CheckoutInformationPage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.checkout_overview_page: CheckoutOverviewPage = CheckoutOverviewPage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.checkout_complete_page: CheckoutCompletePage = CheckoutCompletePage(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._cart_button: Tuple[str, str] = (By.CLASS_NAME, 'shopping_cart_link')
         self._cart_badge: Tuple[str, str] = (By.CLASS_NAME, 'shopping_cart_badge')
@@ -40,16 +39,19 @@ class MainPage(BasePage):
         self.logger.debug(msg="Click the cart button")
         self.click(self._cart_button)
 
+    @timed_action()
     def get_cart_count(self) -> int:
         self.logger.debug(msg="Get cart badge count")
         cart_count: int = 0
 
         try:
-            cart_badge = WebDriverWait(self.driver, self.timeout).until(EC.presence_of_element_located(self._cart_badge))
-            cart_count = int(cart_badge.text)
+            # The badge is absent for an empty cart, count it in the settled DOM instead of waiting for it
+            badge_count, badge_text = self.element_wait.count(locator=self._cart_badge, visible=False)
 
-        except TimeoutException:
-            self.logger.warning(msg="The Cart badge will not be displayed when the cart count is zero.")
+            if badge_count:
+                cart_count = int(badge_text)
+            else:
+                self.logger.debug(msg="The Cart badge will not be displayed when the cart count is zero.")
 
         except Exception as e:
             self.logger.error(msg=f"Failed to get the cart badge with locator {self._cart_badge} due to the error: \n{e}")
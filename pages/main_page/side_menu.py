@@ -3,13 +3,14 @@ from typing import Tuple
 from selenium.webdriver.chrome import webdriver
 from selenium.webdriver.common.by import By
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, DEFAULT_BASE_URL
+from pages.element_wait import WaitMode
 from logger.logger import CustomLogger
 
 
 class SideMenu(BasePage):
-    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10) -> None:
-        super().__init__(driver=driver, logger=logger, timeout=timeout)
+    def __init__(self, driver: webdriver, logger: CustomLogger, timeout: int = 10, base_url: str = DEFAULT_BASE_URL, wait_mode: WaitMode = WaitMode.OBSERVER) -> None:
+        super().__init__(driver=driver, logger=logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
         self._open_menu_button: Tuple[str, str] = (By.ID, 'react-burger-menu-btn')
         self._close_menu_button: Tuple[str, str] = (By.ID, 'react-burger-cross-btn')
@@ -19,13 +20,13 @@ class SideMenu(BasePage):
         self._reset_app_state: Tuple[str, str] = (By.ID, 'reset_sidebar_link')
 
     def open_menu(self) -> None:
-        self.logger.debug(msg=f"Open the main side menu")
+        self.logger.debug("Open the main side menu")
 
         if self.is_element_visible(locator=self._open_menu_button):
             self.click(self._open_menu_button)
 
     def close_menu(self) -> None:
-        self.logger.debug(msg=f"Close the main side menu")
+        self.logger.debug("Close the main side menu")
 
         if self.is_element_visible(locator=self._close_menu_button):
             self.click(self._close_menu_button)
@@ -33,12 +34,12 @@ class SideMenu(BasePage):
     def logout(self) -> None:
         self.open_menu()
 
-        self.logger.debug(msg=f"Click logout button")
+        self.logger.debug("Click logout button")
         self.click(self._logout)
 
     def reset_app_state(self) -> None:
         self.open_menu()
 
-        self.logger.debug(msg=f"Click reset app state button")
+        self.logger.debug("Click reset app state button")
         self.click(self._reset_app_state)
 
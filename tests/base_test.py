@@ -1,7 +1,9 @@
 import logging
+from typing import Dict
 
 import pytest
 
+from pages.element_wait import WaitMode
 from pages.login.login_page import LoginPage
 from pages.main_page.main_page import MainPage
 from utils.test_utils.TestHelper import TestHelper
@@ -11,26 +13,35 @@ from logger.logger import CustomLogger
 class BaseTest:
     @classmethod
     def setup_class(cls) -> None:
-        cls.logger = CustomLogger(name=f'{cls.__name__}')
-        cls.test_helper = TestHelper(logger=cls.logger)
-
-        cls.is_class_header_printed: bool = False
+        # One logger per browser, a browser matrix run keeps separate reports/<Class>/<browser> logs
+        cls.loggers: Dict[str, CustomLogger] = {}
+        cls.test_helpers: Dict[str, TestHelper] = {}
 
     @pytest.fixture(autouse=True)
-    def setup_and_teardown(self, browser, request):
-        self.logger.setup_handlers(
-            report_path=f'reports/{self.__class__.__name__}/{request.config.getoption("--browser")}',
-            level=self._get_console_level(request=request)
-        )
+    def setup_and_teardown(self, browser, browser_name, base_url, request):
+        if browser_name not in self.loggers:
+            logger = CustomLogger(name=f'{self.__class__.__name__}')
+            logger.setup_handlers(
+                report_path=f'reports/{self.__class__.__name__}/{browser_name}',
+                level=self._get_console_level(request=request),
+                queued=request.config.getoption("--log-queue")
+            )
+            logger.print_class_header(class_name=self.__class__.__name__)
+
+            self.loggers[browser_name] = logger
+            self.test_helpers[browser_name] = TestHelper(logger=logger)
 
-        if not self.is_class_header_printed:
-            self.logger.print_class_header(class_name=self.__class__.__name__)
-            self.__class__.is_class_header_printed = True
+        self.logger: CustomLogger = self.loggers[browser_name]
+        self.test_helper: TestHelper = self.test_helpers[browser_name]
+
+        self._request = request
 
         timeout: int = self._get_timeout(request=request)
-        self.login_page = LoginPage(driver=browser, logger=self.logger, timeout=timeout)
-        self.main_page = MainPage(driver=browser, logger=self.logger, timeout=timeout)
+        wait_mode: WaitMode = self._get_wait_mode(request=request)
+        self.login_page = LoginPage(driver=browser, logger=self.logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
+        self.main_page = MainPage(driver=browser, logger=self.logger, timeout=timeout, base_url=base_url, wait_mode=wait_mode)
 
+        self.logger.current_test = request.node.nodeid
         self.logger.print_test_header(test_name=request.node.name)
 
         yield
@@ -38,10 +49,28 @@ class BaseTest:
         self.logger.log_test_result(item=request.node)
         self.logger.print_test_footer(item=request.node)
 
+        # The pooled browser goes to the next test, reset it with scripts instead of UI cleanups
+        try:
+            self.main_page.clear_app_state()
+
+        finally:
+            self.logger.current_test = None
+
     @classmethod
     def teardown_class(cls):
+        for logger in cls.loggers.values():
+            logger.print_final_summary()
 
-        cls.logger.print_final_summary()
+    def _login_and_get_main_page(self) -> None:
+        self.logger.info(msg="Fast login with the shared session state - User: standard_user")
+        self.login_page.login_fast(username="standard_user", storage_state=self._request.getfixturevalue("storage_state"))
+
+        self.test_helper.assert_and_log(
+            condition=self.main_page.is_user_logged_in(),
+            error_msg="Login failed (expected success login)"
+        )
+
+        self.logger.info(msg="Login successful - proceeding with main page")
 
     def _get_console_level(self, request) -> int:
         console_level: str = request.config.getoption("--console-log-level")
@@ -69,3 +98,11 @@ class BaseTest:
 
         return int(timeout_str)
 
+    def _get_wait_mode(self, request) -> WaitMode:
+        wait_mode: str = request.config.getoption("--wait-mode")
+
+        try:
+            return WaitMode(wait_mode)
+
+        except ValueError:
+            raise ValueError(f"Unsupported wait mode: {wait_mode}, available wait modes are observer, poll, webdriver")
@@ -38,11 +38,6 @@ class TestCart(BaseTest):
         for product_name in added_products_name:
             self.test_helper.assert_in_list(product_name, cart_items_name_list, "Product")
 
-        self.logger.info(msg=f"Cleanup and remove all the added products from the cart")
-
-        self.main_page.cart_page.click_continue_shopping_button()
-        self.main_page.side_menu.reset_app_state()
-
         self.logger.info(f"Adding {cart_count} products to the cart page is passed")
 
     @pytest.mark.parametrize("cart_count", [3])
@@ -88,8 +83,7 @@ class TestCart(BaseTest):
             cart_item.remove_product_from_cart()
 
         self.logger.info(msg=f"Verify cart is now empty")
-        cart_items_list: List[CartItem] = self.main_page.cart_page.get_all_cart_items()
-        self.test_helper.assert_and_log(condition=len(cart_items_list) == 0, error_msg="The cart list is not empty")
+        self.test_helper.assert_and_log(condition=self.main_page.cart_page.is_cart_empty(), error_msg="The cart list is not empty")
 
 
         self.logger.info(msg=f"Return back the inventory page")
@@ -100,7 +94,7 @@ class TestCart(BaseTest):
 
         for product in product_list:
             self.test_helper.assert_and_log(
-                condition=product.remove_from_cart_button is None,
+                condition=not product.has_remove_from_cart_button,
                 error_msg=f"Product {product.product_name} should not have a remove button"
             )
 
@@ -108,24 +102,14 @@ class TestCart(BaseTest):
 
         self.logger.info(f"Adding and removing {cart_count} products to the cart from the cart is passed")
 
-    def _login_and_get_main_page(self) -> None:
-        self.logger.info(msg="Attempt login with credentials - User: secret_sauce")
-        self.login_page.load()
-        self.login_page.login(username="standard_user",password="secret_sauce")
-
-        self.test_helper.assert_and_log(
-            condition=self.main_page.is_user_logged_in(),
-            error_msg="Login failed (expected success login)"
-        )
-
-        self.logger.info(msg="Login successful - proceeding with main page")
-
     def _verify_cart_badge_count(self, count: int) -> None:
         self.logger.info(msg=f"Verify the cart count badge")
+        cart_count: int = self.main_page.get_cart_count()
+
         self.test_helper.assert_equal_and_log(
-            actual=self.main_page.get_cart_count(),
+            actual=cart_count,
             expected=count,
-            error_msg=f"The cart badge count is {self.main_page.get_cart_count()}, but it should be: {count}"
+            error_msg=f"The cart badge count is {cart_count}, but it should be: {count}"
         )
 
         if count == 0:
@@ -146,7 +130,7 @@ class TestCart(BaseTest):
 
         for index in range(cart_count):
             self.test_helper.assert_and_log(
-                condition=product_list[index].add_to_cart_button is not None,
+                condition=product_list[index].has_add_to_cart_button,
                 error_msg=f"The product {product_list[index].product_name} is already added to the cart"
             )
 
@@ -160,7 +144,7 @@ class TestCart(BaseTest):
         updated_product_list: List[Product] = self.main_page.inventory_page.get_all_products()
 
         for product in updated_product_list:
-            if product.product_name in added_products_name and product.remove_from_cart_button:
+            if product.product_name in added_products_name and product.has_remove_from_cart_button:
                 self.logger.info(msg=f"Remove the product {product.product_name} from the cart")
 
                 product.remove_product_from_cart()
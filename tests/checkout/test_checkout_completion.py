@@ -51,8 +51,7 @@ class TestCheckoutCompletion(BaseTest):
         self.logger.info(msg="Verify successful final checkout completion")
         self.test_helper.assert_and_log(
             condition=self.main_page.checkout_complete_page.is_the_checkout_completed(),
-            error_msg="Failed to submit checkout information",
-            pre_failure_hook=self._from_checkout_overview_cleanup_added_items
+            error_msg="Failed to submit checkout information"
         )
 
         self.logger.info(msg="Return back to the main inventory page")
@@ -65,18 +64,6 @@ class TestCheckoutCompletion(BaseTest):
 
         self.logger.info(msg="Verifying the checkout completion is passed")
 
-    def _login_and_get_main_page(self) -> None:
-        self.logger.info(msg="Attempt login with credentials - User: secret_sauce")
-        self.login_page.load()
-        self.login_page.login(username="standard_user", password="secret_sauce")
-
-        self.test_helper.assert_and_log(
-            condition=self.main_page.is_user_logged_in(),
-            error_msg="Login failed (expected success login)"
-        )
-
-        self.logger.info(msg="Login successful - proceeding with main page")
-
     def _add_products_to_the_cart(self, cart_count: int) -> List[str]:
         self.logger.info(msg=f"Add the first {cart_count} product to the cart")
         product_list: List[Product] = self.main_page.inventory_page.get_all_products()
@@ -89,7 +76,7 @@ class TestCheckoutCompletion(BaseTest):
 
         for index in range(cart_count):
             self.test_helper.assert_and_log(
-                condition=product_list[index].add_to_cart_button is not None,
+                condition=product_list[index].has_add_to_cart_button,
                 error_msg=f"The product {product_list[index].product_name} is already added to the cart"
             )
 
@@ -99,11 +86,6 @@ class TestCheckoutCompletion(BaseTest):
 
         return added_products_name
 
-    def _from_checkout_overview_cleanup_added_items(self):
-        self.logger.info(msg="Return back to the inventory and clean up the added items")
-        self.main_page.checkout_overview_page.click_cancel_button()
-        self.main_page.side_menu.reset_app_state()
-
     def _verify_checkout_items(self, expected_added_items_names_list: List[str]) -> None:
         self.logger.info(msg="Verify if all of the added items are in the checkout list")
 
@@ -129,7 +111,7 @@ class TestCheckoutCompletion(BaseTest):
         for product in product_list:
             if product.product_name not in added_items_names_list:
                 self.test_helper.assert_and_log(
-                    condition=product.add_to_cart_button is not None,
+                    condition=product.has_add_to_cart_button,
                     error_msg= f"The product {product.product_name} does not have the add to cart button",
                     soft=True
                 )
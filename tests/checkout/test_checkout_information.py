@@ -1,10 +1,9 @@
 from enum import Enum
 from typing import List
 
-import pytest
-
 from pages.inventory.inventory_page import Product
 from tests.base_test import BaseTest
+from utils.datasets.dataset_parametrize import dataset, DatasetRow
 
 
 class CheckoutStatus(Enum):
@@ -15,20 +14,18 @@ class CheckoutStatus(Enum):
 
 class TestCheckoutInformation(BaseTest):
 
-    @pytest.mark.parametrize("cart_count, first_name, last_name, postal_code, expected_result", [
-        (3, '', 'Ali', 'K1A', CheckoutStatus.MISSING_FIRST_NAME),
-        (3, 'Nour', '', 'K1A', CheckoutStatus.MISSING_LAST_NAME),
-        (3, 'Nour', 'Ali', '', CheckoutStatus.MISSING_POSTAL_CODE),
-        (3, 'Nour', 'Ali', 'K1A', CheckoutStatus.VALID_CHECKOUT),
-    ])
-    def test_checkout_information(
-            self,
-            cart_count: int,
-            first_name: str,
-            last_name: str,
-            postal_code: str,
-            expected_result: CheckoutStatus
-    ) -> None:
+    @dataset(
+        'tests/data/checkout_information.csv',
+        argname='checkout_information',
+        converters={'cart_count': int, 'expected_result': CheckoutStatus}
+    )
+    def test_checkout_information(self, checkout_information: DatasetRow) -> None:
+        cart_count: int = checkout_information.cart_count
+        first_name: str = checkout_information.first_name
+        last_name: str = checkout_information.last_name
+        postal_code: str = checkout_information.postal_code
+        expected_result: CheckoutStatus = checkout_information.expected_result
+
         self._login_and_get_main_page()
 
         self._add_products_to_the_cart(cart_count=cart_count)
@@ -50,35 +47,24 @@ class TestCheckoutInformation(BaseTest):
                 error_msg="Failed to submit checkout information"
             )
 
-            self._from_checkout_overview_cleanup_added_items()
-
         else:
             self.logger.info(msg="Verify failed checkout as expected and Verify error message matches expected")
+
+            self.test_helper.assert_and_log(
+                condition=not self.main_page.checkout_information_page.is_checkout_information_submitted(),
+                error_msg="Checkout information submitted when it should fail as expected"
+            )
+
             actual_message: str = self.main_page.checkout_information_page.get_error_message().strip()
 
             self.test_helper.verify_error_message(
                 actual_message=actual_message,
                 expected_error=expected_result,
-                allowed_enum=CheckoutStatus,
-                pre_failure_hook=self._from_checkout_information_cleanup_added_items
+                allowed_enum=CheckoutStatus
             )
 
-            self._from_checkout_information_cleanup_added_items()
-
         self.logger.info(msg="Filling the checkout information is passed")
 
-    def _login_and_get_main_page(self) -> None:
-        self.logger.info(msg="Attempt login with credentials - User: secret_sauce")
-        self.login_page.load()
-        self.login_page.login(username="standard_user", password="secret_sauce")
-
-        self.test_helper.assert_and_log(
-            condition=self.main_page.is_user_logged_in(),
-            error_msg="Login failed (expected success login)"
-        )
-
-        self.logger.info(msg="Login successful - proceeding with main page")
-
     def _add_products_to_the_cart(self, cart_count: int) -> None:
         self.test_helper.validate_positive_integer(value=cart_count, field_name="cart_count")
 
@@ -93,20 +79,9 @@ class TestCheckoutInformation(BaseTest):
 
         for index in range(cart_count):
             self.test_helper.assert_and_log(
-                condition=product_list[index].add_to_cart_button is not None,
+                condition=product_list[index].has_add_to_cart_button,
                 error_msg=f"The product {product_list[index].product_name} is already added to the cart"
             )
 
             self.logger.info(msg=f"Add the product {product_list[index].product_name} to the cart")
             product_list[index].add_product_to_cart()
-
-    def _from_checkout_information_cleanup_added_items(self):
-        self.logger.info(msg="Return back to the inventory and clean up the added items")
-        self.main_page.checkout_information_page.back_to_cart_page()
-        self.main_page.cart_page.click_continue_shopping_button()
-        self.main_page.side_menu.reset_app_state()
-
-    def _from_checkout_overview_cleanup_added_items(self):
-        self.logger.info(msg="Return back to the inventory and clean up the added items")
-        self.main_page.checkout_overview_page.click_cancel_button()
-        self.main_page.side_menu.reset_app_state()
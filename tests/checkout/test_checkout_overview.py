@@ -45,24 +45,11 @@ class TestCheckoutInformation(BaseTest):
         self._verify_checkout_items(expected_added_items_names_list=added_product_names_list)
         self._verify_subtotal_price()
         self._verify_total_price()
-        self._from_checkout_overview_cleanup_added_items()
 
         self.test_helper.raise_soft_failures()
 
         self.logger.info(msg="Verify the checkout Overview is passed")
 
-    def _login_and_get_main_page(self) -> None:
-        self.logger.info(msg="Attempt login with credentials - User: secret_sauce")
-        self.login_page.load()
-        self.login_page.login(username="standard_user", password="secret_sauce")
-
-        self.test_helper.assert_and_log(
-            condition=self.main_page.is_user_logged_in(),
-            error_msg="Login failed (expected success login)"
-        )
-
-        self.logger.info(msg="Login successful - proceeding with main page")
-
     def _add_products_to_the_cart(self, cart_count: int) -> List[str]:
         self.logger.info(msg=f"Add the first {cart_count} product to the cart")
         product_list: List[Product] = self.main_page.inventory_page.get_all_products()
@@ -75,7 +62,7 @@ class TestCheckoutInformation(BaseTest):
 
         for index in range(cart_count):
             self.test_helper.assert_and_log(
-                condition=product_list[index].add_to_cart_button is not None,
+                condition=product_list[index].has_add_to_cart_button,
                 error_msg=f"The product {product_list[index].product_name} is already added to the cart"
             )
 
@@ -85,11 +72,6 @@ class TestCheckoutInformation(BaseTest):
 
         return added_products_name
 
-    def _from_checkout_overview_cleanup_added_items(self):
-        self.logger.info(msg="Return back to the inventory and clean up the added items")
-        self.main_page.checkout_overview_page.click_cancel_button()
-        self.main_page.side_menu.reset_app_state()
-
     def _verify_checkout_items(self, expected_added_items_names_list: List[str]) -> None:
         self.logger.info(msg="Verify if all of the added items are in the checkout list")
 
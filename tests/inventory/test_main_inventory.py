@@ -1,20 +1,16 @@
 from typing import List
 
-import pytest
-
 from pages.inventory.inventory_page import Product, SortOption
 from tests.base_test import BaseTest
+from utils.datasets.dataset_parametrize import dataset, DatasetRow
 
 
 class TestMainInventory(BaseTest):
 
-    @pytest.mark.parametrize("sort_option", [
-        SortOption.NAME_A_Z,
-        SortOption.NAME_Z_A,
-        SortOption.PRICE_LOW_HIGH,
-        SortOption.PRICE_HIGH_LOW
-    ])
-    def test_products_sorting(self, sort_option: SortOption) -> None:
+    @dataset('tests/data/sort_options.csv', argname='sorting', converters={'sort_option': SortOption})
+    def test_products_sorting(self, sorting: DatasetRow) -> None:
+        sort_option: SortOption = sorting.sort_option
+
         self._login_and_get_main_page()
 
         self.logger.info(msg=f"Get the original products list and sort it according to the option: {sort_option}")
@@ -57,16 +53,3 @@ class TestMainInventory(BaseTest):
             )
 
         self.logger.info(f"Sort the products inventory with order {sort_option} is passed")
-
-    def _login_and_get_main_page(self) ->None:
-        self.logger.info(msg="Attempt login with credentials - User: standard_user")
-
-        self.login_page.load()
-        self.login_page.login(username="standard_user", password="secret_sauce")
-
-        self.test_helper.assert_and_log(
-            condition=self.main_page.is_user_logged_in(),
-            error_msg="Login failed (expected success login)"
-        )
-
-        self.logger.info(msg="Login successful - proceeding with main page")
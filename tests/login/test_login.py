@@ -1,9 +1,7 @@
 from enum import Enum
 
-import pytest
-
-
 from tests.base_test import BaseTest
+from utils.datasets.dataset_parametrize import dataset, DatasetRow
 
 
 class LoginStatus(Enum):
@@ -16,17 +14,11 @@ class LoginStatus(Enum):
 
 class TestLogin(BaseTest):
 
-    @pytest.mark.parametrize("username,password,expected_result", [
-        ("standard_user", "any_pass", LoginStatus.INVALID_CREDENTIALS),
-        ("locked_out_user", "secret_sauce", LoginStatus.LOCKED_USER),
-        ("", "", LoginStatus.MISSING_USERNAME),
-        ("standard_user", "", LoginStatus.MISSING_PASSWORD),
-        ("standard_user", "secret_sauce", LoginStatus.VALID_LOGIN),
-    ])
-    def test_login_page(self,
-                        username: str,
-                        password: str,
-                        expected_result: LoginStatus) -> None:
+    @dataset('tests/data/login_credentials.jsonl', argname='credentials', converters={'expected_result': LoginStatus})
+    def test_login_page(self, credentials: DatasetRow) -> None:
+        username: str = credentials.username
+        password: str = credentials.password
+        expected_result: LoginStatus = credentials.expected_result
 
         self.login_page.load()
 
@@ -36,7 +28,7 @@ class TestLogin(BaseTest):
         if expected_result == LoginStatus.VALID_LOGIN:
             self.logger.info("Verify successful login")
 
-            self.test_helper.assert_and_log(condition=self.main_page.is_user_logged_in(), error_msg="Login failed when it should success as expected")
+            self.test_helper.assert_and_log(condition=self.login_page.is_login_succeeded(), error_msg="Login failed when it should success as expected")
 
             self.logger.info("Login successful - proceeding with logout")
             self.main_page.side_menu.logout()
@@ -44,7 +36,7 @@ class TestLogin(BaseTest):
         else:
             self.logger.info("Verify failed login as expected")
 
-            self.test_helper.assert_and_log(condition=not self.main_page.is_user_logged_in(), error_msg="Login succeeded when it should fail as expected")
+            self.test_helper.assert_and_log(condition=not self.login_page.is_login_succeeded(), error_msg="Login succeeded when it should fail as expected")
 
             self.test_helper.verify_error_message(
                 actual_message=self.login_page.get_error_message().strip(),
@@ -0,0 +1,140 @@
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from utils.datasets.dataset_parametrize import Dataset, DatasetIndex, DatasetRow, convert
+
+
+class Status(Enum):
+    VALID = 'valid-login'
+    LOCKED = 'locked out'
+
+
+class FakeCache:
+    """The get/set pair of pytest's config.cache"""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+
+    def get(self, key: str, default: Any) -> Any:
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        # pytest stores the values as JSON, tuples come back as lists
+        self.values[key] = json.loads(json.dumps(value))
+
+
+def write_csv(tmp_path: Path, rows: List[str], bom: bool = True) -> Path:
+    path: Path = tmp_path / 'rows.csv'
+    path.write_bytes((b'\xef\xbb\xbf' if bom else b'') + '\r\n'.join(rows).encode('utf-8') + b'\r\n')
+
+    return path
+
+
+class TestConvert:
+
+    def test_enum_is_looked_up_by_name_then_by_value(self) -> None:
+        assert convert('LOCKED', Status) is Status.LOCKED
+        assert convert('valid-login', Status) is Status.VALID
+        assert convert(Status.VALID, Status) is Status.VALID
+        assert convert('3', int) == 3
+
+
+class TestDataset:
+
+    def test_csv_offsets_point_at_every_record(self, tmp_path: Path) -> None:
+        path: Path = write_csv(tmp_path, [
+            'id,name,note',
+            'first,Zoë,plain',
+            'second,"Multi, line","spans\r\ntwo lines"',
+            '',
+            'third,"Quoted ""name""",last',
+        ])
+        dataset = Dataset(path=path, converters={})
+
+        scanned = list(dataset.scan())
+
+        assert dataset.header == ['id', 'name', 'note']
+        assert [columns['id'] for _, columns in scanned] == ['first', 'second', 'third']
+        assert scanned[1][1]['note'] == 'spans\r\ntwo lines'
+
+        for offset, columns in reversed(scanned):
+            assert dataset.read(offset) == columns
+
+    def test_jsonl_offsets_skip_blank_lines(self, tmp_path: Path) -> None:
+        path: Path = tmp_path / 'rows.jsonl'
+        path.write_text('{"id": "a", "status": "VALID"}\n\n{"id": "b", "status": "locked out", "text": "é"}\n', encoding='utf-8')
+        dataset = Dataset(path=path, converters={'status': Status})
+
+        offsets: List[int] = [offset for offset, _ in dataset.scan()]
+
+        assert offsets == [0, 32]
+        assert dataset.read(offsets[1]) == {'id': 'b', 'status': Status.LOCKED, 'text': 'é'}
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            Dataset(path=tmp_path / 'rows.txt', converters={})
+
+    def test_row_reads_the_file_on_first_access(self, tmp_path: Path) -> None:
+        path: Path = write_csv(tmp_path, ['id,count', 'a,1', 'b,2'], bom=False)
+        dataset = Dataset(path=path, converters={'count': int})
+        offset: int = list(dataset.scan())[1][0]
+        row = DatasetRow(dataset=dataset, offset=offset, row_id='b')
+
+        assert row._columns is None
+        assert row.count == 2 and row['id'] == 'b'
+
+        with pytest.raises(AttributeError):
+            row.missing
+
+
+class TestDatasetIndex:
+
+    @pytest.fixture
+    def dataset(self, tmp_path: Path) -> Dataset:
+        path: Path = tmp_path / 'rows.jsonl'
+        path.write_text(''.join(json.dumps({'id': f'row-{index:03}', 'value': index}) + '\n' for index in range(200)), encoding='utf-8')
+
+        return Dataset(path=path, converters={})
+
+    def test_slice_and_generated_ids(self, dataset: Dataset) -> None:
+        _, entries = DatasetIndex(root_dir=dataset.path.parent).select(source=dataset, start=5, stop=8, sample=None, seed=0, id_column='missing')
+
+        assert [row_id for _, row_id in entries] == ['row6', 'row7', 'row8']
+
+    def test_sample_is_reproducible_and_in_file_order(self, dataset: Dataset) -> None:
+        index = DatasetIndex(root_dir=dataset.path.parent)
+
+        _, first = index.select(source=dataset, start=0, stop=None, sample=10, seed=7, id_column='id')
+        _, again = index.select(source=dataset, start=0, stop=None, sample=10, seed=7, id_column='id')
+        _, other = index.select(source=dataset, start=0, stop=None, sample=10, seed=8, id_column='id')
+
+        assert len(first) == 10 and len({row_id for _, row_id in first}) == 10
+        assert first == again and first != other
+        assert first == sorted(first)
+
+        for offset, row_id in first:
+            assert dataset.read(offset)['id'] == row_id
+
+    def test_cached_selection_is_not_scanned_again(self, dataset: Dataset, monkeypatch) -> None:
+        index = DatasetIndex(root_dir=dataset.path.parent, cache=FakeCache())
+        _, scanned = index.select(source=dataset, start=0, stop=None, sample=5, seed=0, id_column='id')
+
+        monkeypatch.setattr(dataset, 'scan', lambda: pytest.fail("The cached selection scanned the file"))
+        _, cached = index.select(source=dataset, start=0, stop=None, sample=5, seed=0, id_column='id')
+
+        assert cached == scanned
+
+    def test_changed_file_is_scanned_again(self, dataset: Dataset) -> None:
+        index = DatasetIndex(root_dir=dataset.path.parent, cache=FakeCache())
+        _, before = index.select(source=dataset, start=195, stop=None, sample=None, seed=0, id_column='id')
+
+        with dataset.path.open('a', encoding='utf-8') as dataset_file:
+            dataset_file.write(json.dumps({'id': 'row-200', 'value': 200}) + '\n')
+
+        _, after = index.select(source=dataset, start=195, stop=None, sample=None, seed=0, id_column='id')
+
+        assert len(before) == 5 and after[:5] == before and after[5][1] == 'row-200'
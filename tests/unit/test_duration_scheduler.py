@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from utils.scheduling.duration_scheduler import DurationScheduler, DurationStore, parse_shard
+
+
+class FakeCallSpec:
+    def __init__(self, params: Dict[str, str]) -> None:
+        self.params: Dict[str, str] = params
+
+
+class FakeItem:
+    """The two attributes of a pytest item the scheduler reads"""
+
+    def __init__(self, nodeid: str, browser_name: Optional[str] = None) -> None:
+        self.nodeid: str = nodeid
+
+        if browser_name:
+            self.callspec: FakeCallSpec = FakeCallSpec(params={'browser_name': browser_name})
+
+
+def create_store(tmp_path: Path, durations: Dict[str, float]) -> DurationStore:
+    path: Path = tmp_path / 'durations.json'
+    path.write_text(json.dumps(durations), encoding='utf-8')
+
+    return DurationStore(path=path)
+
+
+class TestParseShard:
+
+    @pytest.mark.parametrize('shard, expected', [('1/3', (1, 3)), (' 2 / 2 ', (2, 2)), ('10/12', (10, 12))])
+    def test_parse_valid_shard(self, shard: str, expected) -> None:
+        assert parse_shard(shard) == expected
+
+    @pytest.mark.parametrize('shard', ['0/3', '4/3', '1', '1/0', 'a/b', '1/3/5', ''])
+    def test_reject_invalid_shard(self, shard: str) -> None:
+        with pytest.raises(ValueError):
+            parse_shard(shard)
+
+
+class TestDurationStore:
+
+    def test_unknown_test_is_predicted_with_the_median(self, tmp_path: Path) -> None:
+        store: DurationStore = create_store(tmp_path, {'a': 1.0, 'b': 3.0, 'c': 8.0})
+
+        assert store.predict('a') == 1.0
+        assert store.predict('new') == 3.0
+
+    def test_save_blends_the_new_run_with_the_history(self, tmp_path: Path) -> None:
+        store: DurationStore = create_store(tmp_path, {'a': 4.0})
+        store.add('a', 1.0)
+        store.add('a', 1.0)
+        store.add('b', 5.0)
+        store.save()
+
+        assert json.loads(store.path.read_text(encoding='utf-8')) == {'a': 3.0, 'b': 5.0}
+        assert not list(tmp_path.glob('*.tmp'))
+
+
+class TestDurationScheduler:
+
+    def test_shards_are_balanced_longest_first(self, tmp_path: Path) -> None:
+        durations: Dict[str, float] = {'t.py::a': 5, 't.py::b': 4, 't.py::c': 3, 't.py::d': 3, 't.py::e': 2, 't.py::f': 1}
+        scheduler = DurationScheduler(store=create_store(tmp_path, durations))
+        items: List[FakeItem] = [FakeItem(nodeid) for nodeid in sorted(durations)]
+
+        first: List[str] = [item.nodeid for item in scheduler.shard(items, index=1, count=2)]
+        second: List[str] = [item.nodeid for item in scheduler.shard(items, index=2, count=2)]
+
+        assert first == ['t.py::a', 't.py::d', 't.py::f']
+        assert second == ['t.py::b', 't.py::c', 't.py::e']
+        assert sum(durations[nodeid] for nodeid in first) == sum(durations[nodeid] for nodeid in second) == 9
+
+    def test_shards_cover_every_test_once(self, tmp_path: Path) -> None:
+        scheduler = DurationScheduler(store=create_store(tmp_path, {f't.py::test_{index}': index % 4 + 1 for index in range(20)}))
+        items: List[FakeItem] = [FakeItem(f't.py::test_{index}') for index in range(23)]
+
+        sharded: List[str] = [item.nodeid for index in (1, 2, 3) for item in scheduler.shard(items, index=index, count=3)]
+
+        assert sorted(sharded) == sorted(item.nodeid for item in items)
+
+    def test_order_keeps_class_and_browser_groups_together(self, tmp_path: Path) -> None:
+        durations: Dict[str, float] = {
+            'a.py::A::fast[chrome]': 1, 'a.py::A::slow[chrome]': 2,
+            'a.py::A::fast[firefox]': 1, 'a.py::A::slow[firefox]': 9,
+            'b.py::B::one': 4,
+        }
+        scheduler = DurationScheduler(store=create_store(tmp_path, durations))
+        items: List[FakeItem] = [
+            FakeItem('a.py::A::fast[chrome]', 'chrome'),
+            FakeItem('a.py::A::fast[firefox]', 'firefox'),
+            FakeItem('b.py::B::one'),
+            FakeItem('a.py::A::slow[chrome]', 'chrome'),
+            FakeItem('a.py::A::slow[firefox]', 'firefox'),
+        ]
+
+        assert [item.nodeid for item in scheduler.order(items)] == [
+            'a.py::A::slow[firefox]', 'a.py::A::fast[firefox]',
+            'b.py::B::one',
+            'a.py::A::slow[chrome]', 'a.py::A::fast[chrome]',
+        ]
@@ -0,0 +1,107 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from utils.scheduling.impact_analysis import ChangeSet, definition_ranges
+
+MODULE_SOURCE = '''import os
+
+LIMIT = 3
+
+
+def first():
+    value = 1
+    return value
+
+
+class Page:
+    def open(self):
+        return 'open'
+
+    @property
+    def title(self):
+        return 'title'
+'''
+
+
+def git(root_dir: Path, *args: str) -> None:
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args], cwd=root_dir, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    git(tmp_path, 'init', '-q')
+    (tmp_path / 'module.py').write_text(MODULE_SOURCE, encoding='utf-8')
+    (tmp_path / 'removed.py').write_text('def gone():\n    return 0\n', encoding='utf-8')
+    (tmp_path / 'README.md').write_text('# Readme\n', encoding='utf-8')
+    git(tmp_path, 'add', '.')
+    git(tmp_path, 'commit', '-q', '-m', 'baseline')
+
+    return tmp_path
+
+
+def edit(path: Path, old: str, new: str) -> None:
+    path.write_text(path.read_text(encoding='utf-8').replace(old, new), encoding='utf-8')
+
+
+class TestDefinitionRanges:
+
+    def test_ranges_include_decorators_and_methods(self) -> None:
+        ranges = definition_ranges(MODULE_SOURCE)
+
+        assert ranges == {'first': (6, 8), 'Page.open': (12, 13), 'Page.title': (15, 17)}
+        assert definition_ranges(MODULE_SOURCE, include_classes=True)['Page'] == (11, 17)
+
+
+class TestChangeSet:
+
+    def test_function_body_change_maps_to_the_function(self, repo: Path) -> None:
+        edit(repo / 'module.py', "return 'open'", "return 'opened'")
+        edit(repo / 'module.py', "    @property\n", "    @property  # cached\n")
+
+        change_set = ChangeSet.since(git_ref='HEAD', root_dir=repo)
+
+        assert change_set.functions == {'module.py': {'Page.open', 'Page.title'}}
+        assert not change_set.whole_files and not change_set.global_change
+
+    def test_pure_deletion_inside_a_function(self, repo: Path) -> None:
+        edit(repo / 'module.py', '    value = 1\n', '')
+
+        assert ChangeSet.since(git_ref='HEAD', root_dir=repo).functions == {'module.py': {'first'}}
+
+    def test_module_level_change_marks_the_whole_file(self, repo: Path) -> None:
+        edit(repo / 'module.py', 'LIMIT = 3', 'LIMIT = 4')
+
+        change_set = ChangeSet.since(git_ref='HEAD', root_dir=repo)
+
+        assert change_set.whole_files == {'module.py'}
+        assert change_set.is_file_changed('module.py')
+
+    def test_untracked_and_deleted_files_are_whole_file_changes(self, repo: Path) -> None:
+        (repo / 'removed.py').unlink()
+        (repo / 'new_module.py').write_text('def added():\n    return 1\n', encoding='utf-8')
+
+        change_set = ChangeSet.since(git_ref='HEAD', root_dir=repo)
+
+        assert change_set.whole_files == {'removed.py', 'new_module.py'}
+        assert change_set.functions == {}
+        assert change_set.affects({'new_module.py': ['added']})
+
+    def test_docs_are_ignored_and_global_files_select_everything(self, repo: Path) -> None:
+        edit(repo / 'README.md', '# Readme', '# Read me')
+
+        assert not ChangeSet.since(git_ref='HEAD', root_dir=repo).global_change
+
+        (repo / 'conftest.py').write_text('import pytest\n', encoding='utf-8')
+
+        assert ChangeSet.since(git_ref='HEAD', root_dir=repo).global_change
+        assert not ChangeSet.since(git_ref='HEAD', root_dir=repo, ignored_names=('conftest.py',)).global_change
+
+    def test_affects_a_renamed_recorded_function(self, repo: Path) -> None:
+        edit(repo / 'module.py', 'def first():', 'def renamed():')
+
+        change_set = ChangeSet.since(git_ref='HEAD', root_dir=repo)
+
+        assert change_set.affects({'module.py': ['<module>', 'first']})
+        assert not change_set.affects({'module.py': ['<module>', 'Page.open']})
@@ -0,0 +1,56 @@
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from logger.log_renderer import LogRenderer
+from logger.logger import JsonLinesHandler
+
+
+def emit(handler: JsonLinesHandler, message: str, test: Optional[str], level: int = logging.INFO) -> None:
+    handler.emit(logging.makeLogRecord({'msg': message, 'levelno': level, 'levelname': logging.getLevelName(level), 'test': test, 'page': 'LoginPage'}))
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Path:
+    path: Path = tmp_path / 'log.jsonl'
+    handler = JsonLinesHandler(filename=path)
+
+    emit(handler, 'class header', test=None)
+    emit(handler, 'first step', test='test_a')
+    emit(handler, 'naïve “quoted” step', test='test_a', level=logging.DEBUG)
+    emit(handler, 'other test', test='test_b')
+    emit(handler, 'between tests', test=None)
+    emit(handler, 'back to a', test='test_a', level=logging.ERROR)
+    handler.close()
+
+    return path
+
+
+class TestJsonLinesIndex:
+
+    def test_index_spans_merge_consecutive_lines(self, log_path: Path) -> None:
+        renderer = LogRenderer(log_path=log_path)
+        lines: List[bytes] = log_path.read_bytes().splitlines(keepends=True)
+        ends: List[int] = [sum(len(line) for line in lines[:index + 1]) for index in range(len(lines))]
+
+        assert renderer.list_tests() == ['test_a', 'test_b']
+        assert renderer._read_index() == {'test_a': [[ends[0], ends[2]], [ends[4], ends[5]]], 'test_b': [[ends[2], ends[3]]]}
+
+    def test_render_seeks_only_the_test_lines(self, log_path: Path) -> None:
+        html: str = LogRenderer(log_path=log_path).render(test='test_a')
+
+        assert 'first step' in html and 'back to a' in html
+        assert 'naïve “quoted” step' in html
+        assert 'other test' not in html and 'class header' not in html and 'between tests' not in html
+
+    def test_render_filters_by_level(self, log_path: Path) -> None:
+        renderer = LogRenderer(log_path=log_path)
+
+        assert 'naïve' not in renderer.render(test='test_a', level=logging.INFO)
+        assert 'between tests' in renderer.render()
+
+    def test_unknown_test(self, log_path: Path) -> None:
+        with pytest.raises(KeyError):
+            LogRenderer(log_path=log_path).render(test='test_c')
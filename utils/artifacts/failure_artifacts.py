@@ -0,0 +1,120 @@
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium import webdriver
+
+
+class FailureCapture:
+    """The raw browser state fetched on the test thread when a test fails, encoded later by the writer"""
+
+    def __init__(self, nodeid: str, when: str) -> None:
+        self.nodeid: str = nodeid
+        self.when: str = when
+        self.url: Optional[str] = None
+        self.screenshot_base64: Optional[str] = None
+        self.page_source: Optional[str] = None
+        self.console: Optional[List[Dict[str, Any]]] = None
+        self.errors: List[str] = []
+
+    @classmethod
+    def fetch(cls, driver: webdriver, nodeid: str, when: str) -> 'FailureCapture':
+        capture = cls(nodeid=nodeid, when=when)
+
+        # Each fetch on its own, a dead page still yields whatever the browser can give
+        for field, fetch in (
+                ('url', lambda: driver.current_url),
+                ('screenshot_base64', driver.get_screenshot_as_base64),
+                ('page_source', lambda: driver.page_source),
+                ('console', lambda: driver.get_log('browser')),
+        ):
+            try:
+                setattr(capture, field, fetch())
+
+            except Exception as e:
+                capture.errors.append(f"{field}: {type(e).__name__}")
+
+        return capture
+
+
+class FailureArtifactWriter:
+    """Decodes, compresses and writes failure artifacts on a background thread.
+
+    The test thread only pays for the WebDriver fetches. Files are named by content hash, so the same
+    screenshot or page of many failures is written once, and the writer stops writing once the run
+    used ``max_total_bytes``. When ``max_pending`` captures are already queued new failures are not
+    captured at all, a burst of failures never stacks up memory or slows the test threads.
+    """
+
+    def __init__(self, max_total_bytes: int = 200 * 1024 * 1024, max_pending: int = 16) -> None:
+        self.max_total_bytes: int = max_total_bytes
+        self.total_bytes: int = 0
+
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='failure-artifacts')
+        self._pending: threading.BoundedSemaphore = threading.BoundedSemaphore(max_pending)
+
+    def capture(self, driver: webdriver, nodeid: str, when: str, output_dir: Path, on_written: Callable[[FailureCapture, Dict[str, str]], None]) -> bool:
+        """Fetch the browser state and queue it, False when the queue is full and nothing was captured"""
+        if not self._pending.acquire(blocking=False):
+            return False
+
+        try:
+            capture: FailureCapture = FailureCapture.fetch(driver=driver, nodeid=nodeid, when=when)
+            self._executor.submit(self._write, capture, output_dir, on_written)
+
+        except Exception:
+            self._pending.release()
+            raise
+
+        return True
+
+    def close(self) -> None:
+        """Wait for the queued artifacts to be written"""
+        self._executor.shutdown(wait=True)
+
+    def _write(self, capture: FailureCapture, output_dir: Path, on_written: Callable[[FailureCapture, Dict[str, str]], None]) -> None:
+        try:
+            files: Dict[str, Tuple[str, Optional[bytes]]] = {
+                'screenshot': ('png', base64.b64decode(capture.screenshot_base64) if capture.screenshot_base64 else None),
+                'page source': ('html.gz', gzip.compress(capture.page_source.encode('utf-8'), mtime=0) if capture.page_source is not None else None),
+                'console': ('console.json.gz', gzip.compress(json.dumps(capture.console).encode('utf-8'), mtime=0) if capture.console else None),
+            }
+            links: Dict[str, str] = {}
+
+            for name, (suffix, data) in files.items():
+                if data is None:
+                    continue
+
+                file_name: Optional[str] = self._store(data=data, suffix=suffix, output_dir=output_dir)
+
+                if file_name is None:
+                    capture.errors.append(f"{name}: disk budget of {self.max_total_bytes} bytes used up")
+                    continue
+
+                links[name] = f"{output_dir.name}/{file_name}"
+
+            on_written(capture, links)
+
+        finally:
+            self._pending.release()
+
+    def _store(self, data: bytes, suffix: str, output_dir: Path) -> Optional[str]:
+        file_name: str = f"{hashlib.sha256(data).hexdigest()[:16]}.{suffix}"
+        path: Path = output_dir / file_name
+
+        if path.exists():
+            return file_name
+
+        if self.total_bytes + len(data) > self.max_total_bytes:
+            return None
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.total_bytes += len(data)
+
+        return file_name
@@ -0,0 +1,236 @@
+import csv
+import hashlib
+import json
+import random
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, IO
+
+import pytest
+
+DATASET_FORMATS: Tuple[str, ...] = ('.jsonl', '.csv')
+
+
+def dataset(
+        path: str,
+        argname: str = 'row',
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+        sample: Optional[int] = None,
+        seed: int = 0,
+        id_column: str = 'id'
+):
+    """Parametrize a test with the rows of a JSONL or CSV dataset, one test per row.
+
+    ``path`` is relative to the repository root. The test receives every row as ``argname``, a DatasetRow
+    that reads its record from the file only when the test touches it. ``converters`` map a column to a
+    callable or an Enum class (looked up by member name, then by value), ``start``/``stop`` slice the rows
+    and ``sample`` keeps a reproducible random subset of the slice (same ``seed``, same rows on every worker).
+    The test id is the ``id_column`` of the row, or its row number.
+    """
+    return pytest.mark.dataset(
+        path=path,
+        argname=argname,
+        converters=converters or {},
+        start=start,
+        stop=stop,
+        sample=sample,
+        seed=seed,
+        id_column=id_column
+    )
+
+
+def convert(value: Any, converter: Callable[[Any], Any]) -> Any:
+    if isinstance(converter, type) and issubclass(converter, Enum):
+        if isinstance(value, converter):
+            return value
+
+        try:
+            return converter[value]
+
+        except KeyError:
+            return converter(value)
+
+    return converter(value)
+
+
+class Dataset:
+    """A JSONL or CSV file read record by record from byte offsets, so a row costs nothing until a test uses it"""
+
+    def __init__(self, path: Path, converters: Dict[str, Callable[[Any], Any]], header: Optional[List[str]] = None) -> None:
+        if path.suffix not in DATASET_FORMATS:
+            raise ValueError(f"Unsupported dataset format: {path.name}, supported formats are {', '.join(DATASET_FORMATS)}")
+
+        self.path: Path = path
+        self.converters: Dict[str, Callable[[Any], Any]] = converters
+        self.header: Optional[List[str]] = header
+
+    def scan(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Stream the byte offset and raw columns of every record, one record in memory at a time"""
+        with self.path.open('rb') as dataset_file:
+            if self.path.suffix == '.jsonl':
+                while True:
+                    offset: int = dataset_file.tell()
+                    line: bytes = dataset_file.readline()
+
+                    if not line:
+                        return
+
+                    if line.strip():
+                        yield offset, json.loads(line)
+
+            else:
+                lines: Iterator[str] = self._decoded_lines(dataset_file)
+                reader = csv.reader(lines)
+                self.header = next(reader, None)
+
+                while True:
+                    # The reader pulls the lines of one record at a time, a quoted field may span lines
+                    offset = dataset_file.tell()
+                    values: Optional[List[str]] = next(reader, None)
+
+                    if values is None:
+                        return
+
+                    if values:
+                        yield offset, dict(zip(self.header, values))
+
+    def read(self, offset: int) -> Dict[str, Any]:
+        with self.path.open('rb') as dataset_file:
+            dataset_file.seek(offset)
+
+            if self.path.suffix == '.jsonl':
+                columns: Dict[str, Any] = json.loads(dataset_file.readline())
+
+            else:
+                columns = dict(zip(self.header, next(csv.reader(self._decoded_lines(dataset_file)))))
+
+        return {name: convert(value, self.converters[name]) if name in self.converters else value for name, value in columns.items()}
+
+    @staticmethod
+    def _decoded_lines(dataset_file: IO[bytes]) -> Iterator[str]:
+        for line in iter(dataset_file.readline, b''):
+            yield line.decode('utf-8-sig')
+
+
+class DatasetRow:
+    """One dataset row, its columns read from the file and converted on first access"""
+
+    def __init__(self, dataset: Dataset, offset: int, row_id: str) -> None:
+        self._dataset: Dataset = dataset
+        self._offset: int = offset
+        self._row_id: str = row_id
+        self._columns: Optional[Dict[str, Any]] = None
+
+    def columns(self) -> Dict[str, Any]:
+        if self._columns is None:
+            self._columns = self._dataset.read(self._offset)
+
+        return self._columns
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        try:
+            return self.columns()[name]
+
+        except KeyError:
+            raise AttributeError(f"Dataset {self._dataset.path.name} has no column {name}") from None
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns()[name]
+
+    def __repr__(self) -> str:
+        return f"DatasetRow({self._dataset.path.name}:{self._row_id})"
+
+
+class DatasetIndex:
+    """The selected rows of a dataset (byte offset and test id), cached between runs until the file changes.
+
+    A cached collection never opens the file, a changed file (size or mtime) or selection is scanned again.
+    Sampling keeps a reservoir of the sample size, so a large dataset is never held in memory during the scan.
+    """
+
+    CACHE_VERSION: int = 1
+
+    def __init__(self, root_dir: Path, cache=None) -> None:
+        self.root_dir: Path = root_dir
+        self.cache = cache
+
+    def parametrize(self, metafunc, marker, sample_override: int = 0) -> None:
+        options: Dict[str, Any] = dict(marker.kwargs)
+        sample: Optional[int] = sample_override or options['sample']
+        path: Path = self.root_dir / options['path']
+        source: Dataset = Dataset(path=path, converters=options['converters'])
+
+        header, entries = self.select(
+            source=source,
+            start=options['start'],
+            stop=options['stop'],
+            sample=sample,
+            seed=options['seed'],
+            id_column=options['id_column']
+        )
+        source.header = header
+
+        metafunc.parametrize(
+            options['argname'],
+            [DatasetRow(dataset=source, offset=offset, row_id=row_id) for offset, row_id in entries],
+            ids=[row_id for _, row_id in entries]
+        )
+
+    def select(
+            self,
+            source: Dataset,
+            start: int,
+            stop: Optional[int],
+            sample: Optional[int],
+            seed: int,
+            id_column: str
+    ) -> Tuple[Optional[List[str]], List[Tuple[int, str]]]:
+        if not source.path.exists():
+            raise ValueError(f"Dataset not found: {source.path}")
+
+        stat = source.path.stat()
+        selection: str = json.dumps([str(source.path), start, stop, sample, seed, id_column])
+        cache_key: str = f"datasets/{hashlib.sha1(selection.encode('utf-8')).hexdigest()[:16]}"
+        fingerprint: List[int] = [self.CACHE_VERSION, stat.st_size, stat.st_mtime_ns]
+
+        cached: Optional[Dict[str, Any]] = self.cache.get(cache_key, None) if self.cache else None
+
+        if cached and cached.get('fingerprint') == fingerprint:
+            return cached['header'], [(offset, row_id) for offset, row_id in cached['entries']]
+
+        entries: List[Tuple[int, str]] = []
+        rng: random.Random = random.Random(seed)
+        seen: int = 0
+
+        for index, (offset, columns) in enumerate(source.scan()):
+            if index < start:
+                continue
+
+            if stop is not None and index >= stop:
+                break
+
+            entry: Tuple[int, str] = (offset, str(columns.get(id_column) or f'row{index + 1}'))
+            seen += 1
+
+            if not sample or len(entries) < sample:
+                entries.append(entry)
+                continue
+
+            # Reservoir sampling, every row of the slice has the same chance to be kept
+            slot: int = rng.randrange(seen)
+
+            if slot < sample:
+                entries[slot] = entry
+
+        # Run the sample in file order, so the test ids read in the same order as the dataset
+        entries.sort()
+
+        if self.cache:
+            self.cache.set(cache_key, {'fingerprint': fingerprint, 'header': source.header, 'entries': entries})
+
+        return source.header, entries
@@ -0,0 +1,124 @@
+import threading
+from typing import Optional
+
+from selenium import webdriver
+from selenium.common import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.driver.driver_resolver import DriverResolver
+from utils.driver.launch_profiles import LaunchProfile, LAUNCH_PROFILES
+
+
+SUPPORTED_BROWSERS = ('chrome', 'edge', 'firefox')
+
+
+class DriverFactory:
+    """Builds new WebDriver sessions for a single browser type"""
+
+    def __init__(
+            self,
+            browser_name: str,
+            headless: bool = False,
+            resolver: Optional[DriverResolver] = None,
+            driver_path: Optional[str] = None,
+            profile: Optional[LaunchProfile] = None
+    ) -> None:
+        if browser_name not in SUPPORTED_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser_name}, available browsers are chrome, edge, and firefox")
+
+        self.browser_name: str = browser_name
+        self.headless: bool = headless
+        self.resolver: DriverResolver = resolver or DriverResolver()
+        self._driver_path: Optional[str] = driver_path
+        self.profile: LaunchProfile = profile or LAUNCH_PROFILES['default']
+
+        self._resolve_lock: threading.Lock = threading.Lock()
+        # An explicit --driver-path is the user's choice, a failing session does not replace it
+        self._re_resolved: bool = driver_path is not None
+
+    @property
+    def driver_path(self) -> str:
+        """Resolved once per factory, every replacement driver of the pool reuses the same binary"""
+        # Sessions launched in parallel (pre-warm, load shoppers) wait for one resolution instead of each downloading
+        with self._resolve_lock:
+            if self._driver_path is None:
+                self._driver_path = self.resolver.resolve(self.browser_name)
+
+        return self._driver_path
+
+    def __call__(self) -> WebDriver:
+        return self.create()
+
+    def create(self) -> WebDriver:
+        driver_path: str = self.driver_path
+
+        try:
+            driver: WebDriver = self._launch(driver_path)
+
+        except SessionNotCreatedException:
+            # A browser updated since the manifest entry was checked rejects the pinned driver
+            if not self._re_resolve(stale_path=driver_path):
+                raise
+
+            driver = self._launch(self.driver_path)
+
+        try:
+            self.profile.apply_session(driver)
+
+        except Exception:
+            driver.quit()
+            raise
+
+        return driver
+
+    def _re_resolve(self, stale_path: str) -> bool:
+        """Resolve the driver again without the manifest entry, once per factory and never for a --driver-path binary"""
+        with self._resolve_lock:
+            if self._driver_path != stale_path:
+                # A parallel launch already replaced the stale path
+                return True
+
+            if self._re_resolved:
+                return False
+
+            self._re_resolved = True
+            self.resolver.invalidate(self.browser_name)
+            self._driver_path = self.resolver.resolve(self.browser_name)
+
+        return True
+
+    def _launch(self, driver_path: str) -> WebDriver:
+        if self.browser_name == "chrome":
+            options = ChromeOptions()
+
+            if self.headless:
+                options.add_argument("--headless")
+
+            self.profile.apply_chromium(options)
+
+            return webdriver.Chrome(service=ChromeService(driver_path), options=options)
+
+        if self.browser_name == "edge":
+            options = EdgeOptions()
+
+            if self.headless:
+                options.add_argument("--headless")
+
+            self.profile.apply_chromium(options)
+
+            return webdriver.Edge(service=EdgeService(driver_path), options=options)
+
+        options = FirefoxOptions()
+
+        if self.headless:
+            options.add_argument("--headless")
+
+        self.profile.apply_firefox(options)
+
+        return webdriver.Firefox(service=FirefoxService(driver_path), options=options)
@@ -0,0 +1,301 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, IO
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+class HostSlots:
+    """Caps how many browsers run at the same time on this host.
+
+    Every running browser holds an OS lock on one of ``max_slots`` slot files. The locks are shared
+    between all the pytest processes on the host (xdist workers included) and are released by the OS
+    if a process dies, so a crashed worker never leaks its slot.
+    """
+
+    def __init__(self, max_slots: int, slots_dir: Optional[Path] = None, timeout: float = 300, poll_interval: float = 0.5) -> None:
+        if max_slots < 1:
+            raise ValueError(f"Invalid max browsers: {max_slots}, should be greater than 0")
+
+        self.max_slots: int = max_slots
+        self.slots_dir: Path = slots_dir or Path(tempfile.gettempdir()) / 'sauce-demo-browser-slots'
+        self.timeout: float = timeout
+        self.poll_interval: float = poll_interval
+
+        self.slots_dir.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self, make_room: Optional[Callable[[], bool]] = None) -> IO:
+        """Wait for a free slot; ``make_room`` may free one of this process's slots (an idle driver) when all are busy"""
+        deadline: float = time.monotonic() + self.timeout
+
+        while True:
+            for index in range(self.max_slots):
+                slot_file: IO = open(self.slots_dir / f'slot-{index}.lock', 'a+')
+
+                if self._try_lock(slot_file):
+                    return slot_file
+
+                slot_file.close()
+
+            if make_room and make_room():
+                continue
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No free browser slot after {self.timeout} seconds, all {self.max_slots} slots are busy")
+
+            time.sleep(self.poll_interval)
+
+    def release(self, slot_file: IO) -> None:
+        try:
+            self._unlock(slot_file)
+
+        finally:
+            slot_file.close()
+
+    @staticmethod
+    def _try_lock(slot_file: IO) -> bool:
+        try:
+            if sys.platform == 'win32':
+                slot_file.seek(0)
+                msvcrt.locking(slot_file.fileno(), msvcrt.LK_NBLCK, 1)
+
+            else:
+                fcntl.flock(slot_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            return True
+
+        except OSError:
+            return False
+
+    @staticmethod
+    def _unlock(slot_file: IO) -> None:
+        if sys.platform == 'win32':
+            slot_file.seek(0)
+            msvcrt.locking(slot_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        else:
+            fcntl.flock(slot_file.fileno(), fcntl.LOCK_UN)
+
+
+class DriverPool:
+    """Leases health-checked WebDriver sessions to tests and reuses them across tests.
+
+    A session that fails the health check when it is leased is quit and replaced by a fresh one,
+    so a crashed or hung browser costs one restart instead of the rest of the worker's tests.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], WebDriver],
+            host_slots: HostSlots,
+            health_check_timeout: float = 5,
+            max_create_attempts: int = 2,
+            make_room: Optional[Callable[[], bool]] = None
+    ) -> None:
+        self.factory: Callable[[], WebDriver] = factory
+        self.host_slots: HostSlots = host_slots
+        self.health_check_timeout: float = health_check_timeout
+        self.max_create_attempts: int = max_create_attempts
+        self.make_room: Optional[Callable[[], bool]] = make_room
+
+        self._idle: List[WebDriver] = []
+        self._slots: Dict[int, IO] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._condition: threading.Condition = threading.Condition(self._lock)
+        self._warming: int = 0
+        self._warm_threads: List[threading.Thread] = []
+        self._closed: bool = False
+        self._prewarm_on_lease: int = 0
+
+    def lease(self) -> WebDriver:
+        with self._lock:
+            prewarm_count, self._prewarm_on_lease = self._prewarm_on_lease, 0
+
+        if prewarm_count:
+            self.prewarm(prewarm_count)
+
+        while True:
+            with self._condition:
+                # A session launching in the background is closer to ready than a new launch
+                while not self._idle and self._warming:
+                    self._condition.wait()
+
+                driver: Optional[WebDriver] = self._idle.pop() if self._idle else None
+
+            if driver is None:
+                return self._create()
+
+            if self.is_healthy(driver):
+                return driver
+
+            self.discard(driver)
+
+    def release(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._idle.append(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """Quit the driver and give its host slot back"""
+        quitter = threading.Thread(target=self._quit_quietly, args=(driver,), daemon=True)
+        quitter.start()
+        quitter.join(timeout=self.health_check_timeout)
+
+        with self._lock:
+            slot_file: Optional[IO] = self._slots.pop(id(driver), None)
+
+        if slot_file:
+            self.host_slots.release(slot_file)
+
+    def prewarm(self, count: int) -> None:
+        """Launch ``count`` sessions on a background thread, so they start while pytest is still collecting"""
+        if count < 1:
+            return
+
+        with self._lock:
+            self._warming += count
+
+        warmer = threading.Thread(target=self._warm, args=(count,), daemon=True, name='driver-pool-prewarm')
+        self._warm_threads.append(warmer)
+        warmer.start()
+
+    def prewarm_on_first_lease(self, count: int) -> None:
+        """Pre-warm ``count`` sessions once this browser type is first leased, for workers that may never run it"""
+        with self._lock:
+            self._prewarm_on_lease = count
+
+    def close(self, warm_timeout: float = 60) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for driver in idle:
+            self.discard(driver)
+
+        # A session still launching is discarded by its warm thread, wait so no browser outlives the run
+        for warmer in self._warm_threads:
+            warmer.join(timeout=warm_timeout)
+
+    def discard_idle(self) -> bool:
+        """Quit one idle driver to give its host slot to another pool, False if nothing is idle"""
+        with self._lock:
+            driver: Optional[WebDriver] = self._idle.pop(0) if self._idle else None
+
+        if driver is None:
+            return False
+
+        self.discard(driver)
+
+        return True
+
+    def _warm(self, count: int) -> None:
+        for _ in range(count):
+            try:
+                driver: Optional[WebDriver] = self._create()
+
+            except Exception:
+                # The lease that needs it launches again and reports the error on the test thread
+                driver = None
+
+            with self._condition:
+                self._warming -= 1
+
+                if driver is not None and not self._closed:
+                    self._idle.append(driver)
+                    driver = None
+
+                self._condition.notify_all()
+
+            if driver is not None:
+                self.discard(driver)
+
+    def is_healthy(self, driver: WebDriver) -> bool:
+        """Ping the browser in a side thread so a hung session cannot block the test thread"""
+        result: Dict[str, bool] = {'healthy': False}
+
+        def ping() -> None:
+            try:
+                result['healthy'] = driver.execute_script("return 1;") == 1
+
+            except Exception:
+                result['healthy'] = False
+
+        pinger = threading.Thread(target=ping, daemon=True)
+        pinger.start()
+        pinger.join(timeout=self.health_check_timeout)
+
+        return not pinger.is_alive() and result['healthy']
+
+    def _create(self) -> WebDriver:
+        slot_file: IO = self.host_slots.acquire(make_room=self.make_room)
+        last_error: Optional[Exception] = None
+
+        for _ in range(self.max_create_attempts):
+            try:
+                driver: WebDriver = self.factory()
+
+            except Exception as e:
+                last_error = e
+                continue
+
+            with self._lock:
+                self._slots[id(driver)] = slot_file
+
+            return driver
+
+        self.host_slots.release(slot_file)
+
+        raise RuntimeError(f"Failed to start a browser session after {self.max_create_attempts} attempts (pid {os.getpid()})") from last_error
+
+    @staticmethod
+    def _quit_quietly(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+
+        except Exception:
+            pass
+
+
+class DriverPools:
+    """One DriverPool per browser type, all sharing the host slots of the browser matrix.
+
+    When every slot is busy, a pool that needs a new browser evicts an idle driver of another
+    browser type of this process, so idle sessions never starve the browsers that have work.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], WebDriver]], host_slots: HostSlots) -> None:
+        self.host_slots: HostSlots = host_slots
+        self.pools: Dict[str, DriverPool] = {
+            browser_name: DriverPool(factory=factory, host_slots=host_slots, make_room=self._make_room_for(browser_name))
+            for browser_name, factory in factories.items()
+        }
+
+    def get(self, browser_name: str) -> DriverPool:
+        return self.pools[browser_name]
+
+    def prewarm(self, count: int, browser_names: Optional[List[str]] = None) -> None:
+        for name, pool in self.pools.items():
+            if browser_names is None or name in browser_names:
+                pool.prewarm(count)
+
+    def prewarm_on_first_lease(self, count: int) -> None:
+        for pool in self.pools.values():
+            pool.prewarm_on_first_lease(count)
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            pool.close()
+
+    def _make_room_for(self, browser_name: str) -> Callable[[], bool]:
+        def make_room() -> bool:
+            return any(pool.discard_idle() for name, pool in self.pools.items() if name != browser_name)
+
+        return make_room
@@ -0,0 +1,108 @@
+import json
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.firefox import GeckoDriverManager as FirefoxDriverManager
+
+from utils.files.atomic_write import atomic_write_text
+
+
+DEFAULT_MANIFEST_PATH = Path.home() / '.wdm' / 'driver-manifest.json'
+
+
+class DriverResolver:
+    """Resolves the driver binary of a browser through a local manifest before touching webdriver-manager.
+
+    The manifest maps every browser name to the installed browser version and the pinned driver path.
+    A fresh entry (checked within ``max_age`` seconds) is used as is, an expired entry is revalidated with a
+    local browser version probe, and only a changed browser version falls back to ``*DriverManager().install()``.
+    In offline mode the manifest entry is used regardless of its age and the network is never touched.
+    A browser update within ``max_age`` is caught by the session that fails to start, see ``invalidate``.
+    """
+
+    _BROWSER_TYPES: Dict[str, str] = {
+        'chrome': ChromeType.GOOGLE,
+        'edge': ChromeType.MSEDGE,
+        'firefox': 'firefox',
+    }
+
+    def __init__(self, manifest_path: Path = DEFAULT_MANIFEST_PATH, offline: bool = False, max_age: float = 24 * 60 * 60) -> None:
+        self.manifest_path: Path = manifest_path
+        self.offline: bool = offline
+        self.max_age: float = max_age
+
+    def resolve(self, browser_name: str) -> str:
+        entry: Optional[Dict[str, Any]] = self._read_manifest().get(browser_name)
+
+        if entry and Path(entry['driver_path']).is_file():
+            if self.offline or time.time() - entry['checked_at'] < self.max_age:
+                return entry['driver_path']
+
+            browser_version: Optional[str] = self._get_browser_version(browser_name)
+
+            if browser_version and browser_version == entry['browser_version']:
+                self._write_entry(browser_name=browser_name, browser_version=browser_version, driver_path=entry['driver_path'])
+
+                return entry['driver_path']
+
+        elif self.offline:
+            raise FileNotFoundError(
+                f"No cached {browser_name} driver in {self.manifest_path}, run once online or pass --driver-path"
+            )
+
+        else:
+            browser_version = self._get_browser_version(browser_name)
+
+        driver_path: str = self._install(browser_name)
+        self._write_entry(browser_name=browser_name, browser_version=browser_version, driver_path=driver_path)
+
+        return driver_path
+
+    def invalidate(self, browser_name: str) -> None:
+        """Drop the manifest entry of a driver that failed to start a session, the next resolve probes the browser again"""
+        manifest: Dict[str, Dict[str, Any]] = self._read_manifest()
+
+        if manifest.pop(browser_name, None) is not None:
+            self._write_manifest(manifest)
+
+    def _get_browser_version(self, browser_name: str) -> Optional[str]:
+        return OperationSystemManager().get_browser_version_from_os(self._BROWSER_TYPES[browser_name])
+
+    @staticmethod
+    def _install(browser_name: str) -> str:
+        if browser_name == 'chrome':
+            return ChromeDriverManager().install()
+
+        if browser_name == 'edge':
+            return EdgeChromiumDriverManager().install()
+
+        return FirefoxDriverManager().install()
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding='utf-8'))
+
+        except (OSError, ValueError):
+            return {}
+
+    def _write_entry(self, browser_name: str, browser_version: Optional[str], driver_path: str) -> None:
+        manifest: Dict[str, Dict[str, Any]] = self._read_manifest()
+        manifest[browser_name] = {
+            'browser_version': browser_version,
+            'driver_path': driver_path,
+            'checked_at': time.time(),
+        }
+
+        self._write_manifest(manifest)
+
+    def _write_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            atomic_write_text(self.manifest_path, json.dumps(manifest, indent=2))
+
+        except OSError:
+            # Another worker holds the manifest open (Windows), the cache is refreshed by the next session
+            pass
@@ -0,0 +1,103 @@
+from typing import Dict, List, Optional, Tuple, Any
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class LaunchProfile:
+    """Browser launch settings traded against page fidelity: page-load strategy, blocked resources, window size and flags.
+
+    ``window_size`` None maximizes the window like the classic launch. Blocked URL patterns are applied
+    through the CDP ``Network.setBlockedURLs`` command on Chromium browsers, Firefox gets ``firefox_preferences``
+    instead, it has no URL blocking without an extension.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            page_load_strategy: Optional[str] = None,
+            window_size: Optional[Tuple[int, int]] = None,
+            blocked_urls: Optional[List[str]] = None,
+            chromium_arguments: Optional[List[str]] = None,
+            firefox_preferences: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.name: str = name
+        self.page_load_strategy: Optional[str] = page_load_strategy
+        self.window_size: Optional[Tuple[int, int]] = window_size
+        self.blocked_urls: List[str] = blocked_urls or []
+        self.chromium_arguments: List[str] = chromium_arguments or []
+        self.firefox_preferences: Dict[str, Any] = firefox_preferences or {}
+
+    def apply_chromium(self, options: ChromiumOptions) -> None:
+        if self.page_load_strategy:
+            options.page_load_strategy = self.page_load_strategy
+
+        if self.window_size:
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+
+        for argument in self.chromium_arguments:
+            options.add_argument(argument)
+
+    def apply_firefox(self, options: FirefoxOptions) -> None:
+        if self.page_load_strategy:
+            options.page_load_strategy = self.page_load_strategy
+
+        if self.window_size:
+            options.add_argument(f"--width={self.window_size[0]}")
+            options.add_argument(f"--height={self.window_size[1]}")
+
+        for key, value in self.firefox_preferences.items():
+            options.set_preference(key, value)
+
+    def apply_session(self, driver: WebDriver) -> None:
+        """Settings that need a running session: the window and the CDP URL blocking"""
+        if self.window_size is None:
+            driver.maximize_window()
+
+        if self.blocked_urls and hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+
+
+LAUNCH_PROFILES: Dict[str, LaunchProfile] = {
+    'default': LaunchProfile(name='default'),
+    'lean': LaunchProfile(
+        name='lean',
+        page_load_strategy='eager',
+        window_size=(1366, 900),
+        blocked_urls=[
+            '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+            '*.woff', '*.woff2', '*.ttf', '*.otf',
+            '*google-analytics.com*', '*googletagmanager.com*', '*backtrace.io*', '*optimizely.com*',
+        ],
+        chromium_arguments=[
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-component-update',
+            '--disable-sync',
+            '--disable-default-apps',
+            '--mute-audio',
+            '--blink-settings=imagesEnabled=false',
+        ],
+        firefox_preferences={
+            'permissions.default.image': 2,
+            'browser.display.use_document_fonts': 0,
+            'network.prefetch-next': False,
+            'network.dns.disablePrefetch': True,
+            'media.autoplay.default': 5,
+            'datareporting.healthreport.uploadEnabled': False,
+            'toolkit.telemetry.enabled': False,
+            'app.update.enabled': False,
+        }
+    ),
+}
+
+
+def get_launch_profile(name: str) -> LaunchProfile:
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(f"Unsupported browser profile: {name}, available profiles are {', '.join(LAUNCH_PROFILES)}")
+
+    return LAUNCH_PROFILES[name]
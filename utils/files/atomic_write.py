@@ -0,0 +1,23 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write the text to a temp file next to ``path`` and swap it in.
+
+    Readers (other xdist workers, the next run) see the old or the new content, never a half written
+    file, and a cancelled run leaves the previous file in place. The parent directory is created.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
+            temp_file.write(text)
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        os.unlink(temp_path)
+        raise
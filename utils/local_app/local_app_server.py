@@ -0,0 +1,81 @@
+import argparse
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from typing import Optional
+
+
+SITE_DIR = Path(__file__).parent / 'site'
+
+
+class _QuietRequestHandler(SimpleHTTPRequestHandler):
+    """Static handler without the per-request stderr access log"""
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def end_headers(self) -> None:
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+
+class LocalAppServer:
+    """Serves the bundled SauceDemo stand-in app from a background thread on a free local port.
+
+    The stand-in keeps the same pages, URLs, element ids and classes the page objects use, and the same
+    session state as saucedemo.com (``session-username`` cookie and ``cart-contents`` localStorage key).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, site_dir: Path = SITE_DIR) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.site_dir: Path = site_dir
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("The local app server is not started")
+
+        return f'http://{self.host}:{self._server.server_address[1]}/'
+
+    def start(self) -> 'LocalAppServer':
+        handler = partial(_QuietRequestHandler, directory=str(self.site_dir))
+
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='local-app-server', daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'LocalAppServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Serve the SauceDemo stand-in app")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8000)
+    args = arg_parser.parse_args()
+
+    server = LocalAppServer(host=args.host, port=args.port).start()
+    print(f"Serving the SauceDemo stand-in app on {server.url}, press Ctrl+C to stop")
+
+    try:
+        threading.Event().wait()
+
+    except KeyboardInterrupt:
+        server.stop()
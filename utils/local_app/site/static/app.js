@@ -0,0 +1,459 @@
+/*
+ * SauceDemo stand-in app.
+ *
+ * Keeps the page structure, ids and classes of https://www.saucedemo.com/ that the page objects rely on,
+ * and the same session state: the "session-username" cookie and the "cart-contents" localStorage key.
+ */
+(function () {
+    'use strict';
+
+    var PASSWORD = 'secret_sauce';
+    var USERS = ['standard_user', 'locked_out_user', 'problem_user', 'performance_glitch_user', 'error_user', 'visual_user'];
+    var LOCKED_USERS = ['locked_out_user'];
+    var TAX_RATE = 0.08;
+
+    var PRODUCTS = [
+        {id: 4, slug: 'sauce-labs-backpack', name: 'Sauce Labs Backpack', price: 29.99,
+            desc: 'carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection.'},
+        {id: 0, slug: 'sauce-labs-bike-light', name: 'Sauce Labs Bike Light', price: 9.99,
+            desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, slug: 'sauce-labs-bolt-t-shirt', name: 'Sauce Labs Bolt T-Shirt', price: 15.99,
+            desc: 'Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt.'},
+        {id: 5, slug: 'sauce-labs-fleece-jacket', name: 'Sauce Labs Fleece Jacket', price: 49.99,
+            desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, slug: 'sauce-labs-onesie', name: 'Sauce Labs Onesie', price: 7.99,
+            desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, slug: 'test.allthethings()-t-shirt-(red)', name: 'Test.allTheThings() T-Shirt (Red)', price: 15.99,
+            desc: 'This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton.'}
+    ];
+
+    var SORTERS = {
+        az: function (a, b) { return a.name.localeCompare(b.name); },
+        za: function (a, b) { return b.name.localeCompare(a.name); },
+        lohi: function (a, b) { return a.price - b.price; },
+        hilo: function (a, b) { return b.price - a.price; }
+    };
+
+    /* ---------- session state ---------- */
+
+    function getSessionUser() {
+        var match = document.cookie.match(/(?:^|;\s*)session-username=([^;]*)/);
+
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSessionUser(username) {
+        document.cookie = 'session-username=' + encodeURIComponent(username) + '; path=/; max-age=600';
+    }
+
+    function clearSessionUser() {
+        document.cookie = 'session-username=; path=/; max-age=0';
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem('cart-contents')) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem('cart-contents', JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem('cart-contents');
+        }
+    }
+
+    function productById(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) {
+                return PRODUCTS[i];
+            }
+        }
+
+        return null;
+    }
+
+    function cartProducts() {
+        return getCart().map(productById).filter(Boolean);
+    }
+
+    /* ---------- dom helpers ---------- */
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key === 'text') {
+                node.textContent = attrs[key];
+            } else {
+                node.setAttribute(key, attrs[key]);
+            }
+        });
+
+        (children || []).forEach(function (child) {
+            node.appendChild(child);
+        });
+
+        return node;
+    }
+
+    function money(value) {
+        return '$' + value.toFixed(2);
+    }
+
+    function navigate(path) {
+        window.location.href = path;
+    }
+
+    function showError(container, message) {
+        container.className = 'error-message-container error';
+        container.innerHTML = '';
+        container.appendChild(el('h3', {'data-test': 'error', text: message}));
+    }
+
+    /* ---------- shared header and side menu ---------- */
+
+    function renderHeader(root, title) {
+        var badgeHolder = el('a', {'class': 'shopping_cart_link', href: 'cart.html', 'data-test': 'shopping-cart-link'});
+
+        var menu = el('div', {'class': 'bm-menu-wrap', hidden: 'hidden'}, [
+            el('nav', {'class': 'bm-item-list'}, [
+                el('a', {id: 'inventory_sidebar_link', 'class': 'bm-item menu-item', href: 'inventory.html', text: 'All Items'}),
+                el('a', {id: 'about_sidebar_link', 'class': 'bm-item menu-item', href: 'https://saucelabs.com/', text: 'About'}),
+                el('a', {id: 'logout_sidebar_link', 'class': 'bm-item menu-item', href: '#', text: 'Logout'}),
+                el('a', {id: 'reset_sidebar_link', 'class': 'bm-item menu-item', href: '#', text: 'Reset App State'})
+            ]),
+            el('div', {'class': 'bm-cross-button'}, [
+                el('button', {id: 'react-burger-cross-btn', type: 'button', text: 'Close Menu'})
+            ])
+        ]);
+
+        var header = el('div', {id: 'header_container', 'class': 'header_container'}, [
+            el('div', {'class': 'primary_header'}, [
+                el('div', {id: 'menu_button_container', 'class': 'bm-burger-button'}, [
+                    el('button', {id: 'react-burger-menu-btn', type: 'button', text: 'Open Menu'})
+                ]),
+                menu,
+                el('div', {'class': 'app_logo', text: 'Swag Labs'}),
+                el('div', {id: 'shopping_cart_container', 'class': 'shopping_cart_container'}, [badgeHolder])
+            ]),
+            el('div', {'class': 'header_secondary_container'}, [
+                el('span', {'class': 'title', 'data-test': 'title', text: title})
+            ])
+        ]);
+
+        root.appendChild(header);
+
+        header.querySelector('#react-burger-menu-btn').addEventListener('click', function () {
+            menu.removeAttribute('hidden');
+        });
+        header.querySelector('#react-burger-cross-btn').addEventListener('click', function () {
+            menu.setAttribute('hidden', 'hidden');
+        });
+        header.querySelector('#logout_sidebar_link').addEventListener('click', function (event) {
+            event.preventDefault();
+            clearSessionUser();
+            navigate('./');
+        });
+        header.querySelector('#reset_sidebar_link').addEventListener('click', function (event) {
+            event.preventDefault();
+            setCart([]);
+            refreshCartState();
+        });
+
+        renderBadge();
+
+        return header;
+    }
+
+    function renderBadge() {
+        var link = document.querySelector('.shopping_cart_link');
+        var badge = document.querySelector('.shopping_cart_badge');
+        var count = getCart().length;
+
+        if (!link) {
+            return;
+        }
+
+        if (count === 0 && badge) {
+            badge.parentNode.removeChild(badge);
+        } else if (count > 0) {
+            if (!badge) {
+                badge = el('span', {'class': 'shopping_cart_badge', 'data-test': 'shopping-cart-badge'});
+                link.appendChild(badge);
+            }
+            badge.textContent = String(count);
+        }
+    }
+
+    function refreshCartState() {
+        renderBadge();
+
+        document.querySelectorAll('.btn_inventory').forEach(function (button) {
+            renderInventoryButton(button, productById(Number(button.getAttribute('data-product-id'))));
+        });
+    }
+
+    /* ---------- pages ---------- */
+
+    function renderLogin(root) {
+        var errorContainer = el('div', {'class': 'error-message-container'});
+        var form = el('form', {}, [
+            el('div', {'class': 'form_group'}, [
+                el('input', {id: 'user-name', 'class': 'input_error form_input', placeholder: 'Username', type: 'text', name: 'user-name', autocomplete: 'off'})
+            ]),
+            el('div', {'class': 'form_group'}, [
+                el('input', {id: 'password', 'class': 'input_error form_input', placeholder: 'Password', type: 'password', name: 'password', autocomplete: 'off'})
+            ]),
+            errorContainer,
+            el('input', {id: 'login-button', 'class': 'submit-button btn_action', type: 'submit', name: 'login-button', value: 'Login'})
+        ]);
+
+        root.appendChild(el('div', {'class': 'login_logo', text: 'Swag Labs'}));
+        root.appendChild(el('div', {'class': 'login_wrapper'}, [
+            el('div', {id: 'login_button_container', 'class': 'form_column'}, [
+                el('div', {'class': 'login-box'}, [form])
+            ])
+        ]));
+
+        var redirectError = new URLSearchParams(window.location.search).get('error');
+
+        if (redirectError) {
+            showError(errorContainer, redirectError);
+        }
+
+        form.addEventListener('submit', function (event) {
+            event.preventDefault();
+
+            var username = form.querySelector('#user-name').value;
+            var password = form.querySelector('#password').value;
+
+            if (!username) {
+                showError(errorContainer, 'Epic sadface: Username is required');
+            } else if (!password) {
+                showError(errorContainer, 'Epic sadface: Password is required');
+            } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                showError(errorContainer, 'Epic sadface: Username and password do not match any user in this service');
+            } else if (LOCKED_USERS.indexOf(username) !== -1) {
+                showError(errorContainer, 'Epic sadface: Sorry, this user has been locked out.');
+            } else {
+                setSessionUser(username);
+                navigate('inventory.html');
+            }
+        });
+    }
+
+    function renderInventoryButton(button, product) {
+        var inCart = getCart().indexOf(product.id) !== -1;
+
+        button.id = (inCart ? 'remove-' : 'add-to-cart-') + product.slug;
+        button.className = inCart ? 'btn btn_secondary btn_small btn_inventory' : 'btn btn_primary btn_small btn_inventory';
+        button.textContent = inCart ? 'Remove' : 'Add to cart';
+    }
+
+    function renderInventory(root) {
+        renderHeader(root, 'Products');
+
+        var select = el('select', {'class': 'product_sort_container', 'data-test': 'product-sort-container'}, [
+            el('option', {value: 'az', text: 'Name (A to Z)'}),
+            el('option', {value: 'za', text: 'Name (Z to A)'}),
+            el('option', {value: 'lohi', text: 'Price (low to high)'}),
+            el('option', {value: 'hilo', text: 'Price (high to low)'})
+        ]);
+        var list = el('div', {'class': 'inventory_list'});
+
+        root.querySelector('.header_secondary_container').appendChild(el('div', {'class': 'right_component'}, [select]));
+        root.appendChild(el('div', {id: 'inventory_container', 'class': 'inventory_container'}, [list]));
+
+        function renderList() {
+            list.innerHTML = '';
+
+            PRODUCTS.slice().sort(SORTERS[select.value]).forEach(function (product) {
+                var button = el('button', {'data-product-id': String(product.id), type: 'button'});
+                renderInventoryButton(button, product);
+
+                button.addEventListener('click', function () {
+                    var cart = getCart();
+                    var index = cart.indexOf(product.id);
+
+                    if (index === -1) {
+                        cart.push(product.id);
+                    } else {
+                        cart.splice(index, 1);
+                    }
+
+                    setCart(cart);
+                    refreshCartState();
+                });
+
+                list.appendChild(el('div', {'class': 'inventory_item', 'data-test': 'inventory-item'}, [
+                    el('div', {'class': 'inventory_item_img'}, [
+                        el('img', {'class': 'inventory_item_img', alt: product.name, src: 'static/media/product.svg'})
+                    ]),
+                    el('div', {'class': 'inventory_item_description'}, [
+                        el('div', {'class': 'inventory_item_label'}, [
+                            el('div', {'class': 'inventory_item_name', text: product.name}),
+                            el('div', {'class': 'inventory_item_desc', text: product.desc})
+                        ]),
+                        el('div', {'class': 'pricebar'}, [
+                            el('div', {'class': 'inventory_item_price', text: money(product.price)}),
+                            button
+                        ])
+                    ])
+                ]));
+            });
+        }
+
+        select.addEventListener('change', renderList);
+        renderList();
+    }
+
+    function cartItemNode(product, extra) {
+        return el('div', {'class': 'cart_item', 'data-test': 'inventory-item'}, [
+            el('div', {'class': 'cart_quantity', text: '1'}),
+            el('div', {'class': 'cart_item_label'}, [
+                el('div', {'class': 'inventory_item_name', text: product.name}),
+                el('div', {'class': 'inventory_item_desc', text: product.desc}),
+                el('div', {'class': 'item_pricebar'}, [
+                    el('div', {'class': 'inventory_item_price', text: money(product.price)})
+                ].concat(extra || []))
+            ])
+        ]);
+    }
+
+    function renderCart(root) {
+        renderHeader(root, 'Your Cart');
+
+        var list = el('div', {'class': 'cart_list'});
+
+        cartProducts().forEach(function (product) {
+            var remove = el('button', {id: 'remove-' + product.slug, 'class': 'btn btn_secondary btn_small cart_button', type: 'button', text: 'Remove'});
+            var item = cartItemNode(product, [remove]);
+
+            remove.addEventListener('click', function () {
+                setCart(getCart().filter(function (id) { return id !== product.id; }));
+                item.parentNode.removeChild(item);
+                renderBadge();
+            });
+
+            list.appendChild(item);
+        });
+
+        var continueShopping = el('button', {id: 'continue-shopping', 'class': 'btn btn_secondary back btn_medium', type: 'button', text: 'Continue Shopping'});
+        var checkout = el('button', {id: 'checkout', 'class': 'btn btn_action btn_medium checkout_button', type: 'button', text: 'Checkout'});
+
+        continueShopping.addEventListener('click', function () { navigate('inventory.html'); });
+        checkout.addEventListener('click', function () { navigate('checkout-step-one.html'); });
+
+        root.appendChild(el('div', {id: 'cart_contents_container', 'class': 'cart_contents_container'}, [
+            list,
+            el('div', {'class': 'cart_footer'}, [continueShopping, checkout])
+        ]));
+    }
+
+    function renderCheckoutStepOne(root) {
+        renderHeader(root, 'Checkout: Your Information');
+
+        var errorContainer = el('div', {'class': 'error-message-container'});
+        var cancel = el('button', {id: 'cancel', 'class': 'btn btn_secondary back btn_medium cart_cancel_link', type: 'button', text: 'Cancel'});
+        var form = el('form', {}, [
+            el('div', {'class': 'checkout_info'}, [
+                el('div', {'class': 'form_group'}, [el('input', {id: 'first-name', 'class': 'input_error form_input', placeholder: 'First Name', type: 'text'})]),
+                el('div', {'class': 'form_group'}, [el('input', {id: 'last-name', 'class': 'input_error form_input', placeholder: 'Last Name', type: 'text'})]),
+                el('div', {'class': 'form_group'}, [el('input', {id: 'postal-code', 'class': 'input_error form_input', placeholder: 'Zip/Postal Code', type: 'text'})]),
+                errorContainer
+            ]),
+            el('div', {'class': 'checkout_buttons'}, [
+                cancel,
+                el('input', {id: 'continue', 'class': 'submit-button btn btn_primary cart_button btn_action', type: 'submit', value: 'Continue'})
+            ])
+        ]);
+
+        root.appendChild(el('div', {id: 'checkout_info_container', 'class': 'checkout_info_container'}, [
+            el('div', {'class': 'checkout_info_wrapper'}, [form])
+        ]));
+
+        cancel.addEventListener('click', function () { navigate('cart.html'); });
+
+        form.addEventListener('submit', function (event) {
+            event.preventDefault();
+
+            if (!form.querySelector('#first-name').value) {
+                showError(errorContainer, 'Error: First Name is required');
+            } else if (!form.querySelector('#last-name').value) {
+                showError(errorContainer, 'Error: Last Name is required');
+            } else if (!form.querySelector('#postal-code').value) {
+                showError(errorContainer, 'Error: Postal Code is required');
+            } else {
+                navigate('checkout-step-two.html');
+            }
+        });
+    }
+
+    function renderCheckoutStepTwo(root) {
+        renderHeader(root, 'Checkout: Overview');
+
+        var list = el('div', {'class': 'cart_list'});
+        var subtotal = 0;
+
+        cartProducts().forEach(function (product) {
+            subtotal += product.price;
+            list.appendChild(cartItemNode(product));
+        });
+
+        var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+        var cancel = el('button', {id: 'cancel', 'class': 'btn btn_secondary back btn_medium cart_cancel_link', type: 'button', text: 'Cancel'});
+        var finish = el('button', {id: 'finish', 'class': 'btn btn_action btn_medium cart_button', type: 'button', text: 'Finish'});
+
+        cancel.addEventListener('click', function () { navigate('inventory.html'); });
+        finish.addEventListener('click', function () {
+            setCart([]);
+            navigate('checkout-complete.html');
+        });
+
+        root.appendChild(el('div', {id: 'checkout_summary_container', 'class': 'checkout_summary_container'}, [
+            list,
+            el('div', {'class': 'summary_info'}, [
+                el('div', {'class': 'summary_subtotal_label', text: 'Item total: ' + money(subtotal)}),
+                el('div', {'class': 'summary_tax_label', text: 'Tax: ' + money(tax)}),
+                el('div', {'class': 'summary_total_label', text: 'Total: ' + money(subtotal + tax)}),
+                el('div', {'class': 'cart_footer'}, [cancel, finish])
+            ])
+        ]));
+    }
+
+    function renderCheckoutComplete(root) {
+        renderHeader(root, 'Checkout: Complete!');
+
+        var home = el('button', {id: 'back-to-products', 'class': 'btn btn_primary btn_small', type: 'button', text: 'Back Home'});
+        home.addEventListener('click', function () { navigate('inventory.html'); });
+
+        root.appendChild(el('div', {id: 'checkout_complete_container', 'class': 'checkout_complete_container'}, [
+            el('h2', {'class': 'complete-header', text: 'Thank you for your order!'}),
+            el('div', {'class': 'complete-text', text: 'Your order has been dispatched, and will arrive just as fast as the pony can get there!'}),
+            home
+        ]));
+    }
+
+    var PAGES = {
+        'login': renderLogin,
+        'inventory': renderInventory,
+        'cart': renderCart,
+        'checkout-step-one': renderCheckoutStepOne,
+        'checkout-step-two': renderCheckoutStepTwo,
+        'checkout-complete': renderCheckoutComplete
+    };
+
+    var page = document.body.getAttribute('data-page');
+    var root = document.getElementById('root');
+
+    if (page !== 'login' && !getSessionUser()) {
+        var path = window.location.pathname;
+        navigate('./?error=' + encodeURIComponent("Epic sadface: You can only access '" + path + "' when you are logged in."));
+    } else {
+        PAGES[page](root);
+    }
+}());
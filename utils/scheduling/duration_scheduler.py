@@ -0,0 +1,123 @@
+import json
+import re
+import statistics
+from pathlib import Path
+from typing import Dict, List, Tuple, TypeVar
+
+from utils.files.atomic_write import atomic_write_text
+
+T = TypeVar('T')
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """Parse a ``i/n`` shard option into a 1-based shard index and the shard count"""
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', shard)
+
+    if not match:
+        raise ValueError(f"Invalid shard format: {shard}, should be i/n such as 1/3")
+
+    index, count = int(match.group(1)), int(match.group(2))
+
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {shard}, the shard index should be between 1 and {count}")
+
+    return index, count
+
+
+class DurationStore:
+    """Per-test durations (setup + call + teardown) remembered across runs to predict the cost of every test.
+
+    A new run is blended with the stored value, so one slow outlier run does not reshuffle every schedule.
+    Tests without a history are predicted with the median of the known tests.
+    """
+
+    def __init__(self, path: Path, smoothing: float = 0.5, default_duration: float = 1.0) -> None:
+        self.path: Path = path
+        self.smoothing: float = smoothing
+        self.default_duration: float = default_duration
+
+        self.durations: Dict[str, float] = json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+        self._run_durations: Dict[str, float] = {}
+        self._fallback: float = statistics.median(self.durations.values()) if self.durations else default_duration
+
+    def predict(self, nodeid: str) -> float:
+        return self.durations.get(nodeid, self._fallback)
+
+    def add(self, nodeid: str, duration: float) -> None:
+        """Accumulate one phase duration of a test in the current run"""
+        self._run_durations[nodeid] = self._run_durations.get(nodeid, 0.0) + duration
+
+    def save(self) -> None:
+        if not self._run_durations:
+            return
+
+        for nodeid, duration in self._run_durations.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = duration if previous is None else previous * (1 - self.smoothing) + duration * self.smoothing
+
+        atomic_write_text(self.path, json.dumps(dict(sorted(self.durations.items())), indent=2))
+
+
+class DurationScheduler:
+    """Orders tests longest-first and splits them into shards of roughly equal predicted duration.
+
+    Tests stay grouped by class and browser, so class setup and the per-browser session fixtures run once
+    per group, and the groups are ordered by total predicted duration. Longest-first lets the xdist load
+    scheduler hand the expensive tests out early, so the short ones fill the gaps at the end instead of
+    one worker finishing far behind.
+
+    Sharding packs every test into the currently lightest shard (longest processing time first), ties
+    broken by nodeid so every CI machine computes the same split.
+    """
+
+    def __init__(self, store: DurationStore) -> None:
+        self.store: DurationStore = store
+
+    def order(self, items: List[T]) -> List[T]:
+        groups: Dict[Tuple[str, str], List[T]] = {}
+
+        for item in items:
+            groups.setdefault(self._group_of(item), []).append(item)
+
+        ordered_groups: List[Tuple[Tuple[str, str], List[T]]] = sorted(
+            groups.items(),
+            key=lambda group: (-sum(self.store.predict(item.nodeid) for item in group[1]), group[0])
+        )
+
+        return [item for _, group in ordered_groups for item in self._longest_first(group)]
+
+    def shard(self, items: List[T], index: int, count: int) -> List[T]:
+        """Return the items of the 1-based shard ``index`` out of ``count``"""
+        loads: List[float] = [0.0] * count
+        shards: List[List[T]] = [[] for _ in range(count)]
+
+        for item in self._longest_first(items):
+            lightest: int = min(range(count), key=lambda shard_index: (loads[shard_index], shard_index))
+            loads[lightest] += self.store.predict(item.nodeid)
+            shards[lightest].append(item)
+
+        return self.order(shards[index - 1])
+
+    def _longest_first(self, items: List[T]) -> List[T]:
+        return sorted(items, key=lambda item: (-self.store.predict(item.nodeid), item.nodeid))
+
+    @staticmethod
+    def _group_of(item) -> Tuple[str, str]:
+        callspec = getattr(item, 'callspec', None)
+        browser_name: str = callspec.params.get('browser_name', '') if callspec else ''
+
+        return item.nodeid.rsplit('::', 1)[0], browser_name
+
+
+class DurationRecorder:
+    """pytest plugin feeding the phase durations of every executed test to a DurationStore, saved at session end"""
+
+    def __init__(self, store: DurationStore) -> None:
+        self.store: DurationStore = store
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if not report.skipped:
+            self.store.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session) -> None:
+        self.store.save()
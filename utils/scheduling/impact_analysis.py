@@ -0,0 +1,378 @@
+import ast
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from utils.files.atomic_write import atomic_write_text
+
+# Changes to these files can affect any test, they select the whole suite
+GLOBAL_FILE_NAMES: Tuple[str, ...] = ('conftest.py', 'requirements.txt', 'pytest.ini', 'pyproject.toml', 'setup.cfg', 'tox.ini')
+IGNORED_SUFFIXES: Tuple[str, ...] = ('.md', '.rst')
+
+_HUNK_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+_MODULE_LEVEL = '<module>'
+
+
+def top_level_qualname(qualname: str) -> str:
+    """Map a nested function or comprehension to the module function or method that defines it"""
+    return qualname.split('.<locals>', 1)[0]
+
+
+def definition_ranges(source: str, include_classes: bool = False) -> Dict[str, Tuple[int, int]]:
+    """Line ranges (decorators included) of the module functions and class methods, keyed by qualname"""
+    ranges: Dict[str, Tuple[int, int]] = {}
+
+    def visit(body: List[ast.stmt], prefix: str) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                start: int = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+
+                if include_classes or not isinstance(node, ast.ClassDef):
+                    ranges[f'{prefix}{node.name}'] = (start, node.end_lineno)
+
+                if isinstance(node, ast.ClassDef):
+                    visit(node.body, prefix=f'{prefix}{node.name}.')
+
+    visit(ast.parse(source).body, prefix='')
+
+    return ranges
+
+
+class DependencyMap:
+    """The source functions every test executed in its last recorded run, keyed by nodeid then by file"""
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.tests: Dict[str, Dict[str, List[str]]] = json.loads(path.read_text(encoding='utf-8'))['tests'] if path.exists() else {}
+
+    def get(self, nodeid: str) -> Optional[Dict[str, List[str]]]:
+        return self.tests.get(nodeid)
+
+    def update(self, recorded: Dict[str, Dict[str, List[str]]]) -> None:
+        """Replace the entries of the tests that ran, keep the rest of the map (incremental update)"""
+        if not recorded:
+            return
+
+        self.tests.update(recorded)
+
+        atomic_write_text(self.path, json.dumps({'version': 1, 'tests': dict(sorted(self.tests.items()))}, indent=1))
+
+
+class DependencyRecorder:
+    """pytest plugin recording the repository functions each test executes, from setup to teardown.
+
+    A profile hook sees every Python call of the test thread, only functions of files inside ``root_dir``
+    are kept. The result is attached to the teardown report, so under xdist it reaches the controller,
+    which merges it into the DependencyMap at session end.
+    """
+
+    USER_PROPERTY: str = 'dependencies'
+
+    def __init__(self, root_dir: Path, dependency_map: Optional[DependencyMap] = None) -> None:
+        self.root_dir: Path = root_dir.resolve()
+        self.dependency_map: Optional[DependencyMap] = dependency_map
+
+        self._code_entries: Dict[object, Optional[Tuple[str, str]]] = {}
+        self._current: Set[Tuple[str, str]] = set()
+        self._recorded: Dict[str, Dict[str, List[str]]] = {}
+
+    def _profile(self, frame, event, arg) -> None:
+        if event != 'call':
+            return
+
+        code = frame.f_code
+        entry = self._code_entries.get(code, False)
+
+        if entry is False:
+            entry = self._code_entries[code] = self._entry_for(code)
+
+        if entry is not None:
+            self._current.add(entry)
+
+    def _entry_for(self, code) -> Optional[Tuple[str, str]]:
+        try:
+            path: Path = Path(code.co_filename).resolve()
+            relative_path: str = path.relative_to(self.root_dir).as_posix()
+
+        except (ValueError, OSError):
+            return None
+
+        # Skip frozen and generated code, installed packages and the test selection plugins themselves
+        if not path.is_file() or 'site-packages' in relative_path or path.parent == Path(__file__).resolve().parent:
+            return None
+
+        return relative_path, top_level_qualname(getattr(code, 'co_qualname', code.co_name))
+
+    def pytest_runtest_setup(self, item) -> None:
+        self._current = set()
+        sys.setprofile(self._profile)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_makereport(self, item, call) -> None:
+        if call.when != 'teardown':
+            return
+
+        sys.setprofile(None)
+
+        dependencies: Dict[str, List[str]] = {}
+
+        for relative_path, qualname in sorted(self._current):
+            dependencies.setdefault(relative_path, []).append(qualname)
+
+        item.user_properties.append((self.USER_PROPERTY, dependencies))
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when == 'teardown':
+            dependencies = dict(report.user_properties).get(self.USER_PROPERTY)
+
+            if dependencies is not None:
+                self._recorded[report.nodeid] = dependencies
+
+    def pytest_sessionfinish(self, session) -> None:
+        sys.setprofile(None)
+
+        if self.dependency_map is not None:
+            self.dependency_map.update(self._recorded)
+
+
+class ChangeSet:
+    """The files and functions changed since a git ref, working tree changes included"""
+
+    def __init__(self, root_dir: Path, whole_files: Set[str], functions: Dict[str, Set[str]], global_change: bool) -> None:
+        self.root_dir: Path = root_dir
+        self.whole_files: Set[str] = whole_files
+        self.functions: Dict[str, Set[str]] = functions
+        self.global_change: bool = global_change
+
+        self._defined_names: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def since(cls, git_ref: str, root_dir: Path, ignored_names: Tuple[str, ...] = ()) -> 'ChangeSet':
+        root_dir = root_dir.resolve()
+        git_root: Path = Path(cls._git(root_dir, 'rev-parse', '--show-toplevel').strip()).resolve()
+        diff: str = cls._git(root_dir, 'diff', '-U0', '--no-color', '--no-ext-diff', '--no-renames', git_ref, '--')
+        # git diff skips the files never added, a new module of the working tree is a whole-file change
+        untracked: Set[str] = set(cls._git(root_dir, 'ls-files', '--others', '--exclude-standard', '--full-name').splitlines())
+
+        hunks: Dict[str, List[Tuple[int, int]]] = {}
+        deleted: Set[str] = set()
+        old_path: Optional[str] = None
+        new_path: Optional[str] = None
+
+        for line in diff.splitlines():
+            if line.startswith('--- '):
+                old_path = line[6:] if line.startswith('--- a/') else None
+
+            elif line.startswith('+++ '):
+                new_path = line[6:] if line.startswith('+++ b/') else None
+
+                if new_path is None and old_path is not None:
+                    deleted.add(old_path)
+                else:
+                    hunks.setdefault(new_path, [])
+
+            elif new_path and (match := _HUNK_PATTERN.match(line)):
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                hunks[new_path].append((start, count))
+
+        whole_files: Set[str] = set()
+        functions: Dict[str, Set[str]] = {}
+        global_change: bool = False
+
+        for git_path in sorted(deleted | untracked | set(hunks)):
+            absolute_path: Path = git_root / git_path
+
+            try:
+                relative_path: str = absolute_path.resolve().relative_to(root_dir).as_posix()
+
+            except ValueError:
+                continue
+
+            if absolute_path.suffix in IGNORED_SUFFIXES or absolute_path.name in ignored_names:
+                continue
+
+            if absolute_path.name in GLOBAL_FILE_NAMES or absolute_path.suffix != '.py':
+                global_change = True
+
+            elif git_path in deleted or git_path in untracked:
+                whole_files.add(relative_path)
+
+            else:
+                changed: Optional[Set[str]] = cls._changed_functions(absolute_path, hunks[git_path])
+
+                if changed is None:
+                    whole_files.add(relative_path)
+                else:
+                    functions[relative_path] = changed
+
+        return cls(root_dir=root_dir, whole_files=whole_files, functions=functions, global_change=global_change)
+
+    def is_file_changed(self, relative_path: str) -> bool:
+        return relative_path in self.whole_files or relative_path in self.functions
+
+    def affects(self, dependencies: Dict[str, List[str]]) -> bool:
+        for relative_path, qualnames in dependencies.items():
+            if relative_path in self.whole_files:
+                return True
+
+            changed: Optional[Set[str]] = self.functions.get(relative_path)
+
+            if changed is None:
+                continue
+
+            recorded: Set[str] = set(qualnames) - {_MODULE_LEVEL}
+
+            # A recorded function that does not exist anymore was renamed or removed
+            if changed & recorded or not recorded <= self._defined_names_of(relative_path):
+                return True
+
+        return False
+
+    def _defined_names_of(self, relative_path: str) -> Set[str]:
+        if relative_path not in self._defined_names:
+            source: str = (self.root_dir / relative_path).read_text(encoding='utf-8')
+            self._defined_names[relative_path] = set(definition_ranges(source, include_classes=True))
+
+        return self._defined_names[relative_path]
+
+    @staticmethod
+    def _changed_functions(path: Path, hunks: List[Tuple[int, int]]) -> Optional[Set[str]]:
+        """The functions touched by the hunks, None when a hunk touches module or class level code"""
+        source: str = path.read_text(encoding='utf-8')
+        lines: List[str] = source.splitlines()
+
+        try:
+            ranges: Dict[str, Tuple[int, int]] = definition_ranges(source)
+
+        except SyntaxError:
+            return None
+
+        def function_at(line_number: int) -> Optional[str]:
+            return next((qualname for qualname, (start, end) in ranges.items() if start <= line_number <= end), None)
+
+        changed: Set[str] = set()
+
+        for start, count in hunks:
+            if count == 0:
+                # A pure deletion after line `start`, inside a function only if both neighbours are
+                before, after = function_at(start), function_at(start + 1)
+
+                if before is None or before != after:
+                    return None
+
+                changed.add(before)
+                continue
+
+            for line_number in range(start, start + count):
+                stripped: str = lines[line_number - 1].strip() if line_number <= len(lines) else ''
+
+                if not stripped or stripped.startswith('#'):
+                    continue
+
+                qualname: Optional[str] = function_at(line_number)
+
+                if qualname is None:
+                    return None
+
+                changed.add(qualname)
+
+        return changed
+
+    @staticmethod
+    def _git(root_dir: Path, *args: str) -> str:
+        result = subprocess.run(['git', *args], cwd=root_dir, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            raise ValueError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+
+        return result.stdout
+
+
+class ImportGraph:
+    """Static import closure of a module inside ``root_dir``, the fallback for tests without a recorded run"""
+
+    def __init__(self, root_dir: Path) -> None:
+        self.root_dir: Path = root_dir.resolve()
+        self._imports: Dict[str, Set[str]] = {}
+
+    def closure(self, relative_path: str) -> Set[str]:
+        seen: Set[str] = set()
+        pending: List[str] = [relative_path]
+
+        while pending:
+            current: str = pending.pop()
+
+            if current in seen:
+                continue
+
+            seen.add(current)
+            pending.extend(self._direct_imports(current) - seen)
+
+        return seen
+
+    def _direct_imports(self, relative_path: str) -> Set[str]:
+        if relative_path not in self._imports:
+            imports: Set[str] = set()
+
+            try:
+                tree: ast.Module = ast.parse((self.root_dir / relative_path).read_text(encoding='utf-8'))
+
+            except (OSError, SyntaxError):
+                tree = ast.Module(body=[], type_ignores=[])
+
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    module_names: List[str] = [alias.name for alias in node.names]
+
+                elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                    # `from package import module` imports a module or a name of the package
+                    module_names = [node.module] + [f'{node.module}.{alias.name}' for alias in node.names]
+
+                else:
+                    continue
+
+                for module_name in module_names:
+                    module_path: Optional[str] = self._resolve(module_name)
+
+                    if module_path:
+                        imports.add(module_path)
+
+            self._imports[relative_path] = imports
+
+        return self._imports[relative_path]
+
+    def _resolve(self, module_name: str) -> Optional[str]:
+        base: str = module_name.replace('.', '/')
+
+        for candidate in (f'{base}.py', f'{base}/__init__.py'):
+            if (self.root_dir / candidate).is_file():
+                return candidate
+
+        return None
+
+
+class ImpactSelector:
+    """Selects the tests affected by a ChangeSet, from the recorded dependencies or the import closure"""
+
+    def __init__(self, change_set: ChangeSet, dependency_map: DependencyMap, import_graph: ImportGraph) -> None:
+        self.change_set: ChangeSet = change_set
+        self.dependency_map: DependencyMap = dependency_map
+        self.import_graph: ImportGraph = import_graph
+
+    def is_affected(self, nodeid: str) -> bool:
+        test_file: str = nodeid.split('::', 1)[0]
+
+        if self.change_set.global_change or self.change_set.is_file_changed(test_file):
+            return True
+
+        dependencies: Optional[Dict[str, List[str]]] = self.dependency_map.get(nodeid)
+
+        if dependencies is not None:
+            return self.change_set.affects(dependencies)
+
+        return any(self.change_set.is_file_changed(module_path) for module_path in self.import_graph.closure(test_file))